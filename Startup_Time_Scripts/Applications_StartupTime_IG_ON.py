@@ -4,20 +4,16 @@ import os
 import sys
 import json
 import glob
+import sqlite3
+import math
 import time
 import yaml
 import serial
-import openpyxl
 import xml.etree.ElementTree as ET
 import subprocess
-import matplotlib
-import matplotlib.pyplot as plt
 import ipaddress
-matplotlib.use('Agg')
-import numpy as np
 from openpyxl.drawing.image import Image
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
-from openpyxl.utils import get_column_letter
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -26,11 +22,26 @@ from enum import Enum
 import threading
 from collections import OrderedDict
 import colorlog
-import pandas as pd
-from decimal import Decimal, ROUND_HALF_UP
-
+import numpy as np
+from contextlib import contextmanager, ExitStack
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from Startup_Time_Scripts.chart_renderer import ChartRenderer, chart_pages
+from Startup_Time_Scripts.chart_cache import ChartCache, DEFAULT_CHART_CACHE, DEFAULT_CACHE_SIZE_MB
+from Startup_Time_Scripts.native_charts import bar_chart
+from Startup_Time_Scripts.bench_scheduler import BenchCoordinator, DEFAULT_AGENT_TIMEOUT
+from Startup_Time_Scripts.early_stopping import EarlyStopping, build_threshold_groups
+from Startup_Time_Scripts.regression_detection import RegressionDetector
+from Startup_Time_Scripts.iteration_journal import IterationJournal, find_latest_run_folder
+from Startup_Time_Scripts.report_backends import SpooledReport, create_report, open_spooled_report, validate_report_formats, DEFAULT_REPORT_FORMATS
+from Startup_Time_Scripts.results_warehouse import RunResults, ResultsWarehouse, config_hash, DEFAULT_DATABASE
+from Startup_Time_Scripts.report_sidecar import find_report_sidecar, load_report_sidecar, write_report_sidecar, SIDECAR_SUFFIX
+from Startup_Time_Scripts.report_model import ReportTable, SheetModel, Link, LINK, COUNT, ITERATION_LINK
+from Startup_Time_Scripts.startup_statistics import round_half_up, summary_statistics
+from Startup_Time_Scripts.tool_timing import PhaseTimer
+from Startup_Time_Scripts.trace_events import TraceRecorder
 
-plot_lock = threading.Lock()
 
 def round_decimal_half_up(number, decimals=0):
     """
@@ -42,17 +53,34 @@ def round_decimal_half_up(number, decimals=0):
         
     Returns:
         float: Properly rounded number
+       
+    Note:
+        Scalar form of startup_statistics.round_half_up, which rounds whole arrays the same way.
     """
-    multiplier = 10 ** decimals
-    return float(Decimal(str(number * multiplier)).quantize(Decimal('1'), rounding=ROUND_HALF_UP)) / multiplier
+    return float(round_half_up(number, decimals))
 
 cur_dt_time_obj = None
 local_save_path = None
 workbook_map = None
+# False when no selected report format shows graphs, plotting is skipped then
+report_charts = True
+# True to write the graphs as native xlsx charts of the tables instead of rendered images
+native_charts = False
+# Rendered graphs of the iteration sheets: 'all', 'summary' (none) or 'deferred' (see deferred_charts)
+chart_policy = 'deferred'
+# Renders the report graphs in worker processes (see chart_renderer)
+chart_renderer = None
 threshold_map = None
 current_timestamp = None
 is_pre_gen_logs = None
-table_headers = None
+iteration_journal = None
+phase_timer = None
+trace_recorder = None
+early_stopping_result = None
+regression_result = None
+run_results = None
+# ECU type -> iteration -> application startup times of the cross-ECU report, None without it
+startup_timelines = None
 
 def setup_logging():
     """
@@ -91,6 +119,37 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+@contextmanager
+def timed_phase(name, iteration=None, ecu_type=None, category='tool'):
+    """
+    Records the enclosed block as one tool phase.
+   
+    The phase is recorded in the global phase_timer of the running measurement and,
+    when 'Trace Output' is enabled, as a span of the Chrome trace. Outside of a
+    measurement (e.g. when a bench agent calls the relay functions) nothing is recorded.
+   
+    Args:
+        name (str): Phase name shown in the "Tool Timing" sheet and the trace
+        iteration (int): Iteration index (0-based), inherited from the enclosing phase if None
+        ecu_type (str): ECU type, inherited from the enclosing phase if None
+        category (str): Trace category of the span, 'tool' or 'wait' for waits on background work
+       
+    Example:
+        >>> with timed_phase('Workbook Save', ecu_type='RCAR'):
+        ...     workbook.save(report_file)
+    """
+    if phase_timer is None:
+        yield
+        return
+    with phase_timer.phase(name, iteration, ecu_type) as (iteration, ecu_type):
+        if trace_recorder is None:
+            yield
+        else:
+            args = {'iteration': iteration + 1 if iteration is not None else None, 'ecu_type': ecu_type}
+            with trace_recorder.span(name, category, args):
+                yield
+
+
 # Define the column names for the application startup time data
 application_startup_time_columns = ['No.', 'Services/Applications', 'Application Startup\n Time (sec)',
                                     'IG ON\n to\n QNX Startup (sec)', 'Total Time\n from\n IG ON (sec)',
@@ -98,16 +157,40 @@ application_startup_time_columns = ['No.', 'Services/Applications', 'Application
 
 # Define the column names for the application startup time data with minimum, maximum, and average values
 application_startup_time_min_max_avg_columns = ['Services/Applications', 'Minimum (sec)', 'Maximum (sec)',
-                                                'Average (sec)', 'Average\n from\n IG ON (sec)', 'Startup Time\n Threshold\n (sec)']
+                                                'Average (sec)', 'Average\n from\n IG ON (sec)', 'Startup Time\n Threshold\n (sec)',
+                                                'Median (sec)', 'Standard\n Deviation (sec)', 'P90 (sec)', 'P95 (sec)', 'P99 (sec)']
 
 application_info_columns = ['Services/Applications', 'Init(Up) Time (us)', 'Init(Up) Time (ms)']
 
 application_start_end_time_min_max_avg_columns = ['Services/Applications', 'Minimum (ms)', 'Maximum (ms)',
-                                                  'Average (ms)']
+                                                  'Average (ms)', 'Median (ms)', 'Standard\n Deviation (ms)', 'P90 (ms)',
+                                                  'P95 (ms)', 'P99 (ms)']
+
+application_startup_time_distribution_columns = ['Services/Applications', 'Samples', 'Minimum (sec)', 'P5 (sec)', 'P25 (sec)',
+                                                 'Median (sec)', 'P75 (sec)', 'P95 (sec)', 'Maximum (sec)']
+
+application_start_end_time_distribution_columns = ['Services/Applications', 'Samples', 'Minimum (ms)', 'P5 (ms)', 'P25 (ms)',
+                                                   'Median (ms)', 'P75 (ms)', 'P95 (ms)', 'Maximum (ms)']
 
 applications_overall_status_columns = ['No. of Iterations', 'Total Time\n to Startup\n Last Application\n from IG ON (sec)',
                                         'Startup time\n judgement', 'Result of the\n enabled judgement\n item', 'Order\n Mismatch\n Count', 'Not\n Found\n Count', 'Not\n Configured\n Count']
 
+tool_timing_summary_columns = ['Phase', 'Count', 'Total (sec)', 'Average (sec)', 'Maximum (sec)']
+
+tool_timing_columns = ['Iteration', 'ECU', 'Phase', 'Thread', 'Start (sec)', 'Duration (sec)']
+
+early_stopping_columns = ['Threshold\n Group', 'Services/Applications', 'Startup Time\n Threshold\n (sec)', 'Samples',
+                          'Failed\n Results', 'Maximum\n from\n IG ON (sec)', 'Upper\n Prediction\n Bound (sec)',
+                          'Group\n judgement', 'Settled']
+
+regression_columns = ['Services/Applications', 'Measure', 'Baseline\n Samples', 'Samples', 'Baseline\n Median', 'Median',
+                      'Median\n Shift (%)', 'p-value', 'Change', 'Regression\n judgement']
+
+cross_ecu_columns = ['ECU', 'Services/Applications', 'Startup Time\n from QNX Startup\n (sec)', 'Startup Time\n from IG ON\n (sec)']
+
+cross_ecu_average_columns = ['ECU', 'Services/Applications', 'Average Startup Time\n from QNX Startup\n (sec)',
+                             'Average Startup Time\n from IG ON\n (sec)']
+
 appendix_columns = ['Column Name', 'Description']
 startup_field_descriptions = [
    ("Services/Applications", "Name of the Service/Application being initialized."),
@@ -118,10 +201,6 @@ startup_field_descriptions = [
    ("Total Time", "This is the Total time taken from IG ON to Application Startup completion. \n Total time = Apps Startup +  InitUp Time/1000000 + offset time (IG ON to QNX + KSAR Startup.")
 ]
 
-# Define a border style for cells in the Excel sheet
-border_style = Border(left=Side(border_style='thin'), right=Side(border_style='thin'),
-                        top=Side(border_style='thin'), bottom=Side(border_style='thin'))
-
 OFFSET_TIME: Final = 1.5
 
 class ECUType(Enum):
@@ -141,8 +220,8 @@ class OrderFailureType(Enum):
    APPLICATION_NOT_FOUND = 3
 
 class ResultThread(threading.Thread):
-   def __init__(self, target, args=(), kwargs=None):
-       super().__init__()
+   def __init__(self, target, args=(), kwargs=None, name=None):
+       super().__init__(name=name)
        self._target = target
        self._args   = args
        self._kwargs = kwargs or {}
@@ -206,168 +285,78 @@ def validate_ip_address(ecu_config_list, logger):
             return False
     return True
 
-def remove_png_files(logger):
+def resolve_ecu_ip_address(ecu_type, config):
     """
-    Removes all PNG image files from the script's directory.
-   
-    This cleanup function is typically called to remove temporary graph images
-    generated during previous test runs. It searches for all .png files in the
-    same directory as the script and attempts to delete them.
-   
-    The function handles deletion errors gracefully by logging them without
-    stopping the execution. This is useful for cleaning up temporary visualization
-    files created by matplotlib plotting functions.
-   
-    Note:
-        - Uses pathlib for cross-platform file operations
-        - Silently continues if files cannot be deleted (e.g., if they're in use)
-        - Logs errors for debugging purposes
-    """
-    script_dir = Path(__file__).parent
-    png_files = list(script_dir.glob('*.png'))
-    for file in png_files:
-        try:
-            # logger.info(f"Deleting {file.name}")
-            file.unlink()
-        except Exception as e:
-            pass
-            logger.info(f"Error deleting file {file}: {e}")
+    Returns the configured IP address of an ECU from the 'ECU_setting' section.
 
-def adjust_column_width(sheet, ecu_type, logger):
-    """
-    Automatically adjusts column widths in an Excel worksheet based on content length.
-   
-    This function analyzes the content of each column in the worksheet and sets
-    the column width to accommodate the longest content with some padding. It
-    intelligently handles various Excel formatting scenarios including merged cells,
-    wrapped text, and specific content types.
-   
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): The Excel worksheet to adjust
-        ecu_type (str): The ECU type identifier used to skip certain log file references
-       
-    Features:
-        - Calculates optimal width based on maximum content length in each column
-        - Skips merged cells to avoid width calculation conflicts
-        - Ignores cells with text wrapping enabled
-        - Filters out log file references containing ECU type
-        - Ensures minimum column width of 9 characters
-        - Adds 3 characters padding for better readability
-       
-    Note:
-        This function is essential for creating professional-looking Excel reports
-        where all content is visible without manual column width adjustments.
-    """
-    # Iterate through each column in the Excel sheet
-    for col in sheet.columns:
-        # Initialize a variable to track the maximum content length within the column
-        max_length = 0
-       
-        # Extract the letter representing the label of the current column
-        column_letter = get_column_letter(col[0].column)
+        ecu_type (str): ECU type identifier ('RCAR', 'SoC0' or 'SoC1')
+        config (dict): Test configuration containing the 'ECU_setting' section
 
-        # Iterate through each cell in the current column, starting from the start_row
-        for cell in col[0:]:
-            try:
-                # Check if the cell is empty
-                if not cell.value:
-                    continue
-               
-                # Skip cells with specific content
-                if f'Startup_Time_Logs_{ecu_type}' in str(cell.value)  or str(cell.value) in table_headers:
-                    continue
+    Returns:
+        str or None: IP address of the ECU, None for unknown ECU types
 
-                # Attempt to retrieve the content of the cell and check its length
-                cell_content = str(cell.value)
-               
-                # Check if the cell's alignment has wrap text enabled
-                if cell.alignment.wrap_text:
-                    lines = cell_content.split('\n')
-                    max_length = max(max(len(line) for line in lines), max_length)
-                else:
-                    # If wrap text is not enabled, use the length of the cell content directly
-                    max_length = max(len(cell_content), max_length)
+    Example:
+        >>> resolve_ecu_ip_address('SoC0', {'ECU_setting': {'Qualcomm_SoC0_IPAddress': '192.168.1.3'}})
+        '192.168.1.3'
+    """
+    if ecu_type == ECUType.RCAR.value:
+        return config['ECU_setting']['RCAR_IPAddress']
+    elif ecu_type == ECUType.SoC0.value:
+        return config['ECU_setting']['Qualcomm_SoC0_IPAddress']
+    elif ecu_type == ECUType.SoC1.value:
+        return config['ECU_setting']['Qualcomm_SoC1_IPAddress']
+    return None
+
+class PendingChart:
+    """
+    Chart being rendered by the chart renderer, embedded in a table until its image is needed.
+    """
 
-            except (TypeError, AttributeError, ValueError) as e:
-                # Handle specific exceptions
-                logger.error(f"An error occurred: {e}")
+    def __init__(self, future, chart, ecu_type):
+        self.future = future
+        self.chart = chart
+        self.ecu_type = ecu_type
 
-        # Calculate the adjusted width for the column based on the maximum content length with extra space
-        adjusted_width = max(max_length + 3, 9)  # Ensure a minimum width of 9
+    def result(self):
+        """
+        Waits for the chart and returns it as image (see SheetModel.resolve_images).
+        """
+        with timed_phase('Chart Wait', ecu_type=self.ecu_type, category='wait'):
+            png = self.future.result()
+        # Embedded from memory, no image file is written
+        return Image(BytesIO(png))
 
-        # Set the column width in the Excel sheet to the calculated adjusted width
-        sheet.column_dimensions[column_letter].width = adjusted_width
 
-def format_excel_cells(sheet, start_row):
+def embed_chart(table, column, ecu_type, chart, *args, iteration_chart=False):
     """
-    Applies comprehensive formatting to Excel worksheet cells for professional presentation.
+    Starts rendering a chart and embeds it next to a table.
    
-    This function formats cells in an Excel worksheet starting from a specified row,
-    applying different styles based on cell content type. It creates a visually
-    appealing and easily readable report with color-coded status indicators.
+    The chart renders in a worker process while the report continues, the sheet waits
+    for it when it is written. A chart with more rows than chart_renderer.MAX_CHART_ROWS
+    is split into pages embedded below each other (see chart_pages). Iteration sheet
+    charts follow the 'Chart Policy': they are left out with 'summary', and with
+    'deferred' only their data is kept in the sheet store so deferred_charts can add
+    them to the report on demand.
    
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): The Excel worksheet to format
-        start_row (int): The row number from which to start formatting (1-based indexing)
-       
-    Formatting Rules:
-        - Column headers: Light green background (B5E6A2), bold font, bordered
-        - "PASS" values: Bright green background (92D050) for success indication
-        - "FAIL" values: Red background (FF0000) for failure indication
-        - All cells: Center alignment (horizontal and vertical), bordered
-       
-    Features:
-        - Skips empty rows and cells to optimize processing
-        - Recognizes predefined column header types from global constants
-        - Applies consistent border styling throughout the sheet
-        - Uses color psychology (green=good, red=bad) for quick visual assessment
-       
-    Note:
-        This function is crucial for creating professional test reports that
-        stakeholders can quickly interpret without detailed technical knowledge.
-    """
-    # Iterate over each row in the sheet, starting from the specified row
-    for row in sheet.iter_rows(min_row=start_row, max_row=sheet.max_row):
-       
-        # Skip empty rows
-        if all(cell.value is None for cell in row):
-            continue
-       
-        # Iterate over each cell in the row
-        for cell in row[0:]:  
-            # Skip empty cells
-            if cell.value is None:
-                continue
-           
-            # Check if the cell value is a column header
-            if cell.value in (application_startup_time_columns + application_startup_time_min_max_avg_columns
-                              + application_info_columns + application_start_end_time_min_max_avg_columns +
-                              applications_overall_status_columns):
-               
-                # Apply a green fill color and bold font to column headers
-                cell.fill = PatternFill(start_color="B5E6A2", end_color="B5E6A2", fill_type="solid")
-                cell.font = Font(bold=True)
-                cell.border = border_style
-                continue
-           
-            elif cell.value == "PASS":
-                # If the cell value is "PASS", fill it with a light green color.
-                cell.fill = PatternFill(start_color = "92D050", end_color = "92D050", fill_type = "solid")
-
-            elif cell.value == "FAIL":
-                # If the cell value is "FAIL", fill it with a light red color.
-                cell.fill = PatternFill(start_color = "FF0000", end_color = "FF0000", fill_type = "solid")
-            elif cell.value == '⬤':
-                cell.font = Font(bold=True)
-               
-            # Center align the cell contents horizontally and vertically
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-           
-            # Apply the defined border style to the cell
-            cell.border = border_style
+        table (ReportTable): Table the graph is embedded next to
+        column (str): Column letter of the top left corner of the graph
+        ecu_type (str): ECU type the graph belongs to
+        chart (str): Chart name (see chart_renderer.CHARTS)
+        args: Plain data of the chart
+        iteration_chart (bool): True for a chart of an iteration sheet
+    """
+    if iteration_chart and chart_policy == 'summary':
+        return
+    for page_args, options, row_offset in chart_pages(chart, args):
+        if iteration_chart and chart_policy == 'deferred':
+            table.defer_image((chart, page_args, options), column, row_offset)
+        else:
+            table.add_image(PendingChart(chart_renderer.submit(chart, *page_args, **options), chart, ecu_type), column, row_offset)
 
 
-def plot_process_individual_apps_avg_graph(differences, sheet, start_row, ecu_type):
+def plot_process_individual_apps_avg_graph(differences, table, ecu_type):
     """
     Creates and embeds a timeline graph showing individual application startup times.
    
@@ -378,18 +367,16 @@ def plot_process_individual_apps_avg_graph(differences, sheet, start_row, ecu_ty
    
     Args:
         differences (dict): Dictionary mapping application names to their average startup times (ms)
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to embed the graph
-        start_row (int): Row number where the graph should be positioned
-        ecu_type (str): ECU type identifier for graph title and file naming
+        table (ReportTable): Table the graph is embedded next to
+        ecu_type (str): ECU type identifier for the graph title
        
     Features:
-        - Thread-safe plotting using plot_lock to prevent concurrent matplotlib operations
+        - Rendered by the chart process pool (see chart_renderer), in parallel to the other charts
         - Dynamic figure sizing based on number of applications (minimum 3, scales with data)
         - Horizontal timeline visualization with markers at endpoints
         - Time values displayed at midpoint of each timeline for clarity
         - Professional grid styling with dashed lines
         - Automatic x-axis scaling with 200ms tick intervals
-        - Unique timestamp-based filename to avoid conflicts
        
     Graph Elements:
         - X-axis: Time interval in milliseconds
@@ -398,81 +385,19 @@ def plot_process_individual_apps_avg_graph(differences, sheet, start_row, ecu_ty
         - Grid: Light gray dashed lines for easy reading
        
     Note:
-        The generated PNG file is automatically embedded in the Excel sheet at column J
-        and cleaned up by the remove_png_files() function after report generation.
+        The graph is embedded in the Excel sheet at column J once it is rendered, the sheet
+        waits for it when it is written. With 'Native Charts' an xlsx bar chart of the
+        Average (ms) column is embedded instead.
     """
-    with plot_lock:
-        # Determine the height of the graph based on the size of the sheet
-        height = (sheet.max_row - start_row + 1) * 0.35 # adjust the multiplier as needed
-        width = 10
-
-        # logger.info(f"Sheet size: {sheet.max_row - start_row + 1}, height : {height}")
-
-        if height > 6.5:
-            height = 6.5
-            width = 12
-
-        # Create a new figure with a specified size
-        plt.figure(figsize=(12, max(3, len(differences)*0.2)))
-
-        # Iterate over each process and its difference
-        for index, (process, difference) in enumerate(differences.items(), start=1):
-            plt.plot([0, difference], [index, index], marker='o')
-
-            # Add a text label at the midpoint of the line with the difference value
-            plt.text((0 + difference) / 2, index + 0.1, str(round_decimal_half_up(difference, 4))+" ms",#"{:.3f} ms".format(difference),
-                    verticalalignment='bottom', horizontalalignment='center')
-
-        # Set the y-axis tick labels to the process names and 'Time from IG ON to QNX startup'
-        plt.yticks(range(1, len(differences) + 1), list(differences.keys()))
-
-        # Set the x-axis label
-        plt.xlabel('Time Interval (milliseconds)')
-
-        # Set the y-axis label
-
-        plt.ylabel('Services or Applications')
-
-        # Set the title of the plot
-        plt.title(f'{ecu_type} Timeline Graph: Individual Services/Applications Startup Time Average', pad=20)
-
-        # Enable the grid on both x and y axes with light lines
-        plt.grid(True, axis='both', linestyle='--', linewidth=0.5, color='gray')
-
-        # Ensure the plot fits within the figure
-        plt.tight_layout()
-
-        # Determine the x-axis limits with some padding
-        min_x = 0
-        max_x = max(differences.values())
-        # padding = (max_x - min_x) * 0.05
-        padding = 3
-   
-        # Create a sequence of milliseconds for the x-axis
-        x_ticks = np.arange(0, max_x + 200, 200)  # show ticks every 100ms
-
-        plt.xticks(x_ticks)
-        plt.xlim(min_x - padding, max_x + padding)
-
-        # Get the current time
-        timestamp = datetime.now().strftime("%M%S%f")
-        # plot_image = f'graph_process_startup_{ecu_type}_{timestamp}.png'
-        plot_image = Path(__file__).parent.joinpath(f'graph_process_startup_{ecu_type}_{timestamp}.png')
-       
-
-
-        # Save the plot to a file
-        plt.savefig(plot_image)
+    if native_charts:
+        table.add_chart(partial(bar_chart, f'{ecu_type} Individual Services/Applications Startup Time Average',
+                                'Time Interval (milliseconds)', 1, 4), 'J')
+        return
+    apps = [(process, difference, str(round_decimal_half_up(difference, 4)) + " ms") for process, difference in differences.items()]
+    embed_chart(table, 'J', ecu_type, 'average_init_timeline', ecu_type, apps)
 
-        # Close the plot
-        plt.close()
 
-        # Add the plot to the Excel sheet
-        img = Image(plot_image)
-        sheet.add_image(img, f'J{start_row}')
-
-
-def plot_process_start_end_time_graph(ecu_type, data, sheet, start_row):
+def plot_process_start_end_time_graph(ecu_type, data, table):
     """
     Creates and embeds a timeline graph showing application initialization (Init/Up) times.
    
@@ -481,19 +406,13 @@ def plot_process_start_end_time_graph(ecu_type, data, sheet, start_row):
     application takes to fully initialize after being started, measured in milliseconds.
    
     Args:
-        ecu_type (str): ECU type identifier for graph title and file naming
+        ecu_type (str): ECU type identifier for the graph title
         data (list): List of dictionaries containing process timing information
                     Each dict should have 'process' and 'start_time_ms' keys
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to embed the graph
-        start_row (int): Row number where the graph should be positioned
-       
-    Data Processing:
-        - Converts input data to pandas DataFrame for easier manipulation
-        - Ensures start_time_ms values are numeric for proper plotting
-        - Sorts processes by initialization time for logical presentation
+        table (ReportTable): Table the graph is embedded next to
        
     Graph Features:
-        - Thread-safe plotting using plot_lock
+        - Rendered by the chart process pool (see chart_renderer)
         - Dynamic figure sizing based on data volume
         - Horizontal timeline from 0 to initialization time
         - Time values displayed at timeline midpoints
@@ -508,74 +427,32 @@ def plot_process_start_end_time_graph(ecu_type, data, sheet, start_row):
        
     Note:
         There's a discrepancy in the x-axis label (microseconds) vs actual data (milliseconds).
-        This should be corrected for accuracy in future versions.
+        This should be corrected for accuracy in future versions. With 'Native Charts' an
+        xlsx bar chart of the Init(Up) Time (ms) column is embedded instead.
     """
-    with plot_lock:
-        # Determine the height of the graph based on the size of the sheet
-        height = (sheet.max_row - start_row + 1) * 0.35 # adjust the multiplier as needed
-        width = 10
-
-        # logger.info(f"Sheet size: {sheet.max_row - start_row + 1}, height : {height}")
-
-        if height > 6.5:
-            height = 6.5
-            width = 12
-
-        # Create a new figure with a specified size
-        plt.figure(figsize=(12, max(3, len(data)*0.2)))
-
-        df = pd.DataFrame(data)  
-        df['start_time_ms'] = pd.to_numeric(df['start_time_ms'])
-        print ("df", df)
- 
-        for index, row in df.iterrows():
-            print ("row",row['start_time_ms'])
-            plt.plot([0, row['start_time_ms']], [index, index], marker='o')
-            plt.text(row['start_time_ms'] / 2, index + 0.1,
-                    str(round_decimal_half_up(row['start_time_ms'], 4))+" ms", #"{:.3f} ms".format(row['start_time_ms']),
-                    verticalalignment='bottom',
-                    horizontalalignment='center')    
-
-        plt.yticks(range(len(df)), df["process"])
-        plt.xlabel('Time Interval (microseconds)')
-        plt.ylabel('Services or Applications')
-        plt.title(f'{ecu_type} Timeline Graph:Services/Applications Init(Up) Time', pad=20)
-        plt.grid(True)
-        plt.tight_layout()
-   
-        max_x = df['start_time_ms'].max()
-        plt.xlim(-10, max_x)    
-
-        # Get the current time
-        timestamp = datetime.now().strftime("%M%S%f")
-
-        # Save the plot as an image file
-        # plot_image = f'process_start_end_graph_{ecu_type}_{timestamp}.png'
-        plot_image = Path(__file__).parent.joinpath(f'process_start_end_graph_{ecu_type}_{timestamp}.png')
-
-        plt.savefig(plot_image)
-        plt.close()
+    if native_charts:
+        table.add_chart(partial(bar_chart, f'{ecu_type} Services/Applications Init(Up) Time',
+                                'Time Interval (milliseconds)', 1, 3), 'J')
+        return
+    processes = [(item['process'], float(item['start_time_ms']), str(round_decimal_half_up(float(item['start_time_ms']), 4)) + " ms")
+                 for item in data]
+    embed_chart(table, 'J', ecu_type, 'init_timeline', ecu_type, processes, iteration_chart=True)
 
-        # Add the plot image to the worksheet
-        img = Image(plot_image)
-        sheet.add_image(img, f'J{start_row}')
 
-
-def plot_process_startup_time_graph(differences, sheet, start_row, ecu_type, avg_flag):
+def plot_process_startup_time_graph(differences, table, ecu_type, avg_flag, first_row=2):
     """
     Creates and embeds a comprehensive timeline graph showing application startup times from IG ON.
    
     This function generates the main timeline visualization that shows the complete startup
     sequence from ignition ON through QNX startup to individual application completion.
-    It includes reference lines for QNX startup time and performance thresholds.
+    It includes a reference line for the QNX startup time.
    
     Args:
         differences (dict): Dictionary mapping application names to their startup times (seconds)
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to embed the graph
-        start_row (int): Row number where the graph should be positioned
-        ecu_type (str): ECU type identifier for graph title and file naming
-        threshold (float): Performance threshold in seconds (shown as red dashed line)
+        table (ReportTable): Table the graph is embedded next to
+        ecu_type (str): ECU type identifier for the graph title
         avg_flag (bool): If True, shows average times; if False, shows individual completion times
+        first_row (int): Table row of the first application, used by native charts
        
     Timeline Structure:
         - Time 0: Ignition ON
@@ -583,11 +460,10 @@ def plot_process_startup_time_graph(differences, sheet, start_row, ecu_type, avg
         - OFFSET_TIME + app_time: Individual application completion
        
     Graph Features:
-        - Thread-safe plotting using plot_lock
+        - Rendered by the chart process pool (see chart_renderer)
         - Dynamic figure sizing based on number of applications
         - Horizontal timeline visualization with clear time references
         - QNX startup baseline shown as first timeline element
-        - Performance threshold line (red dashed) for quick assessment
         - QNX startup reference line (black dashed) for context
         - Time values displayed at timeline midpoints
        
@@ -596,95 +472,26 @@ def plot_process_startup_time_graph(differences, sheet, start_row, ecu_type, avg
         - Y-axis: 'Time from IG ON to QNX startup' + Service/Application names
         - Title: Dynamic based on avg_flag (Average vs Completion Time)
         - Grid: Professional dashed grid lines
-        - Reference lines: Threshold (red) and QNX startup (black)
         - Labels: QNX Startup marker below timeline
        
     Note:
         This is the primary visualization for startup performance analysis,
         allowing stakeholders to quickly identify applications that exceed
         performance thresholds and understand the overall startup sequence.
+        With 'Native Charts' an xlsx bar chart of the time from IG ON of every
+        application is embedded instead.
     """
-    with plot_lock:
-        # Determine the height of the graph based on the size of the sheet
-        height = (sheet.max_row - start_row + 1) * 0.35 # adjust the multiplier as needed
-        width = 10
-
-        if height > 6.5:
-            height = 6.5
-            width = 12
-
-        # Create a new figure with a specified size
-        plt.figure(figsize=(12, max(3, len(differences)*0.2)))  
-
-        plt.plot([0, OFFSET_TIME], [0, 0],  marker='o')
-        plt.text((OFFSET_TIME) / 2, 0.1, f"{OFFSET_TIME} sec", verticalalignment='bottom', horizontalalignment='center')
-
-        # Iterate over each process and its difference
-        for index, (process, difference) in enumerate(differences.items()):
-            index = index + 1
-            # Plot a line from (OFFSET_TIME, index) to (difference + OFFSET_TIME, index) with a marker at the end
-            plt.plot([OFFSET_TIME, difference + OFFSET_TIME], [index, index], marker='o')
-
-            # Add a text label at the midpoint of the line with the difference value
-            plt.text((OFFSET_TIME + difference + OFFSET_TIME) / 2, index + 0.1,
-                    str(round_decimal_half_up(difference, 4))+" sec", #"{:.3f} sec".format(difference),
-                    verticalalignment='bottom', horizontalalignment='center')
-
-        # Set the y-axis tick labels to the process names and 'Time from IG ON to QNX startup'
-        plt.yticks(range(len(differences) + 1), ['Time from IG ON to QNX startup'] + list(differences.keys()))
-
-        # Set the x-axis label
-        plt.xlabel('Time Interval (seconds)')
-
-        # Set the y-axis label
-        plt.ylabel('Services or Applications')
-
-        # Set the title of the graph
+    if native_charts:
         if avg_flag:
-            plt.title(f'{ecu_type} Timeline Graph: Services/Applications Startup Time Average', pad=20)
+            factory = partial(bar_chart, f'{ecu_type} Services/Applications Startup Time Average',
+                              'Average time from IG ON (seconds)', 1, 5)
         else:
-            plt.title(f'{ecu_type} Timeline Graph: Services/Applications Startup Completion Time', pad=20)
-
-        # Enable the grid on both x and y axes with light lines
-        plt.grid(True, axis='both', linestyle='--', linewidth=0.5, color='gray')
-
-        # Ensure the plot fits within the figure
-        plt.tight_layout()
-
-        # Determine the x-axis limits with some padding
-        min_x = 0
-        max_x = max(differences.values()) + OFFSET_TIME  # add OFFSET_TIME to max_x
-        padding = (max_x - min_x) * 0.015
-
-        # Create a sequence of seconds for the x-axis
-        x_ticks = np.arange(0, max_x + 1, 1)  
-
-        plt.xticks(x_ticks)
-
-        plt.xlim(min_x - padding, max_x + padding)
-        # plt.xlim(0, max_x + padding)
-
-        # Add QNX Startup Time label exactly below OFFSET_TIME sec on x-axis
-        plt.text(OFFSET_TIME, -3.0, "QNX Startup", verticalalignment='top', horizontalalignment='center')
-
-        # Add a vertical black line at x=OFFSET_TIME seconds
-        plt.axvline(x=OFFSET_TIME, color='black', linestyle='--', linewidth=1)  
-
-        # Get the current time
-        timestamp = datetime.now().strftime("%M%S%f")
-        # plot_image = f'graph_process_startup_{ecu_type}_{timestamp}.png'
-        plot_image = Path(__file__).parent.joinpath(f'graph_process_startup_{ecu_type}_{timestamp}.png')
-
-        # # Save the plot to a file
-        # plot_image = f'bar_chart_process_start_time_{start_row}.png'
-        plt.savefig(plot_image)
-
-        # Close the plot
-        plt.close()
-
-        # Add the plot to the Excel sheet
-        img = Image(plot_image)
-        sheet.add_image(img, f'N{start_row}')
+            factory = partial(bar_chart, f'{ecu_type} Services/Applications Startup Completion Time',
+                              'Time from IG ON (seconds)', 2, 5)
+        table.add_chart(factory, 'N', first_row, first_row + len(differences) - 1)
+        return
+    apps = [(process, difference, str(round_decimal_half_up(difference, 4)) + " sec") for process, difference in differences.items()]
+    embed_chart(table, 'N', ecu_type, 'startup_timeline', ecu_type, apps, OFFSET_TIME, avg_flag, iteration_chart=not avg_flag)
 
 def get_log_file_path(ecu_type, setup_type, index):
     """
@@ -893,18 +700,18 @@ def get_expected_startup_order(application_name, application_startup_order, logg
  
 
 
-def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, sheet, application_startup_order, validate_startup_order, application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger):
+def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, table, application_startup_order, validate_startup_order, application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger):
     """
-    Writes application startup timing data to Excel worksheet with comprehensive validation.
+    Writes application startup timing data to the report table with comprehensive validation.
    
-    This function populates an Excel worksheet with detailed startup timing information,
+    This function populates the report table with detailed startup timing information,
     including performance validation, startup order verification, and failure analysis.
     It creates a comprehensive report that stakeholders can use to assess system performance.
    
     Args:
         dltstart_timestamps (dict): Dictionary mapping application names to their startup times (seconds)
         process_timing_info (list): List of process timing information (currently used for debugging)
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to populate
+        table (ReportTable): Startup time table of the iteration sheet to populate
         application_startup_order (list): Expected startup order configuration
         threshold (float): Performance threshold in seconds for pass/fail determination
         validate_startup_order (bool): Whether to perform startup order validation
@@ -932,18 +739,18 @@ def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, shee
         - Merges cells in column D (IG ON to QNX Startup) for visual clarity
         - Handles missing applications by adding placeholder rows
         - Provides summary count of different failure types
-        - Applies consistent border styling
+        - Merged ranges are bordered when the sheet is rendered
        
     Note:
         This function is central to the reporting system and provides the detailed
         data that feeds into summary reports and visualizations.
     """
 
-    startup_order_count_idx = sheet.max_row + 1
+    startup_order_count_idx = table.next_row
     if validate_startup_order:
-        sheet.append(['', '', '', '', '', '', '', '', '', 0, 0, 0])
+        table.append(['', '', '', '', '', '', '', '', '', 0, 0, 0])
        
-    start_row = sheet.max_row + 1
+    start_row = table.next_row
 
     # Iterate over the DLTStart timestamps and differences in parallel using zip
     for position, (process, dltstart_line) in enumerate(dltstart_timestamps.items()):
@@ -981,12 +788,11 @@ def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, shee
             else:
                 data_row.extend(['PASS', '', '', ''])
 
-        # Append the data row to the sheet
-        sheet.append(data_row)
+        # Append the data row to the table
+        table.append(data_row)
        
     # Merge cells in column D for the rows created in this scenario
-    merged_range = f'D{start_row}:D{sheet.max_row}'
-    sheet.merge_cells(merged_range)
+    table.merge(start_row, 4, table.next_row - 1, 4)
    
     if validate_startup_order:
         for order_type, order in application_startup_order:
@@ -1002,9 +808,8 @@ def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, shee
                         data_row.extend([str(expected_order), 'FAIL', '', '⬤', ''])
                         application_startup_order_status_iteration[OrderFailureType.APPLICATION_NOT_FOUND.name] += 1
                         application_startup_order_status_iteration['startup_order_status'] = False
-                    sheet.append(data_row)
+                    table.append(data_row)
         # Update the last three cells of the row at startup_order_count_idx with the current counts and highlight in yellow
-        yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
         counts = [
             application_startup_order_status_iteration[OrderFailureType.ORDER_MISMATCH.name],
             application_startup_order_status_iteration[OrderFailureType.APPLICATION_NOT_FOUND.name],
@@ -1012,38 +817,20 @@ def write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, shee
         ]
         # Merge cells from column 1 to 9 in the current row with the above row
         for col in range(1, 10):
-            sheet.merge_cells(
-            start_row=startup_order_count_idx - 1,
-            start_column=col,
-            end_row=startup_order_count_idx,
-            end_column=col
-            )
+            table.merge(startup_order_count_idx - 1, col, startup_order_count_idx, col)
         for offset, count in enumerate(counts, start=10):
-            cell = sheet.cell(row=startup_order_count_idx, column=offset)
-            cell.value = count
-            cell.fill = yellow_fill
-            cell.border = border_style
-        # Ensure all cells in the merged range have borders
-        for col in range(1, 10):
-            for row in range(startup_order_count_idx - 1, startup_order_count_idx + 1):
-                cell = sheet.cell(row=row, column=col)
-                cell.border = border_style
-    # Apply the border style to the entire merged range
-    for row in sheet[merged_range]:
-        for cell in row:
-            cell.border = border_style
+            table.set_cell(startup_order_count_idx, offset, count, COUNT)
 
 
-def create_header(sheet, ecu_type, validate_startup_order, app_columns):
+def create_table(ecu_type, validate_startup_order, app_columns):
     """
-    Creates formatted section headers for different types of data in Excel worksheets.
+    Creates a report table with the section header for different types of data.
    
-    This function generates professional-looking section headers that separate different
-    types of analysis data within the same worksheet. It handles multiple report types
-    and adjusts column configurations based on validation settings.
+    The table separates different types of analysis data within the same worksheet. This
+    function selects the header text and the columns for the report type and adjusts the
+    column configuration based on validation settings.
    
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to add header to
         ecu_type (str): ECU type identifier for header text
         validate_startup_order (bool): Whether startup order validation is enabled
         app_columns (str): Type of columns to create, determines header style and content
@@ -1051,36 +838,35 @@ def create_header(sheet, ecu_type, validate_startup_order, app_columns):
     Column Types Supported:
         - 'min_max_avg_columns': Statistical summary of startup times
         - 'min_max_avg_individual': Statistical summary of individual app times
+        - 'distribution_columns': Percentiles of the startup times across the iterations
+        - 'distribution_individual': Percentiles of the individual app times across the iterations
         - 'startup_time_columns': Detailed startup time analysis
         - 'info_columns': Application initialization time information
         - 'overall_test_columns': Test iteration summary
+        - 'early_stopping_columns': Threshold group verdicts of the early stopping rule
+        - 'regression_columns': Distribution shifts against the regression baseline
+        - 'cross_ecu_columns': Startup times of all ECUs of one iteration from IG ON
+        - 'cross_ecu_average_columns': Average startup times of all ECUs from IG ON
         - 'startup_appendix': Field descriptions and documentation
        
-    Header Features:
-        - Adds 10 empty rows for visual separation from previous sections
-        - Creates merged header cell spanning all data columns
-        - Applies professional blue background (9EB9DA) with bold text
-        - Centers header text both horizontally and vertically
-        - Adds column name row with appropriate text wrapping
-        - Applies consistent border styling
+    Header Features (applied by SheetModel.render):
+        - 10 empty rows separate the table from the previous section
+        - Merged header cell spanning all data columns
+        - Professional blue background (9EB9DA) with bold, centered text
+        - Column name row with text wrapping for multi-line names
+        - Consistent border styling
        
     Dynamic Column Adjustment:
         - Removes startup order validation columns when validation is disabled
         - Adjusts column count automatically based on configuration
        
     Returns:
-        int: Row number where the header section starts (for reference in other functions)
+        ReportTable: Empty table with the header text and column names, to be added to a SheetModel
        
     Note:
         This function is essential for creating well-organized, professional reports
         that clearly separate different types of analysis data within the same worksheet.
     """
-    # Check if the sheet has existing rows and append empty rows if necessary
-    if sheet.max_row > 1:
-        # Append 5 empty rows to separate the header from existing data
-        for _ in range(10):
-            sheet.append([])
-
     # Determine the header text and column names based on the avg_flag
     if app_columns == 'min_max_avg_columns':
         # If avg_flag is True, include Min, Max, and Avg in the header
@@ -1092,6 +878,14 @@ def create_header(sheet, ecu_type, validate_startup_order, app_columns):
         header = f'Services/Applications Individual Startup Times on {ecu_type} (Min, Max, Avg)'
         columns = application_start_end_time_min_max_avg_columns
 
+    elif app_columns == 'distribution_columns':
+        header = f'Services/Applications Startup Time Distribution from QNX Startup on {ecu_type} (Percentiles)'
+        columns = application_startup_time_distribution_columns
+
+    elif app_columns == 'distribution_individual':
+        header = f'Services/Applications Individual Startup Time Distribution on {ecu_type} (Percentiles)'
+        columns = application_start_end_time_distribution_columns
+
     elif app_columns == 'startup_time_columns':
         # If avg_flag is False, only include Startup Time in the header
         header = f'Services/Applications Startup Time on {ecu_type}'
@@ -1109,51 +903,37 @@ def create_header(sheet, ecu_type, validate_startup_order, app_columns):
         if not validate_startup_order:
             columns=columns[:-4]
 
-    elif app_columns == 'startup_appendix':
-       header = f'Field Description for \n Services/Applications Startup Completion Time on {ecu_type}'
-       columns = appendix_columns
-    table_headers.append(header)
-    # Append the header text to the sheet
-    sheet.append([header])
-
-    # Get the current row number (which is now the start of the header)
-    start_row = sheet.max_row
-
-    # Calculate the last column letter based on the number of columns
-    last_column_letter = chr(64 + len(columns))
-
-    # Merge the cells in the header row
-    merged_range = f'A{sheet.max_row}:{last_column_letter}{sheet.max_row}'
-    sheet.merge_cells(merged_range)
+    elif app_columns == 'tool_timing_summary_columns':
+        header = f'Tool Execution Time per Phase on {ecu_type} (Count, Total, Avg, Max)'
+        columns = tool_timing_summary_columns
 
-    # Get the merged cell object
-    merged_cell = sheet.cell(row=sheet.max_row, column=1)
+    elif app_columns == 'tool_timing_columns':
+        header = f'Tool Execution Time of each Phase on {ecu_type}'
+        columns = tool_timing_columns
 
-    # Apply formatting to the merged cell (gray fill, bold text, centered alignment)
-    merged_cell.fill = PatternFill(start_color="9EB9DA", end_color="9EB9DA", fill_type="solid")
-    merged_cell.alignment = Alignment(horizontal='center', vertical='center')
-    merged_cell.font = Font(bold=True)
+    elif app_columns == 'early_stopping_columns':
+        header = f'Early Stopping on {ecu_type}: {early_stopping_result["iterations_run"]} of {early_stopping_result["iterations_configured"]} Iterations run'
+        columns = early_stopping_columns
 
-    # Append the column names for the header
-    sheet.append(columns)    
+    elif app_columns == 'regression_columns':
+        header = f'Regression vs Baseline on {ecu_type}: {regression_result["baseline"][ecu_type]}'
+        columns = regression_columns
 
-    for col_idx, col_val in enumerate(columns):
-        cell = sheet.cell(row=sheet.max_row, column=col_idx + 1)
-        if '\n' in col_val:
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)    
-        else:    
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+    elif app_columns == 'cross_ecu_columns':
+        header = f'Services/Applications Startup Time from IG ON on {ecu_type}'
+        columns = cross_ecu_columns
 
-    # Apply the border style to the entire merged range
-    for row in sheet[merged_range]:
-        for cell in row:
-            cell.border = border_style
+    elif app_columns == 'cross_ecu_average_columns':
+        header = f'Services/Applications Average Startup Time from IG ON on {ecu_type}'
+        columns = cross_ecu_average_columns
 
-    # Return the row number where the header starts
-    return start_row
+    elif app_columns == 'startup_appendix':
+       header = f'Field Description for \n Services/Applications Startup Completion Time on {ecu_type}'
+       columns = appendix_columns
+    return ReportTable(header, columns, name=app_columns.removesuffix('_columns'))
 
 
-def each_iteration_test_status(ecu_type, summary_sheet, overall_IG_ON_iteration, config, application_startup_order_status):
+def each_iteration_test_status(ecu_type, summary_model, overall_IG_ON_iteration, config, application_startup_order_status):
     """
     Creates a summary table showing test results for each iteration with hyperlinks to detailed data.
    
@@ -1163,7 +943,7 @@ def each_iteration_test_status(ecu_type, summary_sheet, overall_IG_ON_iteration,
    
     Args:
         ecu_type (str): ECU type identifier for header generation
-        summary_sheet (openpyxl.worksheet.worksheet.Worksheet): Summary worksheet to populate
+        summary_model (SheetModel): Content of the Summary worksheet to populate
         overall_IG_ON_iteration (dict): Dictionary mapping iteration index to overall startup time
         config (dict): Test configuration containing iterations count and validation settings
         application_startup_order_status (dict): Startup order validation results per iteration
@@ -1182,7 +962,7 @@ def each_iteration_test_status(ecu_type, summary_sheet, overall_IG_ON_iteration,
         - Applies 5-second performance threshold for pass/fail determination
         - Includes startup order validation summary when enabled
         - Provides failure count breakdown for root cause analysis
-        - Uses professional formatting via format_excel_cells
+        - Uses the professional table formatting of SheetModel.render
        
     Hyperlink Format:
         Links to worksheets named 'GEN3_StartupTime_{iteration_number}'
@@ -1195,52 +975,47 @@ def each_iteration_test_status(ecu_type, summary_sheet, overall_IG_ON_iteration,
         This summary table is typically the first thing stakeholders review
         to get an overall assessment of system performance across test iterations.
     """
-    start_row = create_header(summary_sheet, ecu_type, config['Startup Order Judgement'], 'overall_test_columns')
-    for i in range(config['Iterations']):
-        if i in overall_IG_ON_iteration:
-            overall_value = overall_IG_ON_iteration[i]['timestamp'] + OFFSET_TIME
-            test_status = '-'
-            if overall_IG_ON_iteration[i]['status']:
-                if overall_IG_ON_iteration[i]['passed_count'] >= 1:
-                    test_status = 'PASS'
-            else:
-                test_status = 'FAIL'
-            data_row = [f'=HYPERLINK("#\'GEN3_StartupTime_{(i + 1):02d}\'!A1", "{i + 1}")', overall_value, test_status]
-            if config['Startup Order Judgement'] and i in application_startup_order_status:
-                data_row.extend([
-                    "PASS" if application_startup_order_status[i]['startup_order_status'] else "FAIL",
-                    application_startup_order_status[i][OrderFailureType.ORDER_MISMATCH.name],
-                    application_startup_order_status[i][OrderFailureType.APPLICATION_NOT_FOUND.name],
-                    application_startup_order_status[i][OrderFailureType.APPLICATION_NOT_CONFIGURED.name]
-                ])
-            summary_sheet.append(data_row)
-           
-            # Apply hyperlink formatting to the first cell in the last row
-            cell = summary_sheet.cell(row=summary_sheet.max_row, column=1)
-            cell.font = Font(bold=True, underline='single', color='0000FF')
-   
-    format_excel_cells(summary_sheet, start_row)
+    table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'overall_test_columns'))
+    # Iterations of an appended report are included, failed iterations have no entry
+    for i in sorted(overall_IG_ON_iteration):
+        overall_value = overall_IG_ON_iteration[i]['timestamp'] + OFFSET_TIME
+        test_status = '-'
+        if overall_IG_ON_iteration[i]['status']:
+            if overall_IG_ON_iteration[i]['passed_count'] >= 1:
+                test_status = 'PASS'
+        else:
+            test_status = 'FAIL'
+        data_row = [Link(f"#'GEN3_StartupTime_{(i + 1):02d}'!A1", i + 1), overall_value, test_status]
+        if config['Startup Order Judgement'] and i in application_startup_order_status:
+            data_row.extend([
+                "PASS" if application_startup_order_status[i]['startup_order_status'] else "FAIL",
+                application_startup_order_status[i][OrderFailureType.ORDER_MISMATCH.name],
+                application_startup_order_status[i][OrderFailureType.APPLICATION_NOT_FOUND.name],
+                application_startup_order_status[i][OrderFailureType.APPLICATION_NOT_CONFIGURED.name]
+            ])
+        # The first cell is formatted as hyperlink
+        table.append(data_row, styles={1: ITERATION_LINK})
 
 
-def export_and_plot_average_data_to_excel(sheet, ecu_type, process_times, process_start_times, config, logger):
+def export_and_plot_average_data_to_excel(summary_model, ecu_type, startup_stats, start_time_stats, config, logger):
     """
     Generates comprehensive statistical analysis and visualizations of application startup performance.
    
-    This function creates two detailed statistical sections in the Excel report:
-    1. Startup time statistics (min/max/avg) from QNX startup
+    This function adds two detailed statistical sections to the Summary worksheet:
+    1. Startup time statistics (min/max/avg, median, deviation, tail percentiles) from QNX startup
     2. Individual application initialization time statistics
    
     Each section includes both tabular data and corresponding timeline visualizations.
    
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet for the analysis
+        summary_model (SheetModel): Content of the Summary worksheet for the analysis
         ecu_type (str): ECU type identifier for headers and graph titles
-        process_times (dict): Dictionary mapping process names to lists of startup times
-        process_start_times (dict): Dictionary mapping process names to lists of init times
+        startup_stats (dict): summary_statistics of the startup times of every process
+        start_time_stats (dict): summary_statistics of the init times of every process
         config (dict): Test configuration containing validation settings and thresholds
        
     Section 1 - Startup Time Statistics:
-        - Calculates min, max, and average startup times for each application
+        - Calculates min, max, average, median, standard deviation and P90/P95/P99 startup times for each application
         - Includes total time from IG ON (startup_time + OFFSET_TIME)
         - Sorts applications by average startup time for easy identification of slow starters
         - Generates timeline graph showing average performance
@@ -1254,7 +1029,12 @@ def export_and_plot_average_data_to_excel(sheet, ecu_type, process_times, proces
     Statistical Calculations:
         - Minimum: Best performance across all iterations
         - Maximum: Worst performance across all iterations  
-        - Average: Mean performance (rounded to 3 decimal places)
+        - Average: Mean performance (rounded to 4 decimal places)
+        - Median, P90, P95, P99: Typical and tail performance across all iterations
+        - Standard Deviation: Sample deviation across all iterations, '-' for a single iteration
+        - All statistics of all applications are computed in one vectorized pass over the
+          (iterations x applications) sample matrix and rounded half up as one array
+          (see startup_statistics)
        
     Visualizations:
         - Timeline graphs embedded directly in Excel worksheet
@@ -1266,100 +1046,286 @@ def export_and_plot_average_data_to_excel(sheet, ecu_type, process_times, proces
         - Automatic sorting by performance for priority identification
         - Dual analysis perspectives (system-level and app-level)
         - Integrated visualizations for stakeholder presentations
-        - Professional formatting and column width optimization
+        - Professional formatting and column width optimization when the sheet is rendered
        
     Note:
         This function provides the statistical foundation for performance analysis,
         helping identify performance trends, outliers, and optimization opportunities.
     """
-    # Create a header in the Excel sheet for the average data
-    start_row = create_header(sheet, ecu_type, config['Startup Order Judgement'], 'min_max_avg_columns')
+    # Create a table in the Summary sheet for the average data
+    table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'min_max_avg_columns'))
 
     # Initialize an empty dictionary to store the average differences
     differences = {}
-    individual_differences= {}    
-
-    # Initialize an empty list to store the data
-    data = []
-    individual_list = []
-
-    # Iterate over each process and its times
-    for process, times in process_times.items():
-        # Calculate the minimum, maximum, and average times for the process
-        min_time = min(times)
-        max_time = max(times)
-        # avg_time = sum(times) / len(times)
-        avg_time = round_decimal_half_up(sum(times) / len(times), 4)
-       
-        # Create a dictionary for the process with the minimum, maximum, and average times
-        data_row = {
-            'process': process,
-            'min_time': round_decimal_half_up(min_time, 4),
-            'max_time': round_decimal_half_up(max_time, 4),
-            'avg_time': round_decimal_half_up(avg_time, 4),
-        }
-       
-        # Append the data row to the list
-        data.append(data_row)
-
-    # Sort the data based on the average time
-    data.sort(key=lambda x: x['avg_time'])
-
-    # Append the sorted data to the Excel sheet
-    for data_row in data:
-        sheet.append([data_row['process'], data_row['min_time'], data_row['max_time'], data_row['avg_time'], float(data_row['avg_time']) + OFFSET_TIME, threshold_map[ecu_type][data_row['process']] if data_row['process'] in threshold_map[ecu_type] else '-'])
+    individual_differences = {}
+
+    # Minimum, maximum, average, median, deviation and tail percentiles of every process, rounded to 4 decimals
+    stats = startup_stats
+    rows = round_half_up(np.vstack([stats['min'], stats['max'], stats['mean'], stats['median'], stats['std'], *stats['percentiles']]), 4)
+
+    # Append the rows sorted by the average time, processes with the same average keep their order
+    for j in np.argsort(rows[2], kind='stable'):
+        process = stats['applications'][j]
+        min_time, max_time, avg_time, median_time, std_time, *tail_times = rows[:, j].tolist()
+        table.append([process, min_time, max_time, avg_time, avg_time + OFFSET_TIME, threshold_map[ecu_type][process] if process in threshold_map[ecu_type] else '-',
+                      median_time, std_time if not math.isnan(std_time) else '-', *tail_times])
 
         # Store the average difference in the differences dictionary
-        differences[data_row['process']] = float(data_row['avg_time'])
+        differences[process] = avg_time
 
     # Plot the average data as a graph
-    plot_process_startup_time_graph(differences, sheet, start_row, ecu_type, True)
+    if report_charts:
+        plot_process_startup_time_graph(differences, table, ecu_type, True)
+
+    # Create a table in the Summary sheet for the average data
+    table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'min_max_avg_individual'))
 
-    # Format the Excel cells
-    format_excel_cells(sheet, start_row)
+    # Same statistics of the start times of every process
+    stats = start_time_stats
+    rows = round_half_up(np.vstack([stats['min'], stats['max'], stats['mean'], stats['median'], stats['std'], *stats['percentiles']]), 4)
 
-    # Create a header in the Excel sheet for the average data
-    start_row = create_header(sheet, ecu_type, config['Startup Order Judgement'], 'min_max_avg_individual')
+    # Append the rows sorted by the average time
+    for j in np.argsort(rows[2], kind='stable'):
+        process = stats['applications'][j]
+        min_time, max_time, avg_time, median_time, std_time, *tail_times = rows[:, j].tolist()
+        table.append([process, min_time, max_time, avg_time, median_time, std_time if not math.isnan(std_time) else '-', *tail_times])
+
+        # Store the average difference in the differences dictionary
+        individual_differences[process] = avg_time
+   
+    # Plot the average data as a graph
+    if report_charts:
+        plot_process_individual_apps_avg_graph(individual_differences, table, ecu_type)
 
-    for process, start_times in process_start_times.items():
-        # Calculate the minimum, maximum, and average start times for the process
-        min_time = min(start_times)
-        max_time = max(start_times)
-        avg_time = sum(start_times) / len(start_times)
-        # avg_time = round(sum(start_times) / len(start_times), 3)    
 
-        # Create a dictionary for the process with the minimum, maximum, and average times
-        data_row = {
-            'process': process,
-            'min_time': round_decimal_half_up(min_time, 4),
-            'max_time': round_decimal_half_up(max_time, 4),
-            'avg_time': round_decimal_half_up(avg_time, 4),
-        }
+def plot_distribution_graph(title, xlabel, apps, table, ecu_type):
+    """
+    Creates and embeds a box chart of the distribution of a timing of every application.
+   
+    Args:
+        title (str): Graph title
+        xlabel (str): Label of the time axis
+        apps (list): (application, minimum, P5, P25, median, P75, P95, maximum) in table order
+        table (ReportTable): Table the graph is embedded next to
+        ecu_type (str): ECU type the graph belongs to
        
-        # Append the data row to the list
-        individual_list.append(data_row)
+    Note:
+        The graph is embedded at column L. Native xlsx charts have no box chart, with
+        'Native Charts' only the table is written.
+    """
+    if native_charts or not apps:
+        return
+    embed_chart(table, 'L', ecu_type, 'distribution', title, xlabel, apps)
+
+
+def add_distribution_summary(summary_model, ecu_type, startup_stats, start_time_stats, config):
+    """
+    Adds the distributions of the startup and Init(Up) times across the iterations to the Summary sheet.
+   
+    Minimum, maximum and average hide applications with a bimodal or long-tail startup,
+    so every application also gets its percentiles and a box chart of them. The
+    percentiles come from the same summary_statistics as the Min, Max, Avg tables, so
+    the medians and P95 of both tables are the same values.
+   
+    Args:
+        summary_model (SheetModel): Content of the Summary worksheet to populate
+        ecu_type (str): ECU type identifier for headers and graph titles
+        startup_stats (dict): summary_statistics of the startup times (sec) of every process
+        start_time_stats (dict): summary_statistics of the Init(Up) times (ms) of every process
+        config (dict): Test configuration, 'Distribution Charts' (default true) enables the section
+    """
+    if not config.get('Distribution Charts', True):
+        return
+    for stats, app_columns, title, xlabel in (
+            (startup_stats, 'distribution_columns', f'{ecu_type} Services/Applications Startup Time Distribution',
+             'Time from QNX Startup (seconds)'),
+            (start_time_stats, 'distribution_individual', f'{ecu_type} Services/Applications Individual Startup Time Distribution',
+             'Time Interval (milliseconds)')):
+        # Columns: application, minimum, percentiles, maximum
+        values = np.vstack([stats['min'], stats['distribution'], stats['max']])
+        rounded = round_half_up(values, 4)
+        # Sorted by the rounded median like the averages above, equal medians keep their order
+        order = np.argsort(round_half_up(stats['median'], 4), kind='stable')
+        table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], app_columns))
+        for j in order:
+            table.append([stats['applications'][j], int(stats['count'][j]), *rounded[:, j].tolist()])
+        if report_charts:
+            plot_distribution_graph(title, xlabel, [(stats['applications'][j], *values[:, j].tolist()) for j in order], table, ecu_type)
+
+
+def add_early_stopping_summary(summary_model, ecu_type, config):
+    """
+    Records the early stopping rule and the threshold group verdicts in the Summary sheet.
+   
+    The table lists every threshold group of the ECU with its number of failed application
+    results, the maximum total time from IG ON and the upper prediction bound of the
+    application that decided its verdict, and whether the verdict was settled. The
+    stopping rule itself is written below the table.
+   
+    Args:
+        summary_model (SheetModel): Content of the Summary worksheet to populate
+        ecu_type (str): ECU type whose threshold groups are reported
+        config (dict): Test configuration for header settings
+    """
+    if early_stopping_result is None:
+        return
+    table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'early_stopping_columns'))
+    for verdict in early_stopping_result['verdicts']:
+        if verdict['ecu_type'] != ecu_type:
+            continue
+        times = [round_decimal_half_up(verdict[key], 4) if verdict[key] is not None else '-' for key in ('maximum', 'bound')]
+        table.append([verdict['group'], ', '.join(verdict['applications']), verdict['threshold'], verdict['samples'],
+                      verdict['failures'], *times, verdict['verdict'], 'Yes' if verdict['settled'] else 'No'])
+    summary_model.add_row([])
+    summary_model.add_row([f"Stopping rule: {early_stopping_result['rule']}"])
+    summary_model.add_row([f"Stopped early: {'Yes' if early_stopping_result['stopped'] else 'No'}"])
+
+
+def add_regression_summary(summary_model, ecu_type, config):
+    """
+    Records the comparison with the regression baseline in the Summary sheet.
+   
+    The table lists the startup time (sec from QNX startup) and the Init(Up) time (ms)
+    of every application with the sample counts and medians of both runs, the median
+    shift and the p-value of the test. Significant slowdowns are judged FAIL, the
+    detection rule is written below the table.
+   
+    Args:
+        summary_model (SheetModel): Content of the Summary worksheet to populate
+        ecu_type (str): ECU type whose applications are reported
+        config (dict): Test configuration for header settings
+    """
+    if regression_result is None or ecu_type not in regression_result['baseline']:
+        return
+    table = summary_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'regression_columns'))
+    for comparison in regression_result['comparisons']:
+        if comparison['ecu_type'] != ecu_type:
+            continue
+        medians = [round_decimal_half_up(comparison[key], 4) if comparison[key] is not None else '-'
+                   for key in ('baseline_median', 'median')]
+        shift = round_decimal_half_up(comparison['shift'], 2) if comparison['shift'] is not None else '-'
+        if comparison['p_value'] is None:
+            p_value, judgement = '-', '-'
+        else:
+            # Small p-values are kept with their significant digits
+            p_value = float(f"{comparison['p_value']:.3g}")
+            judgement = 'FAIL' if comparison['regression'] else 'PASS'
+        table.append([comparison['app'], f"{comparison['measure']} ({comparison['unit']})", comparison['baseline_samples'],
+                      comparison['samples'], *medians, shift, p_value, comparison['change'], judgement])
+    summary_model.add_row([])
+    summary_model.add_row([f"Regression rule: {regression_result['rule']}"])
 
-    # Sort the data based on the average time
-    individual_list.sort(key=lambda x: x['avg_time'])    
+
+def load_regression_baseline(settings, setup_type, ecu_type, results_database, logger):
+    """
+    Loads the samples of the regression baseline of one ECU.
+   
+    Args:
+        settings (dict): 'Regression Baseline' configuration
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        ecu_type (str): ECU type identifier
+        results_database (Path or str): Configured results database, the default one if not set
        
-      # Append the sorted data to the Excel sheet
-    for data_row in individual_list:
-        sheet.append([data_row['process'], data_row['min_time'], data_row['max_time'], data_row['avg_time']])
+    Returns:
+        tuple: (description, (process_times, process_start_times)) of the baseline, None
+               if it is missing or invalid
+       
+    Note:
+        'Baseline Report' is a report written with 'Appendable Report' (the report of
+        the same run for the other ECUs), or a folder for the newest report in it.
+        'Baseline Run' is the timestamp of a run in the results database.
+    """
+    if settings.get('Baseline Report'):
+        sidecar = find_report_sidecar(Path(settings['Baseline Report']), setup_type, ecu_type)
+        if sidecar is None:
+            logger.error(f"Error: No {setup_type} {ecu_type} report with result data (*{SIDECAR_SUFFIX}) found for 'Baseline Report' {settings['Baseline Report']}.")
+            return None
+        try:
+            overall_IG_ON_iteration, process_times, process_start_times, order_status = load_report_sidecar(sidecar)['results']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Error: Reading the baseline result data {sidecar} failed: {e}")
+            return None
+        return sidecar.name.removesuffix(SIDECAR_SUFFIX), (process_times, process_start_times)
+
+    database = Path(results_database or DEFAULT_DATABASE)
+    if not database.is_file():
+        logger.error(f"Error: Results database {database} for 'Baseline Run' not found.")
+        return None
+    try:
+        with ResultsWarehouse(database) as warehouse:
+            samples = warehouse.run_samples(str(settings['Baseline Run']), ecu_type)
+    except sqlite3.Error as e:
+        logger.error(f"Error: Reading the baseline run from {database} failed: {e}")
+        return None
+    if samples is None:
+        logger.error(f"Error: No {ecu_type} run with timestamp {settings['Baseline Run']} in {database}.")
+        return None
+    return f"Run {settings['Baseline Run']}", samples
 
-        # Store the average difference in the differences dictionary
-        individual_differences[data_row['process']] = float(data_row['avg_time'])
+
+def check_regression(detector, baselines, process_times_map, process_start_times_map, ecu_types, logger):
+    """
+    Compares the results of the run with the regression baseline and records them for the report.
    
-    # Plot the average data as a graph
-    plot_process_individual_apps_avg_graph(individual_differences, sheet, start_row, ecu_type)
+    Args:
+        detector (RegressionDetector): Configured detection rule
+        baselines (dict): ECU type -> (description, samples) of load_regression_baseline
+        process_times_map (dict): ECU type -> process startup times of the run
+        process_start_times_map (dict): ECU type -> Init(Up) times of the run
+        ecu_types (iterable): ECU types with results
+    """
+    global regression_result
+    current = {ecu_type: (process_times_map[ecu_type], process_start_times_map[ecu_type]) for ecu_type in ecu_types}
+    comparisons = detector.compare({ecu_type: samples for ecu_type, (description, samples) in baselines.items()}, current)
+    regression_result = {
+        'rule': detector.describe(),
+        'baseline': {ecu_type: description for ecu_type, (description, samples) in baselines.items()},
+        'comparisons': comparisons
+    }
+    for ecu_type in current:
+        flagged = [f"{comparison['app']} {comparison['measure']} {comparison['shift']:+.1f}%" for comparison in comparisons
+                   if comparison['ecu_type'] == ecu_type and comparison['change'] in ('Slower', 'Faster')]
+        if flagged:
+            logger.warning(f"Regression check {ecu_type}: significant shifts against {regression_result['baseline'][ecu_type]}: {flagged}")
+        else:
+            logger.info(f"Regression check {ecu_type}: no significant shift against {regression_result['baseline'][ecu_type]}.")
+
 
-    # Format the Excel cells
-    format_excel_cells(sheet, start_row)
+def check_early_stopping(stop_rule, threshold_groups, process_times_map, finished_iterations, iterations, logger):
+    """
+    Evaluates the early stopping rule after an iteration and records its state for the report.
    
-    # Adjust the column width of the Excel sheet
-    adjust_column_width(sheet, ecu_type, logger)
+    Args:
+        stop_rule (EarlyStopping): Configured stopping rule
+        threshold_groups (dict): ECU type -> threshold groups of the measured ECUs
+        process_times_map (dict): ECU type -> accumulated process startup times
+        finished_iterations (set): Indices of the iterations finished so far
+        iterations (int): Configured number of iterations
+       
+    Returns:
+        bool: True if every threshold group verdict is settled and the run can stop
+    """
+    global early_stopping_result
+    with timed_phase('Early Stopping Check'):
+        verdicts = stop_rule.evaluate(threshold_groups, process_times_map, OFFSET_TIME,
+                                      iterations - len(finished_iterations), stop_rule.looks(iterations))
+    settled = stop_rule.is_settled(verdicts, len(finished_iterations))
+    early_stopping_result = {
+        'rule': stop_rule.describe(),
+        'iterations_run': len(finished_iterations),
+        'iterations_configured': iterations,
+        'stopped': settled and len(finished_iterations) < iterations,
+        'verdicts': verdicts
+    }
+    if settled:
+        logger.info(f"Early stopping: all threshold group verdicts settled after {len(finished_iterations)} iteration(s).")
+    else:
+        unsettled = [f"{verdict['ecu_type']} group {verdict['group']}" for verdict in verdicts if not verdict['settled']]
+        logger.info(f"Early stopping: not settled after {len(finished_iterations)} iteration(s): {unsettled or 'no threshold groups'}")
+    return settled
 
 
-def add_logfile_hyperlink(report_path, log_path, sheet, ecu_type, setup_type):
+def add_logfile_hyperlink(report_path, log_path, sheet_model, ecu_type, setup_type):
     """
     Adds a hyperlink to the source log file in the Excel worksheet for traceability.
    
@@ -1370,7 +1336,7 @@ def add_logfile_hyperlink(report_path, log_path, sheet, ecu_type, setup_type):
     Args:
         report_path (str): Relative or absolute path to the log file for the hyperlink
         log_path (str): Display text for the hyperlink (typically the filename)
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to add the hyperlink
+        sheet_model (SheetModel): Content of the iteration worksheet to add the hyperlink to
        
     Hyperlink Features:
         - Uses Excel's native HYPERLINK formula for compatibility
@@ -1395,25 +1361,22 @@ def add_logfile_hyperlink(report_path, log_path, sheet, ecu_type, setup_type):
         The hyperlink path should be relative to the Excel file location
         for portability across different systems and users.
     """
-    # Get the next available row in the sheet
-    row_no = sheet.max_row + 2
+    # Leave one empty row below the existing content
+    sheet_model.add_row([])
  
     # Set the text for the hyperlink
-    sheet.cell(row=row_no, column=1).value = "Log File:"  
+    sheet_model.add_row(["Log File:"])
  
     # Use Excel's =HYPERLINK() formula with the relative path
     if setup_type == ECUType.ELITE.value:
         hyperlink_formula = f'=HYPERLINK(".\Logs\{ecu_type}\{log_path}", "{log_path}")'
     else:
         hyperlink_formula = f'=HYPERLINK(".\Logs\{log_path}", "{log_path}")'
-    # Insert the hyperlink formula
-    sheet.cell(row=row_no + 1, column=1).value = hyperlink_formula
-   
-    # Set the font color of the hyperlink to blue
-    sheet.cell(row=row_no + 1, column=1).font = Font(color="0000FF")
+    # Insert the hyperlink formula with the font color of the hyperlink set to blue
+    sheet_model.add_row([hyperlink_formula], LINK)
 
 
-def generate_apps_start_end_time_report(ecu_type, sheet, process_timing_info, config):
+def generate_apps_start_end_time_report(ecu_type, sheet_model, process_timing_info, config):
     """
     Generates a detailed report of application initialization (Init/Up) times with visualization.
    
@@ -1423,7 +1386,7 @@ def generate_apps_start_end_time_report(ecu_type, sheet, process_timing_info, co
    
     Args:
         ecu_type (str): ECU type identifier for header and graph titles
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet for the report
+        sheet_model (SheetModel): Content of the iteration worksheet for the report
         process_timing_info (list): List of dictionaries containing process timing data
                                    Each dict should have 'process' and 'start_time_ms' keys
         config (dict): Test configuration for validation settings
@@ -1454,22 +1417,21 @@ def generate_apps_start_end_time_report(ecu_type, sheet, process_timing_info, co
         and full operational readiness, which is different from the overall
         startup time that includes system-level delays.
     """
-    # Create the header for the Excel sheet
-    start_row = create_header(sheet, ecu_type, config['Startup Order Judgement'], 'info_columns')
+    # Create the table for the Excel sheet
+    table = sheet_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'info_columns'))
 
-    for item in process_timing_info:
-        if item['start_time_ms']:
-            data_row = [item['process'], float(item['start_time_ms'])*1000,float(item['start_time_ms'])]
-            sheet.append(data_row)
+    with timed_phase('Excel Write'):
+        for item in process_timing_info:
+            if item['start_time_ms']:
+                data_row = [item['process'], float(item['start_time_ms'])*1000,float(item['start_time_ms'])]
+                table.append(data_row)
 
     # Plot the startup graph
-    plot_process_start_end_time_graph(ecu_type, process_timing_info, sheet, start_row)
-
-    # Format the Excel cells
-    format_excel_cells(sheet, start_row)
+    if report_charts:
+        plot_process_start_end_time_graph(ecu_type, process_timing_info, table)
 
 
-def generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet, dltstart_timestamps,  process_timing_info, application_startup_order, application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger):
+def generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet_model, dltstart_timestamps,  process_timing_info, application_startup_order, application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger):
     """
     Generates a comprehensive startup time analysis report for a single test iteration.
    
@@ -1480,7 +1442,7 @@ def generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet, dltst
     Args:
         ecu_type (str): ECU type identifier for headers and graph titles
         config (dict): Test configuration containing thresholds and validation settings
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet for the complete report
+        sheet_model (SheetModel): Content of the iteration worksheet for the complete report
         dltstart_timestamps (dict): Dictionary mapping application names to startup times
         process_timing_info (list): List of process initialization timing data
         application_startup_order (list): Expected startup order configuration
@@ -1518,22 +1480,19 @@ def generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet, dltst
         use for deep-dive analysis of specific test runs. It's complemented by
         summary reports that aggregate data across multiple iterations.
     """
-    # Create the header for the Excel sheet
-    start_row = create_header(sheet, ecu_type, config['Startup Order Judgement'], 'startup_time_columns')
+    # Create the table for the Excel sheet
+    table = sheet_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'startup_time_columns'))
 
-    # Write the data to the Excel sheet
-    write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, sheet, application_startup_order, config.get('Startup Order Judgement'), application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger)
+    # Write the data to the table
+    with timed_phase('Excel Write'):
+        write_data_to_excel(ecu_type, dltstart_timestamps, process_timing_info, table, application_startup_order, config.get('Startup Order Judgement'), application_startup_order_status_iteration, overall_IG_ON_cur_iteration, logger)
 
     # Plot the differences as a graph
-    plot_process_startup_time_graph(dltstart_timestamps, sheet, start_row, ecu_type, False)
-
-    # Format the Excel cells
-    format_excel_cells(sheet, start_row)
+    if report_charts:
+        # The startup order counts take the first row when the order is validated
+        plot_process_startup_time_graph(dltstart_timestamps, table, ecu_type, False, 3 if config.get('Startup Order Judgement') else 2)
 
-    generate_apps_start_end_time_report(ecu_type, sheet, process_timing_info, config)
-
-    # Adjust the column width of the Excel sheet
-    adjust_column_width(sheet, ecu_type, logger)
+    generate_apps_start_end_time_report(ecu_type, sheet_model, process_timing_info, config)
 
 
 def extract_and_sort_process_timestamps(process_Start_End_timestamps, ecu_type, logger):
@@ -2114,13 +2073,15 @@ def RCAR_ON_OFF_Relay(power_on_off_delay, logger):
         the 'usbrelay' utility to be installed and properly configured.
     """
     try:
-        logger.info("Turning OFF relay...")
-        subprocess.run(["usbrelay", "BITFT_1=0"])
-        time.sleep(float(power_on_off_delay))  #  delay
+        with timed_phase('Relay OFF'):
+            logger.info("Turning OFF relay...")
+            subprocess.run(["usbrelay", "BITFT_1=0"])
+            time.sleep(float(power_on_off_delay))  #  delay
 
-        logger.info("Turning ON relay...")
-        subprocess.run(["usbrelay", "BITFT_1=1"])
-        time.sleep(0.2)  #  delay
+        with timed_phase('Relay ON'):
+            logger.info("Turning ON relay...")
+            subprocess.run(["usbrelay", "BITFT_1=1"])
+            time.sleep(0.2)  #  delay
 
     except Exception as e:
         logger.error(f"Error executing usbrelay commands: {e}")
@@ -2186,20 +2147,22 @@ def power_ON_OFF_Relay(serial_port_relay, baudrate_relay, power_on_off_delay, lo
             logger.error(f"Failed to open serial port: {serial_port_relay}")
             return False
        
-        logger.info("Turning OFF relay...")
-        signal.write("AT+CH1=0".encode())   # Relay OFF
-        time.sleep(float(power_on_off_delay))  # Delay for power off
+        with timed_phase('Relay OFF'):
+            logger.info("Turning OFF relay...")
+            signal.write("AT+CH1=0".encode())   # Relay OFF
+            time.sleep(float(power_on_off_delay))  # Delay for power off
        
-        logger.info("Turning ON relay...")
-        signal.write("AT+CH1=1".encode())   # Relay ON
-        time.sleep(0.1)  # 100ms delay
+        with timed_phase('Relay ON'):
+            logger.info("Turning ON relay...")
+            signal.write("AT+CH1=1".encode())   # Relay ON
+            time.sleep(0.1)  # 100ms delay
     except Exception as e:
         logger.error(f"Failed to open serial port: {e}")
         return False
     return True
 
 
-def create_workBook(ecu_type, setup_type, iterations, config, logger):
+def create_workBook(ecu_type, setup_type, iterations, config, logger, appended=None):
     """
     Creates a comprehensive Excel workbook for startup time analysis reporting.
    
@@ -2212,14 +2175,31 @@ def create_workBook(ecu_type, setup_type, iterations, config, logger):
         setup_type (str): Test setup configuration type (e.g., 'Elite', 'PADAS')
         iterations (int): Number of test iterations to create sheets for
         config (dict): Test configuration containing validation and formatting settings
+        appended (dict): Loaded sidecar of the report the iterations are appended to
+                         (see load_appended_report), None for a new report
        
     Returns:
         tuple: 4-tuple containing:
             - report_file (Path): Full path to the Excel report file
-            - workbook (openpyxl.Workbook): Excel workbook object
-            - sheets (list): List of iteration worksheet objects
-            - summary_sheet (openpyxl.worksheet.worksheet.Worksheet): Summary worksheet object
+            - workbook (SpooledReport): Report spooling the finished sheets for finalize_reports
+            - sheets (list): Iteration sheets indexed by iteration, the sheets of an
+                             appended report first (None for its missing iterations)
+            - summary_sheet (ReportSheet): Summary sheet
            
+    Report Backend:
+        'Report Formats' (default ["xlsx"]) selects the files written for the report, any
+        of "xlsx", "csv", "json", "html" and "parquet" (see report_backends). Finished sheets are
+        spooled to a .spool file next to the report and the report files are written from
+        it by finalize_reports. With 'Streaming Report' (default) the xlsx workbook is a
+        StreamingWorkbook: every sheet is rendered from its SheetModel straight into a
+        write-only workbook, so only one sheet model is held in memory. With 'Streaming
+        Report' set to false a normal openpyxl Workbook holds all sheets until the save.
+       
+    Append Mode:
+        With an appended report the new report takes over its iteration sheets from the
+        sheet stores of the sidecar (see report_sidecar) without rebuilding them, the new
+        iteration sheets follow them and the report is named after all iterations.
+       
     Workbook Structure:
         1. Summary Sheet: Executive summary and cross-iteration analysis
         2. Iteration Sheets: Detailed analysis for each test run (GEN3_StartupTime_01, 02, etc.)
@@ -2229,7 +2209,7 @@ def create_workBook(ecu_type, setup_type, iterations, config, logger):
         Application_Startup_Time_{setup_type}_{ecu_type}_N{iterations}_{timestamp}.xlsx
        
     Professional Formatting:
-        - Removes gridlines from all sheets for clean presentation
+        - Gridlines are removed when the sheets are rendered (SheetModel.render)
         - Uses consistent naming conventions
         - Applies professional styling throughout
        
@@ -2247,16 +2227,18 @@ def create_workBook(ecu_type, setup_type, iterations, config, logger):
     Dependencies:
         - Requires add_appendix_sheet() function for documentation
         - Uses global current_timestamp for unique file naming
-        - Depends on openpyxl library for Excel operations
+        - Depends on report_backends for the report formats
        
     Note:
         This function creates the foundation for all startup time reporting.
         The returned workbook object is used throughout the analysis pipeline
         to generate comprehensive performance reports.
     """
+    # Iterations of an appended report come first
+    first_iteration = appended['next_iteration'] if appended else 0
     try:
         # Create the report file name based on the ECU type and current timestamp
-        reportName = f"Application_Startup_Time_{setup_type}_{ecu_type}_N{iterations}_{current_timestamp}.xlsx"
+        reportName = f"Application_Startup_Time_{setup_type}_{ecu_type}_N{first_iteration + iterations}_{current_timestamp}.xlsx"
        
         # Define the directory where the report will be saved
         report_dir = local_save_path
@@ -2280,20 +2262,23 @@ def create_workBook(ecu_type, setup_type, iterations, config, logger):
         return None, None, None
 
     try:
-        # Create a new Excel workbook
-        workbook = openpyxl.Workbook()
+        # Create the report, the finished sheets are spooled until the report files are written
+        workbook = SpooledReport(config.get('Report Formats', DEFAULT_REPORT_FORMATS), config.get('Streaming Report', True),
+                                 report_file.with_suffix('.spool'), appended['sheet_stores'] if appended else ())
 
-        # Get the active sheet in the workbook
-        summary_sheet = workbook.active
-
-        # Set the title of the sheet
-        summary_sheet.title = 'Summary'
+        # The Summary is the first sheet
+        summary_sheet = workbook.create_sheet(title='Summary')
 
         # Create a list to store the sheets
         sheets = []
 
+        # The stored sheets of the appended report are written from its sheet stores
+        for i in range(first_iteration):
+            title = appended['iteration_sheets'].get(i)
+            sheets.append(workbook.create_sheet(title=title) if title is not None else None)
+
         # Create each sheet and add it to the list
-        for i in range(1, iterations + 1):
+        for i in range(first_iteration + 1, first_iteration + iterations + 1):
             sheet_title = f"GEN3_StartupTime_{i:02d}"
             sheet = workbook.create_sheet(title=sheet_title)
             sheets.append(sheet)
@@ -2301,13 +2286,6 @@ def create_workBook(ecu_type, setup_type, iterations, config, logger):
 
         # Create sheet for Appendix
         add_appendix_sheet(workbook, ecu_type, config)
- 
-        # Remove gridlines from all the sheets in the workbook
-        for sheet_exl in sheets:
-            # Hide the grid lines in the sheet
-            sheet_exl.sheet_view.showGridLines = False
-
-        summary_sheet.sheet_view.showGridLines = False
        
         # Return the report file path, workbook object, and active sheet object
         return report_file, workbook, sheets, summary_sheet
@@ -2399,7 +2377,7 @@ def add_appendix_sheet(workbook, ecu_type, config):
     time analysis. It serves as a reference guide for report users.
    
     Args:
-        workbook (openpyxl.Workbook): Excel workbook to add the appendix sheet to
+        workbook (SpooledReport): Report to add the appendix sheet to
         ecu_type (str): ECU type identifier for header generation
         config (dict): Test configuration for formatting settings
        
@@ -2426,7 +2404,7 @@ def add_appendix_sheet(workbook, ecu_type, config):
     Formatting Features:
         - Removes gridlines for professional appearance
         - Applies consistent header styling
-        - Uses format_sheet() for professional cell formatting
+        - Column widths fit the content plus 2 characters padding
         - Maintains visual consistency with other worksheets
        
     Use Cases:
@@ -2442,134 +2420,49 @@ def add_appendix_sheet(workbook, ecu_type, config):
     """
     appendix_sheet = workbook.create_sheet(title='Appendix')
     # appendix_sheet.title = 'Appendix'
-    appendix_sheet.sheet_view.showGridLines = False
-    start_row = create_header(appendix_sheet, ecu_type, config['Startup Order Judgement'], 'startup_appendix')
+    appendix_model = SheetModel(width_padding=2, min_width=0)
+    table = appendix_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'startup_appendix'))
     for data_row in startup_field_descriptions:
-        appendix_sheet.append(data_row)
-    format_sheet(appendix_sheet, start_row, appendix_columns)
+        table.append(data_row)
+    workbook.render(appendix_sheet, appendix_model)
    
 
-def is_merged_cell(sheet, cell):
+def add_tool_timing_sheet(workbook, ecu_type, config):
     """
-    Checks if a given cell is part of a merged cell range in an Excel worksheet.
+    Creates the "Tool Timing" worksheet with the wall time of every tool phase.
    
-    This utility function determines whether a specific cell is part of any merged
-    cell range in the worksheet. This is important for formatting operations that
-    need to handle merged cells differently from regular cells.
+    The sheet shows where the bench time of the run went: relay power cycles, log
+    capture and conversion, log reading, the extractors, Excel writing and formatting,
+    plotting and the summary generation. The first table aggregates the phases, the
+    second lists every recorded phase of this ECU (and the phases shared by all ECUs)
+    per iteration in start order.
    
     Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to check
-        cell (openpyxl.cell.cell.Cell): Cell object to test for merge status
-       
-    Returns:
-        bool: True if the cell is part of a merged range, False otherwise
-       
-    Merge Detection:
-        - Uses the cell's coordinate (e.g., 'A1', 'B2') for identification
-        - Checks against all merged cell ranges in the worksheet
-        - Returns immediately upon finding a match
-       
-    Use Cases:
-        - Column width calculation (merged cells should be skipped)
-        - Cell formatting operations
-        - Content analysis and processing
-        - Layout optimization algorithms
-       
-    Example:
-        >>> cell = sheet['A1']
-        >>> if not is_merged_cell(sheet, cell):
-        ...     # Process individual cell
-        ...     process_cell_content(cell)
+        workbook (Report): Report to add the sheet to
+        ecu_type (str): ECU type whose phases are reported
+        config (dict): Test configuration for header settings
        
     Note:
-        This function is used by formatting and layout functions to ensure
-        proper handling of merged cells, which have different behavior than
-        regular cells in Excel operations.
-    """
-    return cell.coordinate in sheet.merged_cells
- 
-   
-def format_sheet(sheet, start_row, columns):
+        The workbook save is timed after this sheet has been written, it is only part of
+        the Tool_Timing_*.json file written at the end of the run.
     """
-    Applies comprehensive formatting to Excel worksheet with automatic column width adjustment.
-   
-    This function provides professional formatting for Excel worksheets including
-    cell styling, column width optimization, and content-based formatting rules.
-    It's specifically designed for appendix and documentation sheets.
-   
-    Args:
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet to format
-        start_row (int): Starting row number for formatting (1-based indexing)
-        columns (list): List of column header names for special formatting
-       
-    Formatting Features:
-        Column Headers:
-        - Light green background (B5E6A2) for visual distinction
-        - Bold font for emphasis
-        - Consistent border styling
-       
-        Regular Cells:
-        - Center alignment (horizontal and vertical)
-        - Consistent border styling throughout
-        - Professional appearance
-       
-        Column Width Optimization:
-        - Calculates optimal width based on content length
-        - Tracks maximum content length per column
-        - Excludes merged cells from width calculations
-        - Adds padding (2 characters) for readability
-       
-    Processing Logic:
-        1. Iterate through all rows starting from start_row
-        2. Skip empty rows to optimize processing
-        3. Track maximum content length per column
-        4. Apply formatting based on cell content type
-        5. Set optimal column widths based on content
-       
-    Width Calculation:
-        - Measures string length of cell content
-        - Maintains per-column maximum tracking
-        - Ignores merged cells to prevent width conflicts
-        - Applies consistent padding for visual appeal
-       
-    Use Cases:
-        - Appendix sheet formatting
-        - Documentation worksheet styling
-        - Reference table formatting
-        - Professional report presentation
-       
-    Note:
-        This function is optimized for documentation and reference sheets
-        where readability and professional appearance are priorities.
-    """
-    # Dictionary to track max length in each column
-    max_col_widths = {}
-    # Iterate over rows starting from start_row
-    for row in sheet.iter_rows(min_row=start_row, max_row=sheet.max_row):
-        # Skip empty rows
-        if all(cell.value is None for cell in row):
-            continue
-        for col_idx, cell in enumerate(row):
-
-            # Update max width tracking
-            if cell.value:
-                length = len(str(cell.value))
-                col_letter = get_column_letter(col_idx + 1)
-                if (col_letter not in max_col_widths or max_col_widths[col_letter] < length) and not is_merged_cell(sheet, cell):
-                   max_col_widths[col_letter] = length
-            if cell.value in columns:
-                cell.fill = PatternFill(start_color="B5E6A2", end_color="B5E6A2", fill_type="solid")
-                cell.font = Font(bold=True)
-                cell.border = border_style
-            else:
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = border_style
+    if phase_timer is None:
+        return
+    timing_model = SheetModel()
+
+    table = timing_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'tool_timing_summary_columns'))
+    for name, entry in phase_timer.summary(ecu_type).items():
+        table.append([name, entry['count'], round_decimal_half_up(entry['total'], 4),
+                      round_decimal_half_up(entry['average'], 4), round_decimal_half_up(entry['maximum'], 4)])
+
+    table = timing_model.add_table(create_table(ecu_type, config['Startup Order Judgement'], 'tool_timing_columns'))
+    for record in phase_timer.records(ecu_type):
+        table.append([record['iteration'] + 1 if record['iteration'] is not None else '-',
+                      record['ecu_type'] or 'All', record['phase'], record['thread'],
+                      round_decimal_half_up(record['start'], 4), round_decimal_half_up(record['duration'], 4)])
+
+    workbook.render(workbook.create_sheet(title='Tool Timing'), timing_model)
 
-    # Set the column widths based on content length
-    for col_letter, width in max_col_widths.items():
-        # Add a little extra space (2 or 3) for padding
-        sheet.column_dimensions[col_letter].width = width + 2
- 
 
 def create_dlp_files(ecu_config_list, setup_type, config):
     """
@@ -2734,21 +2627,25 @@ def capture_logs_from_dlt_viewer(log_file_name, dlt_file_name, project_file_name
 
     if sys.platform.startswith("win"):
         isPathSet = config['windows']['Is Environment Path Set']
-        if isPathSet:
-            subprocess.call([script_dir, "dlt-viewer.exe", str(timeout), log_file_name, dlt_file_name, project_file_name])
-        else:
-            dlt_viewer_path = config['windows']['DLT-Viewer Installed Path']
-            # dlt_viewer_path = os.path.join(dlt_viewer_path, "dlt-viewer.exe")
-            log_file_name = os.path.join(log_file_name)
-            logger.info(f"dlt_viewer_path: {dlt_viewer_path}")
-            logger.info(f"log_file_name : {log_file_name}")
-            # subprocess.call([r"dlt-viewer.bat", dlt_viewer_path + "\\", str(timeout), log_file_name])
-            subprocess.call([script_dir, dlt_viewer_path, str(timeout), log_file_name, dlt_file_name, project_file_name])
+        # dlt-viewer.bat captures and converts in one go
+        with timed_phase('Log Capture'):
+            if isPathSet:
+                subprocess.call([script_dir, "dlt-viewer.exe", str(timeout), log_file_name, dlt_file_name, project_file_name])
+            else:
+                dlt_viewer_path = config['windows']['DLT-Viewer Installed Path']
+                # dlt_viewer_path = os.path.join(dlt_viewer_path, "dlt-viewer.exe")
+                log_file_name = os.path.join(log_file_name)
+                logger.info(f"dlt_viewer_path: {dlt_viewer_path}")
+                logger.info(f"log_file_name : {log_file_name}")
+                # subprocess.call([r"dlt-viewer.bat", dlt_viewer_path + "\\", str(timeout), log_file_name])
+                subprocess.call([script_dir, dlt_viewer_path, str(timeout), log_file_name, dlt_file_name, project_file_name])
     elif sys.platform.startswith("linux"):
-        subprocess.run("timeout " + str(timeout) + " dlt-viewer -p "+project_file_name+" -l "+dlt_file_name+" -v", shell=True)
-        print("Converting *.dlt to *.txt...")
-        subprocess.run("dlt-viewer -c logs.dlt "+str(log_file_name), shell=True)
-        print("Conversion done, successfully...")
+        with timed_phase('Log Capture'):
+            subprocess.run("timeout " + str(timeout) + " dlt-viewer -p "+project_file_name+" -l "+dlt_file_name+" -v", shell=True)
+        with timed_phase('Log Conversion'):
+            print("Converting *.dlt to *.txt...")
+            subprocess.run("dlt-viewer -c logs.dlt "+str(log_file_name), shell=True)
+            print("Conversion done, successfully...")
 
     size = os.path.getsize(log_file_name)
     if size == 0:
@@ -2756,8 +2653,107 @@ def capture_logs_from_dlt_viewer(log_file_name, dlt_file_name, project_file_name
         return False
     return True
 
-       
-def process_log_file(i, ecu_type, setup_type, log_file_details, dlp_file, config, sheet, overall_IG_ON_iteration, process_start_times, process_times, application_startup_order,application_startup_order_status, logger):
+
+def add_iteration_results(i, ecu_type, setup_type, log_file_details, config, sheet, overall_IG_ON_iteration, process_start_times, process_times, application_startup_order, application_startup_order_status, dltstart_timestamps, process_timing_info, logger):
+    """
+    Adds the timing data extracted from one ECU log to the run state and the iteration sheet.
+   
+    This is the part of the log processing that does not depend on the log file itself,
+    so it is shared by freshly processed logs and by iterations replayed from the
+    iteration journal of a resumed run.
+   
+    Args:
+        i (int): Current iteration index (0-based)
+        ecu_type (str): ECU type identifier (e.g., 'RCAR', 'SoC0', 'SoC1')
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        log_file_details (tuple): 3-tuple containing (filename, logfile, dltfile) paths
+        config (dict): Test configuration containing thresholds and validation settings
+        sheet (ReportSheet): Empty report sheet for this iteration
+        overall_IG_ON_iteration (dict): Dictionary to store overall startup times per iteration
+        process_start_times (dict): Dictionary to accumulate process initialization times
+        process_times (dict): Dictionary to accumulate process startup times
+        application_startup_order (list): Expected startup order configuration
+        application_startup_order_status (dict): Dictionary to store order validation results
+        dltstart_timestamps (OrderedDict): Application startup times in startup order
+        process_timing_info (list): Sorted Init(Up) time entries of the applications
+    """
+    filename, logfile, dltfile = log_file_details
+
+    application_startup_order_status[i] = {
+        'startup_order_status': True, #validate_app_startup_order(dltstart_timestamps, application_startup_order),
+        OrderFailureType.ORDER_MISMATCH.name: 0,
+        OrderFailureType.APPLICATION_NOT_FOUND.name: 0,
+        OrderFailureType.APPLICATION_NOT_CONFIGURED.name: 0
+    }
+
+    for item in process_timing_info:
+        # logger.info(f"Process: {item['process']} Start Timestamp: {item['start_clock']} End Timestamp: {item['end_clock']} start_time_ms: {item['start_time_ms']}")
+
+        # Check if the process is already in the process start times dictionary
+        process = item['process']
+        if process not in process_start_times:
+            # If the process is not in the dictionary, add it with an empty list
+            process_start_times[process] = []
+        # Append the start_time_ms to the process's list of start times    
+        process_start_times[process].append(round_decimal_half_up(item['start_time_ms'], 4))                      
+   
+    for process, process_time in dltstart_timestamps.items():
+        # Check if the process is already in the process times dictionary
+        if process not in process_times:
+            # If the process is not in the dictionary, add it with an empty list
+            process_times[process] = []
+        # Append the difference to the process's list of times
+        process_times[process].append(round_decimal_half_up(process_time, 4))
+   
+    overall_IG_ON_iteration[i] = {
+        'timestamp': max(dltstart_timestamps.values()),
+        'status': True,
+        'passed_count': 0
+    }
+    print ("overall_IG_ON_iteration:"+str(overall_IG_ON_iteration))
+
+    # Collect the content of the iteration sheet, it is written in one pass by render
+    sheet_model = SheetModel()
+
+    generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet_model, dltstart_timestamps, process_timing_info, application_startup_order, application_startup_order_status[i], overall_IG_ON_iteration[i], logger)
+
+    # Keep the startup times of the iteration for the cross-ECU report
+    if startup_timelines is not None:
+        startup_timelines.setdefault(ecu_type, {})[i] = dict(dltstart_timestamps)
+
+    # Keep the timings and verdicts of the iteration for the results database
+    if run_results is not None:
+        run_results.add_iteration(ecu_type, i, dltstart_timestamps, process_timing_info, threshold_map[ecu_type], OFFSET_TIME, overall_IG_ON_iteration[i], application_startup_order_status[i])
+   
+    # Add a hyperlink to the log file in the Excel sheet
+    add_logfile_hyperlink(filename, logfile, sheet_model, ecu_type, setup_type)
+
+    # The iteration sheet is complete
+    write_report_sheet(ecu_type, sheet, sheet_model)
+
+
+def write_report_sheet(ecu_type, sheet, sheet_model):
+    """
+    Writes a finished sheet to the report of the ECU and releases it.
+   
+    During the measurement the report is a SpooledReport (see create_workBook), the
+    sheet model is appended to its spool file. In finalize_reports the sheets are written
+    to the selected report formats, streaming xlsx reports flush them to their temporary
+    file right away.
+   
+    Args:
+        ecu_type (str): ECU type whose report the sheet belongs to
+        sheet (ReportSheet): Sheet of the ECU's report
+        sheet_model (SheetModel): Finished content of the sheet
+    """
+    workbook = workbook_map[ecu_type][1]
+    with timed_phase('Excel Render'):
+        workbook.render(sheet, sheet_model)
+    with timed_phase('Sheet Flush', ecu_type=ecu_type):
+        workbook.flush(sheet)
+
+
+def process_log_file(i, ecu_type, setup_type, log_file_details, dlp_file, config, sheet, overall_IG_ON_iteration, process_start_times, process_times, application_startup_order,application_startup_order_status, logger, capture_logs=True):
     """
     Processes a single ECU log file for one test iteration, extracting timing data and generating reports.
    
@@ -2771,12 +2767,14 @@ def process_log_file(i, ecu_type, setup_type, log_file_details, dlp_file, config
         log_file_details (tuple): 3-tuple containing (filename, logfile, dltfile) paths
         dlp_file (str): Path to DLT project file for log capture
         config (dict): Test configuration containing thresholds and validation settings
-        sheet (openpyxl.worksheet.worksheet.Worksheet): Excel worksheet for this iteration
+        sheet (ReportSheet): Report sheet for this iteration
         overall_IG_ON_iteration (dict): Dictionary to store overall startup times per iteration
         process_start_times (dict): Dictionary to accumulate process initialization times
         process_times (dict): Dictionary to accumulate process startup times
         application_startup_order (list): Expected startup order configuration
         application_startup_order_status (dict): Dictionary to store order validation results
+        capture_logs (bool): Whether to capture the log from the ECU first. False when the
+                             log file already exists (e.g. it was received from a bench agent)
        
     Returns:
         bool: True if processing completed successfully, False if any critical errors occurred
@@ -2821,97 +2819,226 @@ def process_log_file(i, ecu_type, setup_type, log_file_details, dlp_file, config
         This function is typically called in parallel threads for multi-ECU setups,
         enabling concurrent log processing and analysis across different ECU types.
     """
-    try:
-        # Get the log file path and name for the specified ECU type and timestamp
-        filename, logfile, dltfile = log_file_details
-        if not is_pre_gen_logs:
-            if not capture_logs_from_dlt_viewer(filename, dltfile, dlp_file, config, ecu_type, logger):
+    with timed_phase('Process Log File', i, ecu_type):
+        try:
+            # Get the log file path and name for the specified ECU type and timestamp
+            filename, logfile, dltfile = log_file_details
+            if capture_logs and not is_pre_gen_logs:
+                if not capture_logs_from_dlt_viewer(filename, dltfile, dlp_file, config, ecu_type, logger):
+                    return False
+
+            # Attempt to open the log file in read mode with error handling for encoding issues
+            try:
+                with timed_phase('Log File Read'), open(filename, 'r', encoding='utf-8', errors='ignore') as file:
+                    lines = file.readlines()
+                    time.sleep(2)
+            except FileNotFoundError:
+                logger.error(f"File not found: {filename}")
+                return False
+            except UnicodeDecodeError as e:
+                logger.error(f"Unicode decode error: {e}")
                 return False
 
-        # Attempt to open the log file in read mode with error handling for encoding issues
-        try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as file:
-                lines = file.readlines()
-                time.sleep(2)
-        except FileNotFoundError:
-            logger.error(f"File not found: {filename}")
-            return False
-        except UnicodeDecodeError as e:
-            logger.error(f"Unicode decode error: {e}")
-            return False
+            # Extract the welcome timestamp from the log fil
+            with timed_phase('Extract Welcome Timestamp'):
+                welcome_timestamp = extract_welcome_timestamp(lines)
 
-        # Extract the welcome timestamp from the log fil
-        welcome_timestamp = extract_welcome_timestamp(lines)
+            # Check if the welcome timestamp was found
+            if welcome_timestamp is None:
+                logger.error("KSAR Adaptive not found in log file")
+                return False
 
-        # Check if the welcome timestamp was found
-        if welcome_timestamp is None:
-            logger.error("KSAR Adaptive not found in log file")
-            return False
+            # Extract DLTStart timestamps for each application from the log file
+            with timed_phase('Extract DLTStart Timestamps'):
+                dltstart_timestamps = extract_dltstart_timestamps(lines, logger)
 
-        # Extract DLTStart timestamps for each application from the log file
-        dltstart_timestamps = extract_dltstart_timestamps(lines, logger)
+            # Check if the DLTStart timestamps were found
+            if not dltstart_timestamps or len(dltstart_timestamps)==0:
+                logger.error("Apps DLTStart time is not found in log file")
+                return False
+       
+            with timed_phase('Extract Init(Up) Timestamps'):
+                process_Start_End_timestamps = extract_process_timestamps(lines)
+            print ("process_Start_End_timestamp:"+str(process_Start_End_timestamps))
+            if not process_Start_End_timestamps or len(process_Start_End_timestamps)==0:
+                logger.error("Error: Unable to extract process timestamps.")
+                return False
 
-        # Check if the DLTStart timestamps were found
-        if not dltstart_timestamps or len(dltstart_timestamps)==0:
-            logger.error("Apps DLTStart time is not found in log file")
-            return False
+            with timed_phase('Sort Init(Up) Timestamps'):
+                process_timing_info = extract_and_sort_process_timestamps(process_Start_End_timestamps, ecu_type, logger)
+            print ("process_timing_info:"+str(process_timing_info))
        
-        application_startup_order_status[i] = {
-            'startup_order_status': True, #validate_app_startup_order(dltstart_timestamps, application_startup_order),
-            OrderFailureType.ORDER_MISMATCH.name: 0,
-            OrderFailureType.APPLICATION_NOT_FOUND.name: 0,
-            OrderFailureType.APPLICATION_NOT_CONFIGURED.name: 0
-        }
-       
-        process_Start_End_timestamps = extract_process_timestamps(lines)
-        print ("process_Start_End_timestamp:"+str(process_Start_End_timestamps))
-        if not process_Start_End_timestamps or len(process_Start_End_timestamps)==0:
-            logger.error("Error: Unable to extract process timestamps.")
+            if not process_timing_info:
+                logger.error("Error: No report data available.")
+                return False    
+
+            add_iteration_results(i, ecu_type, setup_type, log_file_details, config, sheet, overall_IG_ON_iteration, process_start_times, process_times, application_startup_order, application_startup_order_status, dltstart_timestamps, process_timing_info, logger)
+
+            # Checkpoint the extracted data so an interrupted run can be resumed
+            if iteration_journal is not None:
+                iteration_journal.record_ecu_result(i, ecu_type, log_file_details, dltstart_timestamps, process_timing_info)
+
+        except Exception as e:
+            logger.error(f"Exception :: {e}")
             return False
+        return True
+
 
-        process_timing_info = extract_and_sort_process_timestamps(process_Start_End_timestamps, ecu_type, logger)
-        print ("process_timing_info:"+str(process_timing_info))
+def process_iteration_log_files(i, setup_type, log_files_map, dlp_files, config, overall_IG_ON_iteration_map, process_start_times_map, process_times_map, application_startup_order_map, application_startup_order_status_map, logger, capture_logs=True):
+    """
+    Processes the log files of all ECUs for one iteration, one ResultThread per ECU.
+   
+    Args:
+        i (int): Current iteration index (0-based)
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        log_files_map (dict): ECU type -> (filename, logfile, dltfile) tuple of this iteration
+        dlp_files (dict): ECU type -> DLT project file used for the log capture
+        config (dict): Test configuration
+        overall_IG_ON_iteration_map (dict): ECU type -> overall startup times per iteration
+        process_start_times_map (dict): ECU type -> accumulated process initialization times
+        process_times_map (dict): ECU type -> accumulated process startup times
+        application_startup_order_map (dict): ECU type -> expected startup order configuration
+        application_startup_order_status_map (dict): ECU type -> order validation results per iteration
+        capture_logs (bool): Whether the logs still have to be captured from the ECUs
        
-        if not process_timing_info:
-            logger.error("Error: No report data available.")
-            return False    
+    Returns:
+        list: process_log_file result of every ECU, in workbook_map order
+    """
+    threads = []
+    for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
+        thread = ResultThread(
+            target=process_log_file,
+            args=(
+                i,
+                ecu_type,
+                setup_type,
+                log_files_map[ecu_type],
+                dlp_files[ecu_type],
+                config,
+                sheets[i],
+                overall_IG_ON_iteration_map[ecu_type],
+                process_start_times_map[ecu_type],
+                process_times_map[ecu_type],
+                application_startup_order_map[ecu_type],
+                application_startup_order_status_map[ecu_type],
+                logger
+             ),
+            kwargs={'capture_logs': capture_logs},
+            name=f"{ecu_type}-N{i + 1}"
+        )
+        threads.append(thread)
+        thread.start()
+
+    results = []
+    # Wait for all threads to complete
+    for thread in threads:
+        thread.join()
+        print("Thread result :: ", thread.result)
+        results.append(thread.result)
+
+    # The iteration is complete for every ECU, it will not be run again on resume
+    if iteration_journal is not None:
+        iteration_journal.record_iteration_done(i, dict(zip(workbook_map.keys(), results)))
+    return results
+
+
+def store_bench_agent_logs(i, setup_type, ecu_config_list, bench_result, logger):
+    """
+    Writes the logs returned by a bench agent into the Logs directory of this run.
+   
+    The logs are stored under the same names a local capture would have used, so the
+    report hyperlinks and a later re-run with 'Pre-Generated Logs' work unchanged.
+   
+    Args:
+        i (int): Iteration index (0-based) the agent has run
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        ecu_config_list (list): Enabled ECU configurations
+        bench_result (dict): 'iteration_result' message received from the agent
+       
+    Returns:
+        dict or None: ECU type -> (filename, logfile, dltfile) tuple, None if the agent
+                      reported a failure or a log is missing
+    """
+    if not bench_result.get('status'):
+        logger.error(f"Bench agent '{bench_result.get('bench')}' failed iteration {i + 1}: {bench_result.get('error')}")
+        return None
 
-        for item in process_timing_info:
-            # logger.info(f"Process: {item['process']} Start Timestamp: {item['start_clock']} End Timestamp: {item['end_clock']} start_time_ms: {item['start_time_ms']}")
-
-            # Check if the process is already in the process start times dictionary
-            process = item['process']
-            if process not in process_start_times:
-                # If the process is not in the dictionary, add it with an empty list
-                process_start_times[process] = []
-            # Append the start_time_ms to the process's list of start times    
-            process_start_times[process].append(round_decimal_half_up(item['start_time_ms'], 4))                      
-       
-        for process, process_time in dltstart_timestamps.items():
-            # Check if the process is already in the process times dictionary
-            if process not in process_times:
-                # If the process is not in the dictionary, add it with an empty list
-                process_times[process] = []
-            # Append the difference to the process's list of times
-            process_times[process].append(round_decimal_half_up(process_time, 4))
-       
-        overall_IG_ON_iteration[i] = {
-            'timestamp': max(dltstart_timestamps.values()),
-            'status': True,
-            'passed_count': 0
-        }
-        print ("overall_IG_ON_iteration:"+str(overall_IG_ON_iteration))
-
-        generate_apps_startup_report_from_QNX_startup(ecu_type, config, sheet, dltstart_timestamps, process_timing_info, application_startup_order, application_startup_order_status[i], overall_IG_ON_iteration[i], logger)
-       
-        # Add a hyperlink to the log file in the Excel sheet
-        add_logfile_hyperlink(filename, logfile, sheet, ecu_type, setup_type)
+    log_files_map = {}
+    for ecu_type in workbook_map:
+        if setup_type == ECUType.ELITE.value:
+            log_file_details = get_log_file_paths_for_elite(i, ecu_config_list, setup_type)[ecu_type]
+        else:
+            log_file_details = tuple(get_log_file_path(ecu_type, setup_type, i))
+        log = bench_result.get('logs', {}).get(ecu_type)
+        if log is None:
+            logger.error(f"Bench agent '{bench_result.get('bench')}' returned no log for {ecu_type} in iteration {i + 1}.")
+            return None
+        with open(log_file_details[0], 'w', encoding='utf-8') as file:
+            file.write(log['text'])
+        logger.info(f"Iteration {i + 1} of {ecu_type} received from bench agent '{bench_result.get('bench')}' ({log['name']})")
+        log_files_map[ecu_type] = log_file_details
+    return log_files_map
 
-    except Exception as e:
-        logger.error(f"Exception :: {e}")
-        return False
-    return True
+
+def replay_journaled_iteration(i, setup_type, ecu_results, config, overall_IG_ON_iteration_map, process_start_times_map, process_times_map, application_startup_order_map, application_startup_order_status_map, logger):
+    """
+    Rebuilds the state and the iteration sheets of one iteration from the iteration journal.
    
+    Args:
+        i (int): Iteration index (0-based) restored from the journal
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        ecu_results (dict): ECU type -> journaled 'ecu_result' record, None if the ECU failed
+        config (dict): Test configuration
+        overall_IG_ON_iteration_map (dict): ECU type -> overall startup times per iteration
+        process_start_times_map (dict): ECU type -> accumulated process initialization times
+        process_times_map (dict): ECU type -> accumulated process startup times
+        application_startup_order_map (dict): ECU type -> expected startup order configuration
+        application_startup_order_status_map (dict): ECU type -> order validation results per iteration
+       
+    Returns:
+        list: Restored processing result of every ECU of the iteration
+    """
+    results = []
+    for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
+        record = ecu_results.get(ecu_type)
+        if record is None:
+            results.append(False)
+            continue
+        add_iteration_results(i, ecu_type, setup_type, tuple(record['log_file_details']), config, sheets[i], overall_IG_ON_iteration_map[ecu_type], process_start_times_map[ecu_type], process_times_map[ecu_type], application_startup_order_map[ecu_type], application_startup_order_status_map[ecu_type], record['dltstart_timestamps'], record['process_timing_info'], logger)
+        results.append(True)
+    return results
+
+
+def load_appended_report(append_report, setup_type, ecu_type, logger):
+    """
+    Loads the result data of the report an append run extends.
+   
+    Args:
+        append_report (Path): Any file of the report (e.g. its .xlsx) or its folder
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        ecu_type (str): ECU type identifier
+       
+    Returns:
+        dict: Loaded sidecar (see load_report_sidecar), None if it is missing or invalid
+       
+    Note:
+        Only reports written with 'Appendable Report' have a sidecar. A report file
+        extends that report (the report of the same run for the other ECUs), a folder
+        the newest report of the ECU in it.
+    """
+    sidecar = find_report_sidecar(append_report, setup_type, ecu_type)
+    if sidecar is None:
+        logger.error(f"Error: No {setup_type} {ecu_type} report with result data (*{SIDECAR_SUFFIX}) found for 'Append Report' {append_report}.")
+        return None
+    try:
+        appended = load_report_sidecar(sidecar)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"Error: Reading the report result data {sidecar} failed: {e}")
+        return None
+    logger.info(f"Appending to {sidecar.name}: {len(appended['iteration_sheets'])} stored iteration sheet(s), new iterations start at {appended['next_iteration'] + 1}.")
+    return appended
+
+
 def save_workbook_and_generate_reports(ecu_type, summary_sheet, overall_IG_ON_iteration, process_times, process_start_times, application_startup_order_status, config, workbook, report_file, logger):
     """
     Finalizes Excel workbook with summary analysis and saves the complete test report.
@@ -2922,13 +3049,13 @@ def save_workbook_and_generate_reports(ecu_type, summary_sheet, overall_IG_ON_it
    
     Args:
         ecu_type (str): ECU type identifier for report headers and titles
-        summary_sheet (openpyxl.worksheet.worksheet.Worksheet): Summary worksheet to populate
+        summary_sheet (ReportSheet): Empty Summary sheet to render the summary to
         overall_IG_ON_iteration (dict): Dictionary mapping iteration index to overall startup times
         process_times (dict): Dictionary mapping process names to lists of startup times across iterations
         process_start_times (dict): Dictionary mapping process names to lists of initialization times
         application_startup_order_status (dict): Startup order validation results per iteration
         config (dict): Test configuration containing validation settings and parameters
-        workbook (openpyxl.Workbook): Complete Excel workbook object to save
+        workbook (Report): Complete report to save in the selected formats
         report_file (Path): Full path where the Excel report will be saved
        
     Returns:
@@ -2985,20 +3112,313 @@ def save_workbook_and_generate_reports(ecu_type, summary_sheet, overall_IG_ON_it
         logger.error("Error: Unable to create workbook.")
         return False
 
-    each_iteration_test_status(ecu_type, summary_sheet, overall_IG_ON_iteration, config, application_startup_order_status)
+    summary_model = SheetModel()
+
+    with timed_phase('Summary Iteration Status', ecu_type=ecu_type):
+        each_iteration_test_status(ecu_type, summary_model, overall_IG_ON_iteration, config, application_startup_order_status)
 
     # Export the average data to the Excel sheet
-    export_and_plot_average_data_to_excel(summary_sheet, ecu_type, process_times, process_start_times, config, logger)
+    with timed_phase('Summary Statistics', ecu_type=ecu_type):
+        # One set of statistics per sample matrix, shared by the averages and the distributions
+        startup_stats = summary_statistics(process_times)
+        start_time_stats = summary_statistics(process_start_times)
+        export_and_plot_average_data_to_excel(summary_model, ecu_type, startup_stats, start_time_stats, config, logger)
 
-    # Save the Excel workbook
-    workbook.save(report_file)
+    # Percentiles of every application across the iterations
+    with timed_phase('Summary Distributions', ecu_type=ecu_type):
+        add_distribution_summary(summary_model, ecu_type, startup_stats, start_time_stats, config)
 
-    #remove_png_files()        
+    # Record the stopping rule and the verdicts it was based on
+    add_early_stopping_summary(summary_model, ecu_type, config)
+
+    # Compare the distributions with the baseline run
+    add_regression_summary(summary_model, ecu_type, config)
+
+    with timed_phase('Excel Render', ecu_type=ecu_type):
+        workbook.render(summary_sheet, summary_model)
+
+    # Report where the tool spent its time so far, the save itself is only in the JSON file
+    add_tool_timing_sheet(workbook, ecu_type, config)
+
+    # Save the report in every selected format
+    with timed_phase('Workbook Save', ecu_type=ecu_type):
+        report_files = workbook.save(report_file)
 
     # logger. a success message
-    logger.info(f"Test report is created successfully {report_file}")
+    for file_path in report_files:
+        logger.info(f"Test report is created successfully {file_path}")
     return True      
 
+
+def finalize_ecu_report(ecu_type, report_state, report_file, results, config, logger):
+    """
+    Writes the complete report of one ECU from its spooled sheets and the result data.
+   
+    With 'Appendable Report' (default) the spool is converted to the sheet store of the
+    report and the result data is written to its sidecar (see report_sidecar).
+   
+    Args:
+        ecu_type (str): ECU type identifier
+        report_state (dict): SpooledReport.state() of the ECU's report
+        report_file (Path): Report file name, the extension is set per report format
+        results (tuple): (overall_IG_ON_iteration, process_times, process_start_times,
+                         application_startup_order_status) of the ECU
+        config (dict): Test configuration
+       
+    Returns:
+        bool: True if the report was written successfully
+    """
+    overall_IG_ON_iteration, process_times, process_start_times, application_startup_order_status = results
+    try:
+        with timed_phase('Report Replay', ecu_type=ecu_type):
+            workbook, sheets = open_spooled_report(report_state)
+        if not save_workbook_and_generate_reports(ecu_type, sheets['Summary'], overall_IG_ON_iteration, process_times,
+                                                  process_start_times, application_startup_order_status, config,
+                                                  workbook, report_file, logger):
+            return False
+    except Exception as e:
+        logger.error(f"Error: Writing the {ecu_type} report failed: {e}")
+        return False
+
+    # Keep the sheets and the result data, later runs can append iterations to the report
+    if config.get('Appendable Report', True):
+        try:
+            sidecar = write_report_sidecar(report_file, ecu_type, report_state, results)
+            logger.info(f"Report result data for appending written to {sidecar}")
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Error: Writing the {ecu_type} report result data failed: {e}")
+            return False
+    return True
+
+
+def run_report_process(ecu_type, report_state, report_file, results, config, run_state):
+    """
+    Entry point of a report finalization process (see finalize_reports).
+   
+    The process starts with a fresh interpreter, so the module state the report code
+    reads (thresholds, early stopping verdicts, regression comparison, chart setting,
+    tool timing) is restored from run_state first. Phases and trace spans are recorded
+    against the origin of the measurement process and returned to it.
+   
+    Args:
+        ecu_type (str): ECU type identifier
+        report_state (dict): SpooledReport.state() of the ECU's report
+        report_file (Path): Report file name
+        results (tuple): Result data of the ECU (see finalize_ecu_report)
+        config (dict): Test configuration
+        run_state (dict): Module state of the measurement process
+       
+    Returns:
+        dict: 'success', the own 'phases' records and the 'trace' export (None without trace)
+    """
+    global threshold_map, early_stopping_result, regression_result, report_charts, native_charts, chart_policy, chart_renderer, phase_timer, trace_recorder
+    threshold_map = run_state['threshold_map']
+    early_stopping_result = run_state['early_stopping_result']
+    regression_result = run_state['regression_result']
+    report_charts = run_state['report_charts']
+    native_charts = run_state['native_charts']
+    chart_policy = run_state['chart_policy']
+    # The reports of the ECUs are written in parallel already, the charts render in the report process
+    chart_renderer = ChartRenderer(max_workers=1, cache=run_state['chart_cache'])
+    phase_timer = PhaseTimer(run_state['timing_origin'], run_state['phases'])
+    trace_recorder = None
+    if run_state['trace_origin'] is not None:
+        trace_recorder = TraceRecorder(run_state['trace_origin'], process_name=f'{ecu_type} Report')
+    threading.current_thread().name = f'{ecu_type}-Report'
+    logger = setup_logging() if not logging.root.handlers else logging.getLogger(__name__)
+
+    success = finalize_ecu_report(ecu_type, report_state, report_file, results, config, logger)
+    return {
+        'success': success,
+        'phases': phase_timer.own_records(),
+        'trace': trace_recorder.export() if trace_recorder is not None else None
+    }
+
+
+def finalize_reports(finished_reports, config, logger):
+    """
+    Writes the reports of all ECUs, each ECU in its own process.
+   
+    Only the spool state and the result data of an ECU are passed to its process, so
+    the finalization (summary statistics, graphs, rendering and saving) takes as long as
+    the slowest ECU instead of the sum of all of them. A single report, or all reports on
+    a single CPU, is written in the measurement process itself, which saves the process
+    start-up.
+   
+    Args:
+        finished_reports (dict): ECU type -> (workbook, report_file, results) of the ECUs with results
+        config (dict): Test configuration
+       
+    Returns:
+        bool: True if every report was written successfully
+    """
+    if len(finished_reports) <= 1 or (os.cpu_count() or 1) <= 1:
+        return all(finalize_ecu_report(ecu_type, workbook.state(), report_file, results, config, logger)
+                   for ecu_type, (workbook, report_file, results) in finished_reports.items())
+
+    isSuccess = True
+    # A spawned process behaves the same on Windows and Linux and does not inherit the bench threads
+    with ProcessPoolExecutor(max_workers=min(len(finished_reports), os.cpu_count()), mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {}
+        for ecu_type, (workbook, report_file, results) in finished_reports.items():
+            run_state = {
+                'threshold_map': {ecu_type: threshold_map[ecu_type]},
+                'early_stopping_result': early_stopping_result,
+                'regression_result': regression_result,
+                'report_charts': report_charts,
+                'native_charts': native_charts,
+                'chart_policy': chart_policy,
+                'chart_cache': chart_renderer.cache,
+                'timing_origin': phase_timer.origin,
+                'phases': phase_timer.records(ecu_type),
+                'trace_origin': trace_recorder.origin if trace_recorder is not None else None
+            }
+            futures[ecu_type] = executor.submit(run_report_process, ecu_type, workbook.state(), report_file, results, config, run_state)
+        for ecu_type, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error: The {ecu_type} report process failed: {e}")
+                isSuccess = False
+                continue
+            phase_timer.add_records(result['phases'])
+            if result['trace'] is not None and trace_recorder is not None:
+                trace_recorder.add_process(result['trace'])
+            if not result['success']:
+                isSuccess = False
+    return isSuccess
+
+def add_cross_ecu_timeline(sheet_model, app_columns, ecu_label, title, apps, ecu_types, with_chart=True):
+    """
+    Adds the startup times of the applications of several ECUs and their Gantt chart to a sheet.
+   
+    Args:
+        sheet_model (SheetModel): Content of the sheet
+        app_columns (str): 'cross_ecu_columns' or 'cross_ecu_average_columns' (see create_table)
+        ecu_label (str): ECU types of the report for the table header
+        title (str): Title of the Gantt chart
+        apps (list): (ECU type, application, startup time from QNX startup (sec)) of every application
+        ecu_types (list): ECU types of the report, in legend order
+        with_chart (bool): False to leave the Gantt chart out
+       
+    Note:
+        The applications of all ECUs are sorted by their startup time from IG ON, so
+        the table and the chart read as one startup sequence of the whole system.
+    """
+    table = sheet_model.add_table(create_table(ecu_label, False, app_columns))
+    apps = sorted(apps, key=lambda app: app[2])
+    for ecu_type, process, process_time in apps:
+        table.append([ecu_type, process, process_time, float(process_time) + OFFSET_TIME])
+    if not report_charts or not with_chart or not apps:
+        return
+    if native_charts:
+        table.add_chart(partial(bar_chart, title, 'Time from IG ON (seconds)', 2, 4), 'F')
+        return
+    embed_chart(table, 'F', 'Cross-ECU', 'cross_ecu_gantt', title,
+                [(ecu_type, process, float(process_time) + OFFSET_TIME) for ecu_type, process, process_time in apps],
+                ecu_types, OFFSET_TIME)
+
+
+def write_cross_ecu_report(setup_type, finished_reports, config, logger):
+    """
+    Writes the cross-ECU report, the startup of all ECUs of the run on a common time base.
+   
+    All ECUs of an iteration are powered by the same relay, so IG ON is the same instant
+    for them. The application startup times of every ECU are counted from its QNX startup
+    (the time base of its DLT timestamps), which the ECU reports place OFFSET_TIME after
+    IG ON; adding OFFSET_TIME puts the applications of all ECUs on the time base from IG
+    ON. The report has a Summary sheet with the average startup times of the ECU reports
+    and one sheet per iteration of this run, each with a Gantt chart of the applications
+    of all ECUs colored by ECU.
+   
+    Args:
+        setup_type (str): Test setup type (e.g., 'ELITE')
+        finished_reports (dict): ECU type -> (workbook, report_file, results) of the ECUs with results
+        config (dict): Test configuration
+       
+    Returns:
+        bool: True if the report was written successfully
+       
+    Note:
+        Iterations of an appended report are in the averages only, their startup times
+        per iteration are not kept in the sidecar. With 'Chart Policy' 'summary' only the
+        average Gantt chart is rendered, the iteration charts of the other policies are
+        rendered with the report since it has no sheet store to defer them to.
+    """
+    ecu_types = list(finished_reports)
+    ecu_label = ', '.join(ecu_types)
+    iterations = sorted({i for ecu_type in ecu_types for i in startup_timelines.get(ecu_type, {})})
+    iteration_count = max(len(results[0]) for workbook, report_file, results in finished_reports.values())
+    report_file = local_save_path / f"Application_Startup_Time_{setup_type}_Cross_ECU_N{iteration_count}_{current_timestamp}.xlsx"
+    try:
+        report = create_report(config.get('Report Formats', DEFAULT_REPORT_FORMATS), config.get('Streaming Report', True))
+        summary_sheet = report.create_sheet('Summary')
+        sheets = {i: report.create_sheet(f"GEN3_StartupTime_{i + 1:02d}") for i in iterations}
+
+        # The sheet models are built first, so all Gantt charts render in parallel
+        summary_model = SheetModel()
+        # The averages of the Summary of every ECU report, computed the same way
+        averages = []
+        for ecu_type, (workbook, ecu_report_file, results) in finished_reports.items():
+            stats = summary_statistics(results[1])
+            averages.extend((ecu_type, process, avg_time)
+                            for process, avg_time in zip(stats['applications'], round_half_up(stats['mean'], 4).tolist()))
+        add_cross_ecu_timeline(summary_model, 'cross_ecu_average_columns', ecu_label,
+                               f'{ecu_label} Gantt Chart: Services/Applications Startup Time Average from IG ON', averages, ecu_types)
+        iteration_models = {}
+        for i in iterations:
+            apps = [(ecu_type, process, round_decimal_half_up(process_time, 4))
+                    for ecu_type in ecu_types for process, process_time in startup_timelines.get(ecu_type, {}).get(i, {}).items()]
+            iteration_models[i] = SheetModel()
+            add_cross_ecu_timeline(iteration_models[i], 'cross_ecu_columns', ecu_label,
+                                   f'{ecu_label} Gantt Chart: Services/Applications Startup Time from IG ON, Iteration {i + 1}',
+                                   apps, ecu_types, chart_policy != 'summary')
+
+        with timed_phase('Excel Render', ecu_type='Cross-ECU'):
+            report.render(summary_sheet, summary_model)
+            for i, sheet_model in iteration_models.items():
+                report.render(sheets[i], sheet_model)
+                report.flush(sheets[i])
+        with timed_phase('Workbook Save', ecu_type='Cross-ECU'):
+            report_files = report.save(report_file)
+    except Exception as e:
+        logger.error(f"Error: Writing the cross-ECU report failed: {e}")
+        return False
+
+    for file_path in report_files:
+        logger.info(f"Cross-ECU report is created successfully {file_path}")
+    return True
+
+
+def store_run_results(database, setup_type, run_config_hash, logger):
+    """
+    Adds the iterations measured by this run to the results database.
+   
+    Args:
+        database (Path or str): Results database file, created if missing
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        run_config_hash (str): config_hash of the run configuration
+       
+    Returns:
+        bool: True if the results of every ECU were stored
+       
+    Note:
+        Every ECU report is one run of the database (see results_warehouse), the
+        iterations of an appended report are not stored again.
+    """
+    try:
+        with ResultsWarehouse(database) as warehouse:
+            for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
+                iterations = run_results.iterations(ecu_type)
+                if iterations:
+                    run_id = warehouse.store_run(current_timestamp, setup_type, ecu_type, report_file.stem, run_config_hash, iterations)
+                    logger.info(f"Results of {len(iterations)} {ecu_type} iteration(s) stored as run {run_id} in {warehouse.path}")
+    except sqlite3.Error as e:
+        logger.error(f"Error: Storing the results in {database} failed: {e}")
+        return False
+    return True
+
+
 def start_startup_time_measurement(logger):
     """
     Main entry point for ECU startup time measurement and analysis system.
@@ -3071,14 +3491,33 @@ def start_startup_time_measurement(logger):
     global cur_dt_time_obj
     cur_dt_time_obj = datetime.now()
     global is_pre_gen_logs
-    global table_headers
-    table_headers = list()
     global local_save_path
+    local_save_path = None
     global workbook_map
     workbook_map = {}
     global threshold_map
     threshold_map = {}
     global current_timestamp
+    global iteration_journal
+    global phase_timer
+    phase_timer = PhaseTimer()
+    global trace_recorder
+    trace_recorder = None
+    global early_stopping_result
+    early_stopping_result = None
+    global regression_result
+    regression_result = None
+    global run_results
+    run_results = None
+    global startup_timelines
+    startup_timelines = None
+    global report_charts
+    global native_charts
+    global chart_policy
+    global chart_renderer
+    chart_renderer = ChartRenderer()
+    # Phases spanning the whole measurement, closed in the finally block
+    measurement_phases = ExitStack()
     # current_timestamp = '20250630_175500'
     current_timestamp = cur_dt_time_obj.strftime("%Y%m%d_%H%M%S")
 
@@ -3094,8 +3533,16 @@ def start_startup_time_measurement(logger):
         if config is None:
             logger.error(f"File 'config_file_path' not found.")
             return False
+
+        if config.get('Trace Output', False):
+            trace_recorder = TraceRecorder()
+        # Hashed before the ECU entries are resolved, so equal configuration files give equal hashes
+        run_config_hash = config_hash(config)
+        measurement_phases.enter_context(timed_phase('Startup Time Measurement'))
        
         is_pre_gen_logs = config.get('Pre-Generated Logs', False)
+        # 'Resume' is either the run folder to resume or true for the latest unfinished run with a journal
+        resume = config.get('Resume', False)
         if is_pre_gen_logs:
             logs_folder_path = config.get('logs-folder-path', Path(__file__).parents[0].joinpath("Pre-Generated_Logs"))
             logger.info(f"logs_folder_path: {logs_folder_path}")
@@ -3103,11 +3550,40 @@ def start_startup_time_measurement(logger):
                 logger.error("Error: 'logs-folder-path' is not configured in the configuration file.")
                 return False
             local_save_path = Path(logs_folder_path)
+        elif resume:
+            if isinstance(resume, str):
+                local_save_path = Path(resume)
+            else:
+                local_save_path = find_latest_run_folder(Path(__file__).parents[1].joinpath("Reports", "03_Startup_Time"))
+            if local_save_path is None or not local_save_path.is_dir():
+                logger.error("Error: No unfinished run folder found to resume.")
+                return False
         else:
             local_save_path = Path(__file__).parents[1].joinpath("Reports", "03_Startup_Time", cur_dt_time_obj.strftime("%Y%m%d_%H-%M-%S"))
             local_save_path.mkdir(parents=True, exist_ok=True)
-       
-        if not is_pre_gen_logs and config['windows']['DLT-Viewer Installed Path'] and not os.path.isfile(config['windows']['DLT-Viewer Installed Path']):
+
+        iteration_journal = IterationJournal(local_save_path)
+        run_record, completed_iterations = None, {}
+        if resume:
+            if not iteration_journal.exists():
+                logger.error(f"Error: No iteration journal found in {local_save_path} to resume from.")
+                return False
+            if iteration_journal.finished():
+                logger.error(f"Error: The run in {local_save_path} is finished, there is nothing to resume. Remove 'Resume' from the configuration to start a new run.")
+                return False
+            run_record, completed_iterations = iteration_journal.load(logger)
+            if run_record is not None:
+                # Keep the file names of the interrupted run
+                current_timestamp = run_record['timestamp']
+            logger.info(f"Resuming {local_save_path}: {len(completed_iterations)} finished iteration(s) found in the journal.")
+        elif iteration_journal.exists():
+            # A journal left by an earlier run on the same pre-generated logs
+            iteration_journal.path.unlink()
+       
+        # Iterations are run by remote bench agents instead of the local bench when agents are configured
+        bench_agents = [] if is_pre_gen_logs else config.get('Bench Agents', [])
+
+        if not is_pre_gen_logs and not bench_agents and config['windows']['DLT-Viewer Installed Path'] and not os.path.isfile(config['windows']['DLT-Viewer Installed Path']):
             logger.error("Configured dlt-viewer path is not valid.")
             return False
         # if config.get('Threshold', -1) < 0 or config.get('Threshold') > 100:
@@ -3123,6 +3599,79 @@ def start_startup_time_measurement(logger):
         except KeyError:
             logger.error("Error: 'Iterations' key not found in the configuration file.")
             return False
+
+        # Optional sequential test that ends the run once every threshold verdict is settled
+        stop_rule = EarlyStopping.from_config(config, logger)
+        if stop_rule is False:
+            return False
+
+        # Files written for each ECU report, e.g. ["xlsx", "csv"]
+        report_formats = config.get('Report Formats', DEFAULT_REPORT_FORMATS)
+        if not validate_report_formats(report_formats, logger):
+            return False
+        # The graphs are only shown in the xlsx report
+        report_charts = 'xlsx' in report_formats
+        # Native xlsx charts reference the table cells, no graph is rendered by the tool
+        native_charts = config.get('Native Charts', False)
+        if not isinstance(native_charts, bool):
+            logger.error("Error: 'Native Charts' must be true or false.")
+            return False
+        # Large runs render no iteration sheet graphs by default, deferred_charts adds them on demand
+        chart_policy = config.get('Chart Policy', 'deferred')
+        if chart_policy not in ('all', 'summary', 'deferred'):
+            logger.error("Error: 'Chart Policy' must be 'all', 'summary' or 'deferred'.")
+            return False
+        if chart_policy == 'deferred' and not config.get('Appendable Report', True):
+            logger.warning("'Chart Policy' 'deferred' needs the sheet store of 'Appendable Report', the iteration graphs are left out.")
+            chart_policy = 'summary'
+
+        # 'Chart Cache' is true for the default cache directory, a cache directory or false
+        chart_cache = config.get('Chart Cache', True)
+        if chart_cache is True:
+            chart_cache = DEFAULT_CHART_CACHE
+        elif chart_cache and not isinstance(chart_cache, str):
+            logger.error("Error: 'Chart Cache' must be true, false or the path of the cache directory.")
+            return False
+        chart_cache_size = config.get('Chart Cache Size (MB)', DEFAULT_CACHE_SIZE_MB)
+        if not isinstance(chart_cache_size, (int, float)) or chart_cache_size <= 0:
+            logger.error("Error: 'Chart Cache Size (MB)' must be a positive number.")
+            return False
+        if chart_cache and report_charts and not native_charts:
+            try:
+                # Unchanged charts of regenerated reports are taken from the cache
+                chart_renderer.cache = ChartCache(chart_cache, int(chart_cache_size * 1024 * 1024))
+            except OSError as e:
+                logger.warning(f"Chart cache {chart_cache} is not usable, all charts are rendered: {e}")
+
+        # One report with the startup of all ECUs on the time base from IG ON
+        cross_ecu_report = config.get('Cross-ECU Report', True)
+        if not isinstance(cross_ecu_report, bool):
+            logger.error("Error: 'Cross-ECU Report' must be true or false.")
+            return False
+
+        # 'Append Report' is a report (or its folder) the iterations of this run are appended to
+        append_report = config.get('Append Report', False)
+        if append_report and not isinstance(append_report, str):
+            logger.error("Error: 'Append Report' must be the path of a report or its folder.")
+            return False
+        # Index of the first iteration run, the iterations of an appended report come before it
+        first_iteration = None
+
+        # 'Results Database' is true for the default database, a database file or false
+        results_database = config.get('Results Database', True)
+        if results_database is True:
+            results_database = DEFAULT_DATABASE
+        elif results_database and not isinstance(results_database, str):
+            logger.error("Error: 'Results Database' must be true, false or the path of the database file.")
+            return False
+        if results_database:
+            run_results = RunResults()
+
+        # Optional comparison of the run with the distributions of a baseline run
+        regression_detector = RegressionDetector.from_config(config, logger)
+        if regression_detector is False:
+            return False
+        regression_baselines = {}
        
         duration = config.get("DLT-Viewer Log Capture Time")
         if not is_pre_gen_logs and not isinstance(duration, int):
@@ -3160,26 +3709,42 @@ def start_startup_time_measurement(logger):
             return False
 
         ecu_config_list = [ecu for ecu in config['ecu-config'] if ecu['ecu-type'] in enabled_ecu_list]
+        if cross_ecu_report and len(ecu_config_list) > 1:
+            startup_timelines = {}
         for ecu in ecu_config_list:
             if ecu['ecu-type'] == ECUType.PADAS.value:
                 ecu['ecu-type'] = ECUType.RCAR.value
-            if not is_pre_gen_logs:
-                if ecu['ecu-type'] == ECUType.RCAR.value:
-                    ecu['ip-address'] = config['ECU_setting']['RCAR_IPAddress']
-                elif ecu['ecu-type'] == ECUType.SoC0.value:
-                    ecu['ip-address'] = config['ECU_setting']['Qualcomm_SoC0_IPAddress']
-                elif ecu['ecu-type'] == ECUType.SoC1.value:
-                    ecu['ip-address'] = config['ECU_setting']['Qualcomm_SoC1_IPAddress']
-            workbook_map[ecu['ecu-type']] = tuple(create_workBook(ecu['ecu-type'], setup_type, iterations, config, logger))
+            if not is_pre_gen_logs and not bench_agents:
+                ecu['ip-address'] = resolve_ecu_ip_address(ecu['ecu-type'], config)
+            appended = None
+            if append_report:
+                appended = load_appended_report(Path(append_report), setup_type, ecu['ecu-type'], logger)
+                if appended is None:
+                    return False
+                if first_iteration is not None and appended['next_iteration'] != first_iteration:
+                    logger.error(f"Error: The {ecu['ecu-type']} report to append to has {appended['next_iteration']} iterations, the other ECU reports {first_iteration}.")
+                    return False
+                first_iteration = appended['next_iteration']
+            if regression_detector is not None:
+                # Loaded before the measurement, a missing baseline fails the run before it starts
+                regression_baselines[ecu['ecu-type']] = load_regression_baseline(config['Regression Baseline'], setup_type, ecu['ecu-type'], results_database, logger)
+                if regression_baselines[ecu['ecu-type']] is None:
+                    return False
+            workbook_map[ecu['ecu-type']] = tuple(create_workBook(ecu['ecu-type'], setup_type, iterations, config, logger, appended))
            
             # Check if the workbook creation was successful
             if workbook_map[ecu['ecu-type']][2] is None:
                 logger.error("Error: Unable to create workbook.")
                 return False
-            process_times_map[ecu['ecu-type']] = {}
-            process_start_times_map[ecu['ecu-type']] = {}
-            overall_IG_ON_iteration_map[ecu['ecu-type']] = {}
-            application_startup_order_status_map[ecu['ecu-type']] = {}
+            if appended is not None:
+                # The Summary covers the stored iterations, their results are extended by the new ones
+                (overall_IG_ON_iteration_map[ecu['ecu-type']], process_times_map[ecu['ecu-type']],
+                 process_start_times_map[ecu['ecu-type']], application_startup_order_status_map[ecu['ecu-type']]) = appended['results']
+            else:
+                process_times_map[ecu['ecu-type']] = {}
+                process_start_times_map[ecu['ecu-type']] = {}
+                overall_IG_ON_iteration_map[ecu['ecu-type']] = {}
+                application_startup_order_status_map[ecu['ecu-type']] = {}
             application_startup_order = []
             for block in ecu['startup-order']:
                 application_startup_order.append(tuple([block['Order Type'], [app.strip() for app in block['Applications'].split(',') if len(app.strip()) > 0]]))
@@ -3195,90 +3760,144 @@ def start_startup_time_measurement(logger):
                         threshold_map[ecu['ecu-type']][app.strip()] = threshold_config_grp.get('Threshold')
              
         logger.info(f"Threshold Map: {threshold_map}")
+        threshold_groups = build_threshold_groups(ecu_config_list)
 
-        # if config['ecu-config']['setup-type'] == ECUType.ELITE.value:
-        if not is_pre_gen_logs and not validate_ip_address(ecu_config_list, logger):
-            return False
-        dlp_files = create_dlp_files(ecu_config_list, setup_type, config)
-        if not is_pre_gen_logs and (not dlp_files or len(dlp_files) == 0):
+        # Iteration indices continue after the iterations of the appended report
+        finished_iterations = set()
+        if first_iteration is None:
+            first_iteration = 0
+        else:
+            finished_iterations.update(appended['iteration_sheets'])
+            iterations += first_iteration
+
+        if resume and run_record is not None and (run_record['setup_type'] != setup_type or set(run_record['ecu_types']) != set(workbook_map.keys())):
+            logger.error(f"Error: The journal was written for {run_record['setup_type']} {run_record['ecu_types']}, the configuration selects {setup_type} {list(workbook_map.keys())}.")
             return False
+        if not iteration_journal.exists():
+            iteration_journal.record_run(current_timestamp, setup_type, workbook_map.keys())
+
+        # Rebuild the state of the iterations that were finished before the run was interrupted
+        for i, ecu_results in completed_iterations.items():
+            if first_iteration <= i < iterations:
+                with timed_phase('Journal Replay', i):
+                    anySheet.extend(replay_journaled_iteration(i, setup_type, ecu_results, config, overall_IG_ON_iteration_map, process_start_times_map, process_times_map, application_startup_order_map, application_startup_order_status_map, logger))
+                finished_iterations.add(i)
+
+        stopped_early = stop_rule is not None and len(finished_iterations) > 0 and check_early_stopping(stop_rule, threshold_groups, process_times_map, finished_iterations, iterations, logger)
+        if stopped_early:
+            logger.info("Early stopping: the journaled or appended iterations already settle every verdict, no iteration is run.")
+        elif bench_agents:
+            # Logs are captured by the bench agents, no local DLT project files are needed
+            dlp_files = {ecu['ecu-type']: None for ecu in ecu_config_list}
+            coordinator = BenchCoordinator(bench_agents, setup_type, list(workbook_map.keys()), logger,
+                                           config.get('Bench Agent Timeout', DEFAULT_AGENT_TIMEOUT))
+            for i, bench_result in coordinator.run_iterations(i for i in range(first_iteration, iterations) if i not in completed_iterations):
+                log_files_map = store_bench_agent_logs(i, setup_type, ecu_config_list, bench_result, logger)
+                if log_files_map is None:
+                    anySheet.append(False)
+                    continue
+                anySheet.extend(process_iteration_log_files(i, setup_type, log_files_map, dlp_files, config, overall_IG_ON_iteration_map, process_start_times_map, process_times_map, application_startup_order_map, application_startup_order_status_map, logger, capture_logs=False))
+                finished_iterations.add(i)
+                if stop_rule is not None and check_early_stopping(stop_rule, threshold_groups, process_times_map, finished_iterations, iterations, logger):
+                    # Leaving the loop withdraws the iterations not yet started on the agents
+                    stopped_early = True
+                    break
+        else:
+            # if config['ecu-config']['setup-type'] == ECUType.ELITE.value:
+            if not is_pre_gen_logs and not validate_ip_address(ecu_config_list, logger):
+                return False
+            dlp_files = create_dlp_files(ecu_config_list, setup_type, config)
+            if not is_pre_gen_logs and (not dlp_files or len(dlp_files) == 0):
+                return False
 
-        # Loop through the iterations
-        for i in range(iterations):
+            # Loop through the iterations
+            for i in range(first_iteration, iterations):
+                if i in completed_iterations:
+                    continue
            
-            if not is_pre_gen_logs:
-                if setup_type == ECUType.RCAR.value:
-                    if not RCAR_ON_OFF_Relay(config.get('Power ON-OFF Delay', 25), logger):
-                        return False
-                else:
-                    if not power_ON_OFF_Relay(config.get('serial-port-relay'), config.get('baudrate-relay'), config.get('Power ON-OFF Delay', 25), logger):
-                        return False
+                if not is_pre_gen_logs:
+                    with timed_phase('Power Cycle', i):
+                        if setup_type == ECUType.RCAR.value:
+                            if not RCAR_ON_OFF_Relay(config.get('Power ON-OFF Delay', 25), logger):
+                                return False
+                        else:
+                            if not power_ON_OFF_Relay(config.get('serial-port-relay'), config.get('baudrate-relay'), config.get('Power ON-OFF Delay', 25), logger):
+                                return False
            
-            threads = []
-            for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
-                print("Thread: ", ecu_type, ": Started")
+                log_files_map = {}
+                for ecu_type in workbook_map:
+                    print("Thread: ", ecu_type, ": Started")
                
-                filename_list = {}
-                if not is_pre_gen_logs:
-                    if setup_type == ECUType.ELITE.value:
-                        filename_list = get_log_file_paths_for_elite(i, ecu_config_list, setup_type)
-                    else:
-                        filename_list[ecu_type] = tuple(get_log_file_path(ecu_type, setup_type, i))
-                else:
-                    filename_list[ecu_type] = extract_log_file_paths(i, ecu_type, setup_type, logger)
-                logger.info(f"Log files for {ecu_type} in iteration {i}: {filename_list}")
-                if any(not filename for (filename, logfile, dltfile) in filename_list.values()):
-                    if is_pre_gen_logs:
-                        logger.error(f"Log file not found for {ecu_type} in iteration {i}. Please check the configuration.")
+                    filename_list = {}
+                    if not is_pre_gen_logs:
+                        if setup_type == ECUType.ELITE.value:
+                            filename_list = get_log_file_paths_for_elite(i, ecu_config_list, setup_type)
+                        else:
+                            filename_list[ecu_type] = tuple(get_log_file_path(ecu_type, setup_type, i))
                     else:
-                        logger.error(f"Log file not created for {ecu_type} in iteration {i}. Please check the configuration.")
-                    return False
-                thread = ResultThread(
-                    target=process_log_file,
-                    args=(
-                        i,
-                        ecu_type,
-                        setup_type,
-                        filename_list[ecu_type],
-                        dlp_files[ecu_type],
-                        config,
-                        sheets[i],
-                        overall_IG_ON_iteration_map[ecu_type],
-                        process_start_times_map[ecu_type],
-                        process_times_map[ecu_type],
-                        application_startup_order_map[ecu_type],
-                        application_startup_order_status_map[ecu_type],
-                        logger
-                     )
-                )
-                threads.append(thread)
-                thread.start()
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
-                print("Thread result :: ", thread.result)
-                # if not thread.result:
-                anySheet.append(thread.result)
+                        filename_list[ecu_type] = extract_log_file_paths(i, ecu_type, setup_type, logger)
+                    logger.info(f"Log files for {ecu_type} in iteration {i}: {filename_list}")
+                    if any(not filename for (filename, logfile, dltfile) in filename_list.values()):
+                        if is_pre_gen_logs:
+                            logger.error(f"Log file not found for {ecu_type} in iteration {i}. Please check the configuration.")
+                        else:
+                            logger.error(f"Log file not created for {ecu_type} in iteration {i}. Please check the configuration.")
+                        return False
+                    log_files_map[ecu_type] = filename_list[ecu_type]
+
+                anySheet.extend(process_iteration_log_files(i, setup_type, log_files_map, dlp_files, config, overall_IG_ON_iteration_map, process_start_times_map, process_times_map, application_startup_order_map, application_startup_order_status_map, logger))
+                finished_iterations.add(i)
+                if stop_rule is not None and check_early_stopping(stop_rule, threshold_groups, process_times_map, finished_iterations, iterations, logger):
+                    stopped_early = True
+                    break
         print('anySheet:', anySheet)
+
+        # Iterations without results (e.g. every bench agent retired) fail the run, the report holds the finished ones
+        missing_iterations = [] if stopped_early else [i + 1 for i in range(first_iteration, iterations) if i not in finished_iterations]
+        if missing_iterations:
+            logger.error(f"Error: Iteration(s) {missing_iterations} were not run, the report contains the {len(finished_iterations)} finished iteration(s) only.")
+            isSuccess = False
+
+        if stopped_early or missing_iterations:
+            # Drop the sheets of the iterations that were not run and name the report after the iterations run
+            for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
+                for i in range(first_iteration, iterations):
+                    if i not in finished_iterations:
+                        workbook.remove(sheets[i])
+                report_file = report_file.with_name(report_file.name.replace(f"_N{iterations}_", f"_N{len(finished_iterations)}_"))
+                workbook_map[ecu_type] = (report_file, workbook, sheets, summary_sheet)
         if not any(anySheet):
             isSuccess = False
 
         # Save workbooks and generate reports for each ECU type
+        finished_reports = {}
         for ecu_type, (report_file, workbook, sheets, summary_sheet) in workbook_map.items():
             if len(overall_IG_ON_iteration_map[ecu_type]) > 0:
-                if not save_workbook_and_generate_reports(
-                    ecu_type,
-                    summary_sheet,
+                finished_reports[ecu_type] = (workbook, report_file, (
                     overall_IG_ON_iteration_map[ecu_type],
                     process_times_map[ecu_type],
                     process_start_times_map[ecu_type],
-                    application_startup_order_status_map[ecu_type],
-                    config,
-                    workbook,
-                    report_file,
-                    logger):
+                    application_startup_order_status_map[ecu_type]))
+        if regression_detector is not None and finished_reports:
+            with timed_phase('Regression Check'):
+                check_regression(regression_detector, regression_baselines, process_times_map, process_start_times_map, finished_reports, logger)
+        with timed_phase('Report Finalization'):
+            if not finalize_reports(finished_reports, config, logger):
+                isSuccess = False
+        if startup_timelines is not None and len(finished_reports) > 1:
+            with timed_phase('Cross-ECU Report'):
+                if not write_cross_ecu_report(setup_type, finished_reports, config, logger):
                     isSuccess = False
 
+        if run_results is not None:
+            with timed_phase('Results Database'):
+                if not store_run_results(results_database, setup_type, run_config_hash, logger):
+                    isSuccess = False
+
+        # A run whose reports are complete is closed, a failed one can still be resumed
+        if isSuccess:
+            iteration_journal.record_run_done()
+
     except KeyError as e:
         logger.error(f"Error: Missing expected key in ECU input fields: {e}")
         isSuccess = False
@@ -3286,7 +3905,16 @@ def start_startup_time_measurement(logger):
         logger.error(f"An error occurred: {e}")
         isSuccess = False
     finally:
-        remove_png_files(logger)
+        for ecu_type, entry in workbook_map.items():
+            if entry[1] is not None:
+                entry[1].discard()
+        chart_renderer.shutdown()
+        measurement_phases.close()
+        if local_save_path is not None and local_save_path.exists():
+            phase_timer.write_json(local_save_path / f"Tool_Timing_{current_timestamp}.json")
+            if trace_recorder is not None:
+                trace_recorder.write(local_save_path / f"Tool_Trace_{current_timestamp}.json")
+                logger.info(f"Chrome trace of the tool written to {local_save_path / f'Tool_Trace_{current_timestamp}.json'}")
         script_end_time = time.perf_counter()
         logger.info(f"Total script execution time: {(script_end_time-script_start_time):.3f} seconds")
     print("Final response :: ", isSuccess)
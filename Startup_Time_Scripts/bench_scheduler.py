@@ -0,0 +1,418 @@
+"""
+Multi-bench iteration scheduler for the startup time measurement.
+
+A coordinator (the normal tool run) spreads the requested iterations over several
+bench agents. Every agent drives one ECU bench with its own relay, performs the power
+cycle and the DLT log capture for the iterations it is given and sends the captured
+logs back. The coordinator stores the logs under its own Logs directory and processes
+them exactly like locally captured logs, so all benches end up in one report.
+
+Protocol:
+    Plain TCP, one UTF-8 encoded JSON object per line. Every request gets exactly one
+    response on the same connection.
+
+    {"type": "hello"}
+        -> {"type": "hello", "bench": <name>, "ecu_types": [...], "simulated_relay": bool}
+    {"type": "run_iteration", "iteration": <0-based index>, "setup_type": <str>, "ecu_types": [...]}
+        -> {"type": "iteration_result", "iteration": <index>, "bench": <name>,
+            "status": bool, "error": <str or null>, "logs": {<ecu_type>: {"name": <str>, "text": <str>}}}
+    {"type": "shutdown"}
+        -> {"type": "shutdown"}
+
+Usage (one agent per bench, or several local agents with simulated relays):
+    python -m Startup_Time_Scripts.bench_scheduler --port 5001 --simulate-relay --logs-folder <Pre-Generated_Logs>
+"""
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import argparse
+import tempfile
+import threading
+import socketserver
+from pathlib import Path
+
+
+DEFAULT_AGENT_PORT = 5001
+
+# Seconds the coordinator waits for one iteration result before giving up on an agent
+DEFAULT_AGENT_TIMEOUT = 900
+
+# Marker put on the result queue when an agent stops taking iterations
+_AGENT_RETIRED = object()
+
+
+def send_message(stream, message):
+    """
+    Writes one protocol message to a socket stream.
+
+    Args:
+        stream (io.BufferedIOBase): Writable binary stream created with socket.makefile('rwb')
+        message (dict): JSON serializable message
+    """
+    stream.write((json.dumps(message) + '\n').encode('utf-8'))
+    stream.flush()
+
+
+def receive_message(stream):
+    """
+    Reads one protocol message from a socket stream.
+
+    Args:
+        stream (io.BufferedIOBase): Readable binary stream created with socket.makefile('rwb')
+
+    Returns:
+        dict: Decoded message
+
+    Raises:
+        ConnectionError: If the peer closed the connection
+        ValueError: If the line is not valid JSON
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed by peer")
+    return json.loads(line.decode('utf-8'))
+
+
+def parse_agent_address(address):
+    """
+    Converts a configured agent address into a (host, port) tuple.
+
+    Args:
+        address (str or dict): "host:port", "port" or {"host": ..., "port": ...}
+
+    Returns:
+        tuple: (host, port)
+
+    Example:
+        >>> parse_agent_address("192.168.1.20:5002")
+        ('192.168.1.20', 5002)
+        >>> parse_agent_address({"port": 5003})
+        ('127.0.0.1', 5003)
+    """
+    if isinstance(address, dict):
+        return address.get('host', '127.0.0.1'), int(address.get('port', DEFAULT_AGENT_PORT))
+    address = str(address).strip()
+    if ':' in address:
+        host, port = address.rsplit(':', 1)
+        return host or '127.0.0.1', int(port)
+    return '127.0.0.1', int(address)
+
+
+class BenchCoordinator:
+    """
+    Hands out iteration indices to bench agents and collects their results.
+
+    Every agent is driven by its own thread over one persistent connection. Iterations
+    are taken from a shared queue, so a faster bench simply runs more iterations. If an
+    agent becomes unreachable its current iteration is put back on the queue for the
+    remaining agents and the agent is retired for the rest of the run.
+    """
+
+    def __init__(self, agent_addresses, setup_type, ecu_types, logger, timeout=DEFAULT_AGENT_TIMEOUT):
+        self.agent_addresses = [parse_agent_address(address) for address in agent_addresses]
+        self.setup_type = setup_type
+        self.ecu_types = list(ecu_types)
+        self.timeout = timeout
+        self.logger = logger
+
+    def run_iterations(self, iterations):
+        """
+        Runs the given iteration indices on the agents.
+
+        Args:
+            iterations (iterable): 0-based iteration indices to run
+
+        Yields:
+            tuple: (iteration, result) in completion order, where result is the
+                   'iteration_result' message returned by the agent
+
+        Note:
+            Iterations that could not be run because every agent was retired are not
+            yielded, the caller compares the yielded iterations with the requested ones.
+        """
+        pending = queue.Queue()
+        results = queue.Queue()
+        iterations = list(iterations)
+        for i in iterations:
+            pending.put(i)
+
+        workers = []
+        for host, port in self.agent_addresses:
+            worker = threading.Thread(target=self._drive_agent, args=(host, port, pending, results),
+                                      name=f"Bench-{host}:{port}", daemon=True)
+            workers.append(worker)
+            worker.start()
+
+        active_agents = len(workers)
+        remaining = len(iterations)
+        try:
+            while remaining > 0 and active_agents > 0:
+                item = results.get()
+                if item is _AGENT_RETIRED:
+                    active_agents -= 1
+                    continue
+                remaining -= 1
+                yield item
+        finally:
+            # Withdraw the iterations not started yet (the caller may stop early) and
+            # release the workers that are still waiting for an iteration
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in workers:
+                pending.put(None)
+            for worker in workers:
+                worker.join(timeout=5)
+
+        if remaining > 0:
+            self.logger.error(f"No bench agent left to run the remaining {remaining} iteration(s).")
+
+    def _drive_agent(self, host, port, pending, results):
+        """
+        Worker thread body: sends iterations to one agent until the queue is closed.
+        """
+        iteration = None
+        try:
+            with socket.create_connection((host, port), timeout=self.timeout) as sock:
+                stream = sock.makefile('rwb')
+                send_message(stream, {'type': 'hello'})
+                hello = receive_message(stream)
+                missing = [ecu for ecu in self.ecu_types if ecu not in hello.get('ecu_types', [])]
+                if missing:
+                    self.logger.error(f"Bench agent {host}:{port} does not serve {missing}, agent is not used.")
+                    results.put(_AGENT_RETIRED)
+                    return
+                self.logger.info(f"Bench agent '{hello.get('bench')}' connected on {host}:{port} "
+                                 f"(simulated relay: {hello.get('simulated_relay', False)})")
+
+                while True:
+                    iteration = pending.get()
+                    if iteration is None:
+                        send_message(stream, {'type': 'shutdown'})
+                        return
+                    self.logger.info(f"Iteration {iteration + 1} scheduled on bench agent {host}:{port}")
+                    send_message(stream, {
+                        'type': 'run_iteration',
+                        'iteration': iteration,
+                        'setup_type': self.setup_type,
+                        'ecu_types': self.ecu_types
+                    })
+                    response = receive_message(stream)
+                    results.put((iteration, response))
+                    iteration = None
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Bench agent {host}:{port} failed: {e}")
+            if iteration is not None:
+                # Give the interrupted iteration to another agent
+                pending.put(iteration)
+            results.put(_AGENT_RETIRED)
+
+
+class BenchAgent:
+    """
+    Runs iterations on one bench on behalf of a BenchCoordinator.
+
+    With simulate_relay the power cycle is only a delay and the "captured" logs are
+    taken from a pre-generated logs folder, which allows running several agents as
+    local processes without any hardware.
+    """
+
+    def __init__(self, name, config, logger, simulate_relay=False, logs_folder=None):
+        self.name = name
+        self.config = config
+        self.logger = logger
+        self.simulate_relay = simulate_relay
+        self.logs_folder = Path(logs_folder) if logs_folder else None
+        self.dlp_files = {}
+
+    def ecu_types(self):
+        """
+        Returns the ECU types this bench has enabled in its configuration.
+        """
+        ecu_setting = self.config.get('ECU_setting', {})
+        if ecu_setting.get('PADAS', {}).get('RCAR', False):
+            return ['RCAR']
+        return [board_type for board_type, enabled in ecu_setting.get('Elite', {}).items() if enabled]
+
+    def handle(self, request):
+        """
+        Dispatches one protocol request and returns the response message.
+        """
+        if request.get('type') == 'hello':
+            return {'type': 'hello', 'bench': self.name, 'ecu_types': self.ecu_types(),
+                    'simulated_relay': self.simulate_relay}
+        if request.get('type') == 'run_iteration':
+            return self.run_iteration(request['iteration'], request['setup_type'], request['ecu_types'])
+        return {'type': 'error', 'error': f"Unknown request type: {request.get('type')}"}
+
+    def run_iteration(self, i, setup_type, ecu_types):
+        """
+        Power cycles the bench and captures the logs of all requested ECUs for one iteration.
+
+        Args:
+            i (int): 0-based iteration index
+            setup_type (str): Setup type of the coordinator ('ELITE' or 'PADAS')
+            ecu_types (list): ECU types whose logs have to be returned
+
+        Returns:
+            dict: 'iteration_result' message
+        """
+        from Startup_Time_Scripts import Applications_StartupTime_IG_ON as startup
+
+        response = {'type': 'iteration_result', 'iteration': i, 'bench': self.name,
+                    'status': False, 'error': None, 'logs': {}}
+        power_on_off_delay = self.config.get('Power ON-OFF Delay', 25)
+
+        if self.simulate_relay:
+            self.logger.info("Turning OFF relay... (simulated)")
+            time.sleep(float(self.config.get('Simulated Relay Delay', 0)))
+            self.logger.info("Turning ON relay... (simulated)")
+        elif setup_type == startup.ECUType.RCAR.value:
+            if not startup.RCAR_ON_OFF_Relay(power_on_off_delay, self.logger):
+                response['error'] = "Relay power cycle failed"
+                return response
+        else:
+            if not startup.power_ON_OFF_Relay(self.config.get('serial-port-relay'), self.config.get('baudrate-relay'),
+                                              power_on_off_delay, self.logger):
+                response['error'] = "Relay power cycle failed"
+                return response
+
+        threads = {}
+        for ecu_type in ecu_types:
+            thread = startup.ResultThread(target=self.capture_log, args=(i, setup_type, ecu_type))
+            threads[ecu_type] = thread
+            thread.start()
+        for ecu_type, thread in threads.items():
+            thread.join()
+            if thread.result is None:
+                response['error'] = f"Log capture failed for {ecu_type}"
+                return response
+            response['logs'][ecu_type] = thread.result
+
+        response['status'] = True
+        return response
+
+    def capture_log(self, i, setup_type, ecu_type):
+        """
+        Captures (or, with a simulated relay, looks up) the log of one ECU.
+
+        Returns:
+            dict or None: {'name': log file name, 'text': log file content}, None on failure
+        """
+        from Startup_Time_Scripts import Applications_StartupTime_IG_ON as startup
+
+        if self.simulate_relay:
+            folder = self.logs_folder / "Logs"
+            if setup_type == startup.ECUType.ELITE.value:
+                folder = folder / ecu_type
+            log_files = startup.find_log_files_with_keywords(folder, [ecu_type, setup_type, f'N{i + 1}'], self.logger)
+            if not log_files:
+                self.logger.error(f"No pre-generated log found for {ecu_type} in iteration {i + 1}.")
+                return None
+            return self.read_log(log_files.pop())
+
+        dlp_file = self.dlp_file(setup_type, ecu_type)
+        # The capture is read into memory, its folder is removed once the log is read
+        with tempfile.TemporaryDirectory(prefix=f"bench_{ecu_type}_") as capture_dir:
+            basename = f"{self.name}_Startup_Time_Logs_{setup_type}_{ecu_type}_N{i + 1}"
+            log_file = Path(capture_dir) / f"{basename}.log"
+            dlt_file = str(Path(capture_dir) / f"{basename}.dlt")
+            if not startup.capture_logs_from_dlt_viewer(log_file, dlt_file, dlp_file, self.config,
+                                                        ecu_type, self.logger):
+                return None
+            return self.read_log(log_file)
+
+    @staticmethod
+    def read_log(log_file):
+        """
+        Returns the content of a log file as {'name': log file name, 'text': log file content}.
+        """
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as file:
+            return {'name': os.path.basename(log_file), 'text': file.read()}
+
+    def dlp_file(self, setup_type, ecu_type):
+        """
+        Returns the DLT project file of an ECU, creating the project files on first use.
+        """
+        from Startup_Time_Scripts import Applications_StartupTime_IG_ON as startup
+
+        if not self.dlp_files:
+            ecu_config_list = [{'ecu-type': ecu, 'ip-address': startup.resolve_ecu_ip_address(ecu, self.config)}
+                               for ecu in self.ecu_types()]
+            self.dlp_files = startup.create_dlp_files(ecu_config_list, setup_type, self.config)
+        return self.dlp_files[ecu_type]
+
+
+class _BenchAgentRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serves the requests of one coordinator connection.
+    """
+
+    def handle(self):
+        agent = self.server.agent
+        while True:
+            try:
+                request = receive_message(self.rfile)
+            except (ConnectionError, ValueError):
+                return
+            if request.get('type') == 'shutdown':
+                send_message(self.wfile, {'type': 'shutdown'})
+                return
+            try:
+                response = agent.handle(request)
+            except Exception as e:
+                agent.logger.error(f"Exception :: {e}")
+                response = {'type': 'iteration_result', 'iteration': request.get('iteration'),
+                            'bench': agent.name, 'status': False, 'error': str(e), 'logs': {}}
+            send_message(self.wfile, response)
+
+
+def serve_bench_agent(agent, host, port):
+    """
+    Serves a bench agent until interrupted. One coordinator connection is handled at a
+    time because a bench can only run one power cycle at a time.
+    """
+    with socketserver.TCPServer((host, port), _BenchAgentRequestHandler) as server:
+        server.agent = agent
+        agent.logger.info(f"Bench agent '{agent.name}' listening on {host}:{port}")
+        server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Command line entry point for running a bench agent.
+    """
+    from Startup_Time_Scripts import Applications_StartupTime_IG_ON as startup
+
+    parser = argparse.ArgumentParser(description="Startup time bench agent")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=DEFAULT_AGENT_PORT, help="Port to listen on")
+    parser.add_argument('--name', default=None, help="Bench name shown in the coordinator logs")
+    parser.add_argument('--config', default='startup_time_config.json', help="Bench configuration file")
+    parser.add_argument('--simulate-relay', action='store_true', help="Do not switch a relay, serve pre-generated logs")
+    parser.add_argument('--logs-folder', default=None, help="Pre-generated logs folder used with --simulate-relay")
+    args = parser.parse_args(argv)
+
+    logger = startup.setup_logging()
+    config = startup.load_config(args.config, logger)
+    if config is None:
+        return 1
+    if args.simulate_relay and not args.logs_folder:
+        logger.error("--logs-folder is required with --simulate-relay.")
+        return 1
+
+    agent = BenchAgent(args.name or f"bench-{args.port}", config, logger, args.simulate_relay, args.logs_folder)
+    try:
+        serve_bench_agent(agent, args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
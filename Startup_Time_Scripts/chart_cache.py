@@ -0,0 +1,140 @@
+"""
+Content-addressed cache of rendered charts.
+
+A chart is a pure function of its name and data (see chart_renderer), so the PNG of a
+chart is stored under a hash of both. Regenerating the reports of the same logs, e.g.
+after a threshold change, takes every unchanged chart from the cache instead of
+rendering it again.
+
+The key also covers the style of the charts: the source of the chart_renderer module
+and the matplotlib version, so a changed chart layout or a matplotlib update never
+returns an outdated image.
+
+The cache is a directory of '<key>.png' files bounded in size: a hit refreshes the
+modification time of its file, and when a new chart exceeds the bound the least
+recently used files are deleted. Several processes may share the directory, files are
+written to a temporary name first and replaced in one step.
+"""
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+
+import matplotlib
+
+from Startup_Time_Scripts import chart_renderer
+
+
+DEFAULT_CHART_CACHE = Path(__file__).parents[1].joinpath("Reports", "03_Startup_Time", "chart_cache")
+DEFAULT_CACHE_SIZE_MB = 256
+
+
+def style_key():
+    """
+    Returns the hash of everything besides the chart data that a rendered chart depends on.
+    """
+    digest = hashlib.sha256(Path(chart_renderer.__file__).read_bytes())
+    digest.update(matplotlib.__version__.encode())
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """
+    Directory of rendered charts with a least recently used size bound.
+
+    Args:
+        directory (Path or str): Cache directory, created if missing
+        max_bytes (int): Size bound of the cached files
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._style = style_key()
+        # Size of the cached files, counted on the first put
+        self._size = None
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Passed to report processes by its settings, the lock and the counters are per process
+        return ChartCache, (self.directory, self.max_bytes)
+
+    def key(self, chart, args):
+        """
+        Returns the cache key of a chart.
+
+        Args:
+            chart (str): Chart name (see chart_renderer.CHARTS)
+            args (tuple): Plain data of the chart
+
+        Returns:
+            str: Hex digest of the style, the chart name and its data
+        """
+        # repr keeps the full precision of the floats and tells numbers and strings apart
+        data = json.dumps([chart, args], default=repr, separators=(',', ':'))
+        return hashlib.sha256(f'{self._style}:{data}'.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the cached PNG of a key and marks it as recently used, None on a miss.
+        """
+        path = self.directory / f'{key}.png'
+        try:
+            png = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return png
+
+    def put(self, key, png):
+        """
+        Stores a rendered chart and evicts the least recently used charts beyond the size bound.
+        """
+        path = self.directory / f'{key}.png'
+        temporary_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            temporary_path.write_bytes(png)
+            # A chart another process cached meanwhile is replaced, only the difference is added
+            try:
+                replaced_size = path.stat().st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(temporary_path, path)
+        except OSError:
+            temporary_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._entries())
+            else:
+                self._size += len(png) - replaced_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith('.png')]
+
+    def _evict(self):
+        """
+        Deletes the least recently used charts until the cache is within 90 % of its bound.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        self._size = sum(size for mtime, size, path in entries)
+        # Evicting below the bound leaves room for the next charts without a scan each
+        for mtime, size, path in entries:
+            if self._size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self._size -= size
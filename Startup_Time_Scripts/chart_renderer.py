@@ -0,0 +1,451 @@
+"""
+Chart rendering in a pool of worker processes.
+
+The report graphs are rendered by worker processes from plain data (names, values and
+the label texts) and returned as PNG bytes, so the charts of all ECU threads render in
+parallel instead of one at a time behind a lock. Each chart is drawn on its own
+matplotlib Figure with the Agg canvas, no pyplot state is involved, so a renderer
+without worker processes (single CPU, report processes) can render in the calling
+thread as well.
+
+The timeline rows are drawn as one LineCollection and one scatter of the end markers
+from NumPy arrays instead of one line per application, and the value labels are left
+out of the tight layout, so the render time hardly grows with the number of
+applications.
+
+The size of a chart is bounded: a chart has at most MAX_CHART_ROWS rows, the rows of
+longer charts are split into pages (see chart_pages) that are rendered as separate
+charts sharing one x-axis range, and a time axis gets at most MAX_TICKS major ticks
+however far an outlier stretches it.
+
+Charts:
+    startup_timeline        Startup time from IG ON of every application, with the QNX
+                            startup reference (iteration sheets and Summary)
+    init_timeline           Init(Up) time of every application (iteration sheets)
+    average_init_timeline   Average Init(Up) time of every application (Summary)
+    cross_ecu_gantt         Startup of the applications of all ECUs on the common time
+                            base from IG ON (cross-ECU report)
+    distribution            Percentile box of every application across the iterations
+                            (Summary)
+"""
+import os
+import math
+import threading
+import multiprocessing
+from io import BytesIO
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+import matplotlib
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.ticker import MaxNLocator, MultipleLocator
+
+
+# Rows of one chart (12 inch high), the rows of longer charts are split into pages
+MAX_CHART_ROWS = 60
+# Major ticks of a time axis, more would overlap and cost a text extent each
+MAX_TICKS = 20
+
+
+def _figure(rows):
+    """
+    Returns a 12 inch wide figure, 0.2 inch high per row and at least 3 inch high.
+    """
+    return Figure(figsize=(12, figure_height(rows)))
+
+
+def figure_height(rows):
+    """
+    Returns the height in inches of a chart with a number of rows, bounded by MAX_CHART_ROWS.
+    """
+    return max(3, min(rows, MAX_CHART_ROWS) * 0.2)
+
+
+def _time_ticks(axes, step, min_x, max_x):
+    """
+    Sets the major ticks of the time axis every step, or at most MAX_TICKS ticks at round
+    values when an outlier stretches the axis too far for that step.
+    """
+    if (max_x - min_x) / step <= MAX_TICKS:
+        axes.xaxis.set_major_locator(MultipleLocator(step))
+    else:
+        axes.xaxis.set_major_locator(MaxNLocator(MAX_TICKS))
+
+
+def _title(title, page):
+    """
+    Returns the title of a chart page, e.g. 'Title (2/3)'.
+    """
+    return f'{title} ({page[0]}/{page[1]})' if page else title
+
+
+def _save(figure):
+    """
+    Returns the figure as PNG bytes.
+    """
+    buffer = BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def _draw_timeline(axes, starts, ends, rows, texts):
+    """
+    Draws one line with end markers and a value label per timeline row.
+
+    The rows get the colors of the default color cycle in order, as separate plot
+    calls would. All lines are one LineCollection and all markers one scatter.
+
+    Args:
+        axes (Axes): Axes to draw on
+        starts, ends (list): Start and end of every row on the x-axis
+        rows (list): Position of every row on the y-axis
+        texts (list): Label of every row, drawn above the middle of its line
+    """
+    starts, ends, rows = (np.asarray(values, dtype=float) for values in (starts, ends, rows))
+    cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+    colors = [cycle[i % len(cycle)] for i in range(len(rows))]
+    segments = np.stack([np.column_stack([starts, rows]), np.column_stack([ends, rows])], axis=1).reshape(-1, 2, 2)
+    axes.add_collection(LineCollection(segments, colors=colors, linewidths=matplotlib.rcParams['lines.linewidth'], zorder=2))
+    axes.scatter(np.concatenate([starts, ends]), np.concatenate([rows, rows]), c=colors * 2,
+                 s=matplotlib.rcParams['lines.markersize'] ** 2, zorder=2)
+    axes.autoscale_view()
+    # The labels stay inside the plot, leaving them out of the tight layout saves a text extent each
+    for x, y, text in zip((starts + ends) / 2, rows + 0.1, texts):
+        axes.text(x, y, text, verticalalignment='bottom', horizontalalignment='center', in_layout=False)
+
+
+def render_startup_timeline(ecu_type, apps, offset_time, avg_flag, page=None, x_range=None):
+    """
+    Renders the timeline of the startup times from IG ON.
+
+    Args:
+        ecu_type (str): ECU type identifier for the title
+        apps (list): (application, startup time from QNX startup (sec), label text) in display order
+        offset_time (float): Time from IG ON to the QNX startup (sec)
+        avg_flag (bool): True for the average times of the Summary, False for one iteration
+        page (tuple): (page, pages) of a chart split into pages, None for a whole chart
+        x_range (tuple): (minimum, maximum) startup time of all pages, None for the own apps
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(len(apps))
+    axes = figure.add_subplot()
+
+    # The first row is IG ON to QNX startup, each application a line from the QNX startup to its startup completion
+    differences = [difference for app, difference, text in apps]
+    _draw_timeline(axes, [0] + [offset_time] * len(apps), [offset_time] + [difference + offset_time for difference in differences],
+                   range(len(apps) + 1), [f"{offset_time} sec"] + [text for app, difference, text in apps])
+
+    axes.set_yticks(range(len(apps) + 1), ['Time from IG ON to QNX startup'] + [app for app, difference, text in apps])
+    axes.set_xlabel('Time Interval (seconds)')
+    axes.set_ylabel('Services or Applications')
+    if avg_flag:
+        axes.set_title(_title(f'{ecu_type} Timeline Graph: Services/Applications Startup Time Average', page), pad=20)
+    else:
+        axes.set_title(_title(f'{ecu_type} Timeline Graph: Services/Applications Startup Completion Time', page), pad=20)
+    axes.grid(True, axis='both', linestyle='--', linewidth=0.5, color='gray')
+    figure.tight_layout()
+
+    min_x = 0
+    max_x = (x_range[1] if x_range else max(differences, default=0)) + offset_time
+    padding = (max_x - min_x) * 0.015
+    _time_ticks(axes, 1, min_x, max_x)
+    axes.set_xlim(min_x - padding, max_x + padding)
+
+    # QNX startup label below the axis and reference line
+    axes.text(offset_time, -3.0, "QNX Startup", verticalalignment='top', horizontalalignment='center')
+    axes.axvline(x=offset_time, color='black', linestyle='--', linewidth=1)
+    return _save(figure)
+
+
+def render_init_timeline(ecu_type, processes, page=None, x_range=None):
+    """
+    Renders the timeline of the Init(Up) times of one iteration.
+
+    Args:
+        ecu_type (str): ECU type identifier for the title
+        processes (list): (process, Init(Up) time (ms), label text) in display order
+        page (tuple): (page, pages) of a chart split into pages, None for a whole chart
+        x_range (tuple): (minimum, maximum) Init(Up) time of all pages, None for the own processes
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(len(processes))
+    axes = figure.add_subplot()
+
+    _draw_timeline(axes, [0] * len(processes), [start_time_ms for process, start_time_ms, text in processes],
+                   range(len(processes)), [text for process, start_time_ms, text in processes])
+
+    axes.set_yticks(range(len(processes)), [process for process, start_time_ms, text in processes])
+    axes.set_xlabel('Time Interval (microseconds)')
+    axes.set_ylabel('Services or Applications')
+    axes.set_title(_title(f'{ecu_type} Timeline Graph:Services/Applications Init(Up) Time', page), pad=20)
+    axes.grid(True)
+    figure.tight_layout()
+
+    axes.set_xlim(-10, x_range[1] if x_range else max([start_time_ms for process, start_time_ms, text in processes], default=0))
+    return _save(figure)
+
+
+def render_average_init_timeline(ecu_type, apps, page=None, x_range=None):
+    """
+    Renders the timeline of the average Init(Up) times of the Summary.
+
+    Args:
+        ecu_type (str): ECU type identifier for the title
+        apps (list): (application, average Init(Up) time (ms), label text) in display order
+        page (tuple): (page, pages) of a chart split into pages, None for a whole chart
+        x_range (tuple): (minimum, maximum) average of all pages, None for the own apps
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(len(apps))
+    axes = figure.add_subplot()
+
+    _draw_timeline(axes, [0] * len(apps), [difference for app, difference, text in apps],
+                   range(1, len(apps) + 1), [text for app, difference, text in apps])
+
+    axes.set_yticks(range(1, len(apps) + 1), [app for app, difference, text in apps])
+    axes.set_xlabel('Time Interval (milliseconds)')
+    axes.set_ylabel('Services or Applications')
+    axes.set_title(_title(f'{ecu_type} Timeline Graph: Individual Services/Applications Startup Time Average', page), pad=20)
+    axes.grid(True, axis='both', linestyle='--', linewidth=0.5, color='gray')
+    figure.tight_layout()
+
+    min_x = 0
+    max_x = x_range[1] if x_range else max([difference for app, difference, text in apps], default=0)
+    padding = 3
+    # Ticks every 200 ms
+    _time_ticks(axes, 200, min_x, max_x)
+    axes.set_xlim(min_x - padding, max_x + padding)
+    return _save(figure)
+
+
+def render_cross_ecu_gantt(title, apps, ecu_types, offset_time, page=None, x_range=None):
+    """
+    Renders the startup of the applications of several ECUs as one Gantt chart.
+
+    Every application is a bar from the QNX startup of its ECU to its startup, on the
+    time base from IG ON shared by all ECUs of an iteration. The bars are drawn with one
+    barh call from arrays and colored per ECU.
+
+    Args:
+        title (str): Chart title
+        apps (list): (ECU type, application, startup time from IG ON (sec)) in display order, top to bottom
+        ecu_types (list): ECU types in legend order
+        offset_time (float): Time from IG ON to the QNX startup (sec)
+        page (tuple): (page, pages) of a chart split into pages, None for a whole chart
+        x_range (tuple): (minimum, maximum) startup time of all pages, None for the own apps
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(len(apps))
+    axes = figure.add_subplot()
+
+    cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+    ecu_colors = {ecu_type: cycle[i % len(cycle)] for i, ecu_type in enumerate(ecu_types)}
+    ends = np.array([time for ecu_type, app, time in apps], dtype=float)
+    rows = np.arange(len(apps))
+    axes.barh(rows, ends - offset_time, left=offset_time, height=0.6,
+              color=[ecu_colors[ecu_type] for ecu_type, app, time in apps])
+
+    axes.set_yticks(rows, [f'{app} ({ecu_type})' for ecu_type, app, time in apps])
+    # First application on top, as in a Gantt chart
+    axes.set_ylim(len(apps) - 0.5, -0.5)
+    axes.set_xlabel('Time from IG ON (seconds)')
+    axes.set_ylabel('Services or Applications')
+    axes.set_title(_title(title, page), pad=20)
+    axes.grid(True, axis='x', linestyle='--', linewidth=0.5, color='gray')
+    axes.axvline(x=offset_time, color='black', linestyle='--', linewidth=1)
+    axes.legend(handles=[Patch(color=color, label=ecu_type) for ecu_type, color in ecu_colors.items()],
+                loc='upper left', title='ECU')
+    figure.tight_layout()
+
+    max_x = max(x_range[1] if x_range else ends.max(initial=0), offset_time)
+    _time_ticks(axes, 1, 0, max_x)
+    axes.set_xlim(-max_x * 0.015, max_x * 1.015)
+    return _save(figure)
+
+
+def render_distribution(title, xlabel, apps, page=None, x_range=None):
+    """
+    Renders the distribution of a timing of every application across the iterations.
+
+    Every application is a box from its 25th to its 75th percentile with the median
+    marked, a whisker from the 5th to the 95th percentile and dots at the minimum and
+    maximum, so bimodal and long-tail applications stand out from the averages. All
+    boxes are one barh call, all whiskers one LineCollection and the markers two scatters.
+
+    Args:
+        title (str): Chart title
+        xlabel (str): Label of the time axis
+        apps (list): (application, minimum, P5, P25, median, P75, P95, maximum) in display order
+        page (tuple): (page, pages) of a chart split into pages, None for a whole chart
+        x_range (tuple): (minimum, maximum) of the values of all pages, None for the own apps
+
+    Returns:
+        bytes: PNG image
+    """
+    figure = _figure(len(apps))
+    axes = figure.add_subplot()
+
+    minimum, p5, p25, median, p75, p95, maximum = np.array([values for app, *values in apps], dtype=float).reshape(-1, 7).T
+    rows = np.arange(len(apps))
+    color = matplotlib.rcParams['axes.prop_cycle'].by_key()['color'][0]
+    axes.add_collection(LineCollection(np.stack([np.column_stack([p5, rows]), np.column_stack([p95, rows])], axis=1),
+                                       colors=color, linewidths=1, zorder=1))
+    axes.barh(rows, p75 - p25, left=p25, height=0.6, color=color, alpha=0.5, zorder=2)
+    axes.scatter(median, rows, marker='|', s=80, color='black', zorder=3)
+    axes.scatter(np.concatenate([minimum, maximum]), np.concatenate([rows, rows]), s=6, color='gray', zorder=3)
+    axes.autoscale_view()
+
+    axes.set_yticks(rows, [app for app, *values in apps])
+    axes.set_xlabel(xlabel)
+    axes.set_ylabel('Services or Applications')
+    axes.set_title(_title(title, page), pad=20)
+    axes.grid(True, axis='x', linestyle='--', linewidth=0.5, color='gray')
+    if x_range:
+        margin = (x_range[1] - x_range[0]) * matplotlib.rcParams['axes.xmargin']
+        axes.set_xlim(x_range[0] - margin, x_range[1] + margin)
+    axes.legend(handles=[Patch(color=color, alpha=0.5, label='P25 - P75'), Line2D([], [], color=color, label='P5 - P95'),
+                         Line2D([], [], color='black', marker='|', linestyle='', label='Median'),
+                         Line2D([], [], color='gray', marker='.', linestyle='', label='Min / Max')],
+                loc='lower right')
+    figure.tight_layout()
+    return _save(figure)
+
+
+# Chart -> (index of the row list in the chart arguments, values of a row spanning the x-axis)
+CHART_ROWS = {
+    'startup_timeline': (1, slice(1, 2)),
+    'init_timeline': (1, slice(1, 2)),
+    'average_init_timeline': (1, slice(1, 2)),
+    'cross_ecu_gantt': (1, slice(2, 3)),
+    'distribution': (2, slice(1, 8)),
+}
+
+
+def chart_pages(chart, args):
+    """
+    Splits a chart into pages of at most MAX_CHART_ROWS rows.
+
+    The pages are rendered as separate charts with the x-axis range of the whole chart,
+    so their bars can be compared, and are placed below each other in the sheet.
+
+    Args:
+        chart (str): Chart name (see CHARTS)
+        args (tuple): Plain data of the whole chart
+
+    Returns:
+        list: (args, options, row_offset) per page: the chart data of the page, the
+              keyword arguments of its render function and its sheet rows below the first page
+    """
+    index, values = CHART_ROWS[chart]
+    rows = args[index]
+    if len(rows) <= MAX_CHART_ROWS:
+        return [(args, {}, 0)]
+    row_values = np.array([row[values] for row in rows], dtype=float)
+    x_range = (float(row_values.min()), float(row_values.max()))
+    count = math.ceil(len(rows) / MAX_CHART_ROWS)
+    pages = []
+    for number in range(count):
+        page_rows = rows[number * MAX_CHART_ROWS:(number + 1) * MAX_CHART_ROWS]
+        # An image of the default 100 dpi covers 5 sheet rows of 20 pixels per inch, one row separates the pages
+        pages.append(((*args[:index], page_rows, *args[index + 1:]), {'page': (number + 1, count), 'x_range': x_range},
+                      number * (math.ceil(figure_height(MAX_CHART_ROWS) * 5) + 1)))
+    return pages
+
+
+CHARTS = {
+    'startup_timeline': render_startup_timeline,
+    'init_timeline': render_init_timeline,
+    'average_init_timeline': render_average_init_timeline,
+    'cross_ecu_gantt': render_cross_ecu_gantt,
+    'distribution': render_distribution,
+}
+
+
+def render_chart(chart, *args, **options):
+    """
+    Renders a chart by name, entry point of the worker processes.
+
+    Returns:
+        bytes: PNG image
+    """
+    return CHARTS[chart](*args, **options)
+
+
+class ChartRenderer:
+    """
+    Renders charts in a pool of worker processes, started with the first chart.
+
+    With max_workers of 1 or less the charts are rendered in the calling thread. With a
+    cache (see chart_cache) a chart rendered before is taken from it and every rendered
+    chart is added to it.
+    """
+
+    def __init__(self, max_workers=None, cache=None):
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.cache = cache
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, chart, *args, **options):
+        """
+        Starts rendering a chart.
+
+        Args:
+            chart (str): Chart name (see CHARTS)
+            args: Plain data of the chart, passed to its render function
+            options: Keyword arguments of the render function, e.g. the page (see chart_pages)
+
+        Returns:
+            Future: Resolves to the PNG bytes of the chart
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(chart, (args, options) if options else args)
+            png = self.cache.get(key)
+            if png is not None:
+                future = Future()
+                future.set_result(png)
+                return future
+        if self.max_workers <= 1:
+            future = Future()
+            try:
+                future.set_result(render_chart(chart, *args, **options))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            with self._lock:
+                if self._executor is None:
+                    # A spawned worker does not inherit the bench threads and behaves the same on Windows and Linux
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+                future = self._executor.submit(render_chart, chart, *args, **options)
+        if key is not None:
+            future.add_done_callback(partial(self._store, key))
+        return future
+
+    def _store(self, key, future):
+        """
+        Adds a rendered chart to the cache, failed and cancelled charts are not cached.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    def shutdown(self):
+        """
+        Stops the worker processes.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
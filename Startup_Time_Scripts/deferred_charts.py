@@ -0,0 +1,122 @@
+"""
+Adds the deferred graphs of the iteration sheets to a finished report.
+
+With 'Chart Policy' 'deferred' the iteration sheet graphs are not rendered during the
+run: every ReportTable keeps the chart name and data of its graph instead
+(ReportTable.defer_image), and the sheet models are kept in the sheet stores of the
+report sidecar. This command reads the stores back, renders the graphs in a pool of
+worker processes and embeds them at the anchors they would have had, so a large run
+only pays for the graphs somebody looks at.
+
+Usage:
+    python -m Startup_Time_Scripts.deferred_charts <report.xlsx> [--sheet TITLE ...] [--cache DIR | --no-cache]
+
+Sheets that already hold images are left as they are, so the command can be run again
+after an append run to render the graphs of the new iterations only.
+"""
+import os
+import sys
+import argparse
+from io import BytesIO
+from pathlib import Path
+
+import openpyxl
+from openpyxl.drawing.image import Image
+
+from Startup_Time_Scripts.chart_cache import ChartCache, DEFAULT_CHART_CACHE
+from Startup_Time_Scripts.chart_renderer import ChartRenderer
+from Startup_Time_Scripts.report_backends import read_sheet_store
+from Startup_Time_Scripts.report_sidecar import SIDECAR_SUFFIX, load_report_sidecar
+
+
+def load_deferred_charts(sidecar, titles=None):
+    """
+    Reads the deferred graphs of the sheets in the sheet stores of a report.
+
+    Args:
+        sidecar (Path): Sidecar of the report
+        titles (set): Only the sheets with these titles, None for all
+
+    Returns:
+        dict: Sheet title -> list of ((chart, args, options), anchor)
+    """
+    deferred = {}
+    for store in load_report_sidecar(sidecar)['sheet_stores']:
+        for title, model in read_sheet_store(store):
+            # A sheet copied by an append run is in several stores, the first copy is the one in the report
+            if title in deferred or (titles is not None and title not in titles):
+                continue
+            deferred[title] = model.deferred_images()
+    return {title: images for title, images in deferred.items() if images}
+
+
+def add_deferred_charts(report_file, titles=None, max_workers=None, cache=None):
+    """
+    Renders the deferred graphs of a report and embeds them in its xlsx file.
+
+    Args:
+        report_file (Path): xlsx report
+        titles (set): Only the sheets with these titles, None for all
+        max_workers (int): Number of render processes, None for one per CPU
+        cache (ChartCache): Cache of rendered charts, None to render every graph
+
+    Returns:
+        int: Number of embedded graphs
+
+    Raises:
+        OSError, ValueError, KeyError, TypeError: The report, its sidecar or a sheet store is missing or invalid
+    """
+    sidecar = report_file.with_name(report_file.stem + SIDECAR_SUFFIX)
+    deferred = load_deferred_charts(sidecar, titles)
+    workbook = openpyxl.load_workbook(report_file)
+    # Sheets that already have their graphs (earlier run of this command) are skipped
+    pending = {title: images for title, images in deferred.items()
+               if title in workbook.sheetnames and not workbook[title]._images}
+    if not pending:
+        return 0
+
+    renderer = ChartRenderer(max_workers, cache)
+    try:
+        # All graphs are submitted first so they render in parallel
+        futures = [(title, renderer.submit(chart, *args, **options), anchor)
+                   for title, images in pending.items() for (chart, args, options), anchor in images]
+        for title, future, anchor in futures:
+            workbook[title].add_image(Image(BytesIO(future.result())), anchor)
+    finally:
+        renderer.shutdown()
+
+    # The report is replaced only once it is completely written
+    temporary_file = report_file.with_name(report_file.name + '.tmp')
+    workbook.save(temporary_file)
+    os.replace(temporary_file, report_file)
+    return len(futures)
+
+
+def main(argv=None):
+    """
+    Command line entry point for adding the deferred graphs to a report.
+    """
+    parser = argparse.ArgumentParser(description="Add the deferred iteration graphs to a startup time report")
+    parser.add_argument('report', help="xlsx report of a run with 'Chart Policy' 'deferred'")
+    parser.add_argument('--sheet', action='append', default=None, help="Only this sheet, can be repeated")
+    parser.add_argument('--workers', type=int, default=None, help="Number of render processes")
+    parser.add_argument('--cache', default=str(DEFAULT_CHART_CACHE), help="Chart cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="Render every graph without the chart cache")
+    args = parser.parse_args(argv)
+
+    report_file = Path(args.report)
+    if not report_file.is_file():
+        print(f"Report {report_file} not found.", file=sys.stderr)
+        return 1
+    try:
+        cache = None if args.no_cache else ChartCache(args.cache)
+        count = add_deferred_charts(report_file, set(args.sheet) if args.sheet else None, args.workers, cache)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{count} graphs added to {report_file}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Sequential early stopping of the iteration loop.
+
+The verdict of the report is per iteration: an application fails an iteration when its
+total time from IG ON reaches its threshold. The stopping rule predicts these verdicts
+for the iterations that are still to run. After every finished iteration each
+threshold group is tested:
+
+- FAIL is settled as soon as an application of the group failed an iteration, no
+  later iteration can undo that verdict.
+- PASS is settled once, for every application of the group, the one-sided upper
+  prediction bound of its total time over all remaining iterations lies below the
+  threshold. The bound assumes normally distributed startup times. A long-tail
+  application has a large spread and so a high bound, and it keeps the run going.
+
+When every group of every ECU is settled the run stops. The error probability
+1 - confidence is split (Bonferroni) across the tested applications, the remaining
+iterations and every look at the data at which the run could stop. The repeated tests
+after each iteration therefore keep the overall error at most 1 - confidence. No
+PASS is decided before 'Min Iterations' results are available.
+"""
+import math
+import statistics
+from statistics import NormalDist
+
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MIN_ITERATIONS = 5
+# With fewer samples the variance estimate is too unreliable to stop on
+MIN_SUPPORTED_ITERATIONS = 3
+
+
+def t_two_sided_probability(t, df):
+    """
+    Returns P(|T| < t) for Student's t distribution with an integer number of degrees of freedom.
+
+    Uses the closed-form finite series of Abramowitz & Stegun 26.7.3 and 26.7.4, which is
+    exact for integer degrees of freedom and avoids a SciPy dependency.
+
+    Args:
+        t (float): Non-negative quantile
+        df (int): Degrees of freedom, at least 1
+
+    Returns:
+        float: Probability in [0, 1)
+    """
+    theta = math.atan(t / math.sqrt(df))
+    cos_sq = math.cos(theta) ** 2
+    if df % 2 == 1:
+        series, term = 1.0, 1.0
+        for k in range(3, df, 2):
+            term *= (k - 1) / k * cos_sq
+            series += term
+        correction = math.sin(theta) * math.cos(theta) * series if df > 1 else 0.0
+        return 2 / math.pi * (theta + correction)
+    series, term = 1.0, 1.0
+    for k in range(2, df - 1, 2):
+        term *= (k - 1) / k * cos_sq
+        series += term
+    return math.sin(theta) * series
+
+
+def t_quantile(p, df):
+    """
+    Returns the p quantile (p >= 0.5) of Student's t distribution.
+
+    Args:
+        p (float): Probability, 0.5 <= p < 1
+        df (int): Degrees of freedom, at least 1
+
+    Returns:
+        float: Quantile t such that P(T <= t) = p
+    """
+    target = 2 * p - 1
+    # The normal quantile is a lower bound, double the upper bound until it brackets the quantile
+    lower = upper = NormalDist().inv_cdf(p)
+    while t_two_sided_probability(upper, df) < target:
+        lower, upper = upper, upper * 2
+    for _ in range(100):
+        middle = (lower + upper) / 2
+        if t_two_sided_probability(middle, df) < target:
+            lower = middle
+        else:
+            upper = middle
+    return upper
+
+
+def upper_prediction_bound(values, probability):
+    """
+    Returns the one-sided upper t prediction bound of one future sample of normally distributed values.
+
+    Args:
+        values (list): Samples, at least two
+        probability (float): Probability that the future sample lies below the bound, 0.5 <= p < 1
+
+    Returns:
+        float: Bound mean + t(p, n - 1) * s * sqrt(1 + 1 / n)
+    """
+    n = len(values)
+    return statistics.fmean(values) + t_quantile(probability, n - 1) * statistics.stdev(values) * math.sqrt(1 + 1 / n)
+
+
+def build_threshold_groups(ecu_config_list):
+    """
+    Collects the configured threshold groups of the measured ECUs.
+
+    Args:
+        ecu_config_list (list): 'ecu-config' entries of the enabled ECUs
+
+    Returns:
+        dict: ECU type -> list of {'group', 'threshold', 'applications'} in configuration order
+    """
+    threshold_groups = {}
+    for ecu in ecu_config_list:
+        threshold_groups[ecu['ecu-type']] = [
+            {
+                'group': index + 1,
+                'threshold': group.get('Threshold'),
+                'applications': [app.strip() for app in group.get('Applications', '').split(',') if len(app.strip()) > 0]
+            }
+            for index, group in enumerate(ecu.get('threshold-config', []))
+        ]
+    return threshold_groups
+
+
+class EarlyStopping:
+    """
+    Stopping rule evaluated after every finished iteration.
+    """
+
+    def __init__(self, confidence=DEFAULT_CONFIDENCE, min_iterations=DEFAULT_MIN_ITERATIONS):
+        self.confidence = confidence
+        self.min_iterations = min_iterations
+
+    @classmethod
+    def from_config(cls, config, logger):
+        """
+        Creates the stopping rule from the 'Early Stopping' configuration.
+
+        Args:
+            config (dict): Test configuration
+
+        Returns:
+            EarlyStopping or None: The rule, None if early stopping is disabled
+            bool: False if the configuration is invalid
+        """
+        settings = config.get('Early Stopping', {})
+        if not settings.get('Enabled', False):
+            return None
+        confidence = settings.get('Confidence', DEFAULT_CONFIDENCE)
+        min_iterations = settings.get('Min Iterations', DEFAULT_MIN_ITERATIONS)
+        if not isinstance(confidence, (int, float)) or not 0 < confidence < 1:
+            logger.error("Error: 'Early Stopping' 'Confidence' must be in range (0, 1), e.g. 0.95.")
+            return False
+        if not isinstance(min_iterations, int) or min_iterations < MIN_SUPPORTED_ITERATIONS:
+            logger.error(f"Error: 'Early Stopping' 'Min Iterations' must be an integer of at least {MIN_SUPPORTED_ITERATIONS}.")
+            return False
+        return cls(confidence, min_iterations)
+
+    def looks(self, iterations):
+        """
+        Returns the number of looks at the data at which a run of iterations can stop with a PASS.
+        """
+        return max(iterations - self.min_iterations, 1)
+
+    def describe(self):
+        """
+        Returns the stopping rule as text for the report.
+        """
+        return (f"Stop after at least {self.min_iterations} iterations when each threshold group either failed an "
+                f"iteration (FAIL) or the {self.confidence:.0%} upper prediction bound of the total time from IG ON of "
+                f"each of its applications over all remaining iterations lies below its threshold (PASS). The bound assumes normally "
+                f"distributed startup times, the error probability is split across the applications, the remaining "
+                f"iterations and the looks after every iteration (Bonferroni)")
+
+    def evaluate(self, threshold_groups, process_times_map, offset_time, remaining_iterations, looks):
+        """
+        Tests every threshold group against the startup times measured so far.
+
+        Args:
+            threshold_groups (dict): ECU type -> threshold groups (see build_threshold_groups)
+            process_times_map (dict): ECU type -> {application: [startup times (sec) per iteration]}
+            offset_time (float): IG ON to QNX startup offset added to the startup times
+            remaining_iterations (int): Iterations still to run if the run does not stop
+            looks (int): Looks at the data the error probability is split across (see looks)
+
+        Returns:
+            list: One dict per group with 'ecu_type', 'group', 'threshold', 'applications',
+                  'samples' (fewest samples of a measured application), 'failures' (failed
+                  application results), 'maximum' and 'bound' (upper prediction bound, None
+                  before 'Min Iterations' or with no iteration left) of the deciding
+                  application, 'verdict' ('PASS'/'FAIL', tentative while not settled, '-'
+                  without measurements) and 'settled'
+        """
+        measured = [(ecu_type, app) for ecu_type, groups in threshold_groups.items() for group in groups
+                    for app in group['applications'] if app in process_times_map.get(ecu_type, {})]
+        # Bonferroni: every tested application, remaining iteration and look gets an equal share of the error probability
+        future_probability = 1 - (1 - self.confidence) / (max(len(measured), 1) * max(remaining_iterations, 1) * looks)
+
+        verdicts = []
+        for ecu_type, groups in threshold_groups.items():
+            process_times = process_times_map.get(ecu_type, {})
+            for group in groups:
+                app_results = []
+                for app in group['applications']:
+                    times = [time + offset_time for time in process_times.get(app, [])]
+                    if not times:
+                        continue
+                    bound = None
+                    if remaining_iterations > 0 and len(times) >= max(self.min_iterations, 2):
+                        bound = upper_prediction_bound(times, future_probability)
+                    app_results.append({'samples': len(times), 'maximum': max(times), 'bound': bound,
+                                        'failures': sum(time >= group['threshold'] for time in times)})
+
+                verdict = {'ecu_type': ecu_type, 'group': group['group'], 'threshold': group['threshold'],
+                           'applications': group['applications'], 'samples': 0, 'failures': 0, 'maximum': None,
+                           'bound': None, 'verdict': '-', 'settled': False}
+                if app_results:
+                    failed = [result for result in app_results if result['failures'] > 0]
+                    if failed:
+                        # A failed iteration is final
+                        deciding, verdict['verdict'], verdict['settled'] = max(failed, key=lambda result: result['maximum']), 'FAIL', True
+                    else:
+                        # The application with the highest bound decides a PASS, with no iteration left the PASS is final
+                        deciding = max(app_results, key=lambda result: (result['bound'] if result['bound'] is not None else -math.inf, result['maximum']))
+                        verdict['verdict'] = 'PASS'
+                        verdict['settled'] = remaining_iterations == 0 or all(
+                            result['bound'] is not None and result['bound'] < group['threshold'] for result in app_results)
+                    verdict.update(samples=min(result['samples'] for result in app_results),
+                                   failures=sum(result['failures'] for result in app_results),
+                                   maximum=deciding['maximum'], bound=deciding['bound'])
+                verdicts.append(verdict)
+        return verdicts
+
+    def is_settled(self, verdicts, completed_iterations):
+        """
+        Returns True if the run can stop after completed_iterations iterations.
+
+        Args:
+            verdicts (list): Result of evaluate
+            completed_iterations (int): Number of iterations with results
+
+        Returns:
+            bool: True if there is at least one group and every group is settled
+
+        Note:
+            A FAIL settles a group at once, but the run still stops only after
+            'Min Iterations' so the report shows a minimum of results.
+        """
+        return completed_iterations >= self.min_iterations and len(verdicts) > 0 and all(verdict['settled'] for verdict in verdicts)
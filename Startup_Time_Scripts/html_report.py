@@ -0,0 +1,177 @@
+"""
+Self-contained interactive HTML report.
+
+The report is a single HTML file: the table values of every sheet are embedded once as
+compact JSON and a small inline script builds the tables and draws the startup
+timelines as SVG in the browser. No raster image is rendered, the file needs no
+network access, and the timelines can be zoomed (mouse wheel, double-click resets)
+and show the exact values on hover.
+"""
+import html
+import json
+
+
+# Timelines drawn for a table name: the bar of a row spans 'start' to 'end', or
+# 'end' - 'duration' to 'end', or 0 to 'end'. 'threshold' marks the row's limit,
+# 'status' colors the bar (PASS/FAIL) and 'range' adds a min-max whisker.
+HTML_TIMELINES = {
+    'startup_time': {'label': 'Services/Applications', 'start': 'IG ON to QNX Startup (sec)',
+                     'end': 'Total Time from IG ON (sec)', 'threshold': 'Startup Time Threshold (sec)',
+                     'status': 'Startup time judgement', 'unit': 'sec', 'axis': 'Time from IG ON (sec)'},
+    'min_max_avg': {'label': 'Services/Applications', 'duration': 'Average (sec)',
+                    'end': 'Average from IG ON (sec)', 'threshold': 'Startup Time Threshold (sec)',
+                    'unit': 'sec', 'axis': 'Average time from IG ON (sec)'},
+    'info': {'label': 'Services/Applications', 'end': 'Init(Up) Time (ms)', 'unit': 'ms',
+             'axis': 'Init(Up) Time (ms)'},
+    'min_max_avg_individual': {'label': 'Services/Applications', 'end': 'Average (ms)',
+                               'range': ['Minimum (ms)', 'Maximum (ms)'], 'unit': 'ms',
+                               'axis': 'Average Init(Up) Time (ms)'},
+    'distribution': {'label': 'Services/Applications', 'start': 'P25 (sec)', 'end': 'P75 (sec)',
+                     'range': ['P5 (sec)', 'P95 (sec)'], 'unit': 'sec', 'axis': 'P25 - P75 and P5 - P95 from QNX Startup (sec)'},
+    'distribution_individual': {'label': 'Services/Applications', 'start': 'P25 (ms)', 'end': 'P75 (ms)',
+                                'range': ['P5 (ms)', 'P95 (ms)'], 'unit': 'ms', 'axis': 'P25 - P75 and P5 - P95 Init(Up) Time (ms)'},
+}
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>%(title)s</title>
+<style>
+body { font-family: Calibri, Arial, sans-serif; margin: 0; display: flex; }
+nav { position: sticky; top: 0; height: 100vh; overflow-y: auto; min-width: 190px; background: #eef2f7; padding: 8px; box-sizing: border-box; }
+nav a { display: block; padding: 3px 6px; color: #1f3b63; text-decoration: none; font-size: 14px; }
+nav a:hover { background: #9eb9da; }
+main { padding: 0 16px 40px; flex: 1; min-width: 0; }
+h1 { font-size: 20px; } h2 { font-size: 18px; border-bottom: 2px solid #9eb9da; } h3 { font-size: 15px; background: #9eb9da; padding: 4px 8px; }
+table { border-collapse: collapse; margin-bottom: 16px; font-size: 13px; }
+th { background: #b5e6a2; } th, td { border: 1px solid #777; padding: 2px 8px; text-align: center; }
+td.PASS { background: #92d050; } td.FAIL { background: #ff0000; }
+svg { width: 100%%; display: block; margin-bottom: 8px; } svg text { font-size: 11px; }
+</style>
+</head>
+<body>
+<nav id="nav"></nav>
+<main id="report"><h1>%(title)s</h1></main>
+<script id="report-data" type="application/json">%(data)s</script>
+<script>
+"use strict";
+const report = JSON.parse(document.getElementById('report-data').textContent);
+const NS = 'http://www.w3.org/2000/svg';
+function element(tag, attributes, text, ns) {
+  const node = ns ? document.createElementNS(ns, tag) : document.createElement(tag);
+  for (const key in attributes || {}) node.setAttribute(key, attributes[key]);
+  if (text !== undefined) node.textContent = text;
+  return node;
+}
+function number(value) { return typeof value === 'number' ? value : null; }
+function timeline(table, spec) {
+  const index = name => table.columns.indexOf(name);
+  const bars = [];
+  for (const row of table.rows) {
+    const end = number(row[index(spec.end)]);
+    if (end === null) continue;
+    let start = 0;
+    if (spec.start) start = number(row[index(spec.start)]) || 0;
+    if (spec.duration) start = end - (number(row[index(spec.duration)]) || 0);
+    bars.push({label: row[index(spec.label)], start: start, end: end,
+               threshold: spec.threshold ? number(row[index(spec.threshold)]) : null,
+               status: spec.status ? row[index(spec.status)] : null,
+               low: spec.range ? number(row[index(spec.range[0])]) : null,
+               high: spec.range ? number(row[index(spec.range[1])]) : null});
+  }
+  if (!bars.length) return null;
+  const full = Math.max(...bars.map(bar => Math.max(bar.end, bar.threshold || 0, bar.high || 0))) * 1.05 || 1;
+  const view = {from: 0, to: full};
+  const left = 230, right = 20, top = 10, rowHeight = 18, width = 1100;
+  const height = top + bars.length * rowHeight + 40;
+  const svg = element('svg', {viewBox: `0 0 ${width} ${height}`}, undefined, NS);
+  const x = value => left + (value - view.from) / (view.to - view.from) * (width - left - right);
+  function draw() {
+    svg.replaceChildren();
+    const clip = element('clipPath', {id: 'clip' + svg.dataset.id}, undefined, NS);
+    clip.appendChild(element('rect', {x: left, y: 0, width: width - left - right, height: height}, undefined, NS));
+    svg.appendChild(clip);
+    const plot = element('g', {'clip-path': `url(#clip${svg.dataset.id})`}, undefined, NS);
+    const step = Math.pow(10, Math.floor(Math.log10((view.to - view.from) / 5)));
+    const ticks = (view.to - view.from) / step > 10 ? step * 2 : step;
+    for (let tick = Math.ceil(view.from / ticks) * ticks; tick <= view.to; tick += ticks) {
+      plot.appendChild(element('line', {x1: x(tick), x2: x(tick), y1: top, y2: height - 30, stroke: '#ddd', 'stroke-dasharray': '4 3'}, undefined, NS));
+      svg.appendChild(element('text', {x: x(tick), y: height - 16, 'text-anchor': 'middle'}, +tick.toFixed(6), NS));
+    }
+    bars.forEach((bar, i) => {
+      const y = top + i * rowHeight + rowHeight / 2;
+      svg.appendChild(element('text', {x: left - 6, y: y + 4, 'text-anchor': 'end'}, bar.label, NS));
+      const color = bar.status === 'FAIL' ? '#e03131' : bar.status === 'PASS' ? '#2f9e44' : '#1c7ed6';
+      const line = element('line', {x1: x(bar.start), x2: x(bar.end), y1: y, y2: y, stroke: color, 'stroke-width': 6}, undefined, NS);
+      line.appendChild(element('title', {}, `${bar.label}: ${bar.start.toFixed(4)} - ${bar.end.toFixed(4)} ${spec.unit}` +
+        (bar.threshold !== null ? `, threshold ${bar.threshold} ${spec.unit}` : '') +
+        (bar.low !== null ? `, min ${bar.low} / max ${bar.high} ${spec.unit}` : ''), NS));
+      plot.appendChild(line);
+      if (bar.low !== null && bar.high !== null)
+        plot.appendChild(element('line', {x1: x(bar.low), x2: x(bar.high), y1: y, y2: y, stroke: '#333', 'stroke-width': 1}, undefined, NS));
+      if (bar.threshold !== null)
+        plot.appendChild(element('line', {x1: x(bar.threshold), x2: x(bar.threshold), y1: y - rowHeight / 2, y2: y + rowHeight / 2, stroke: '#e03131', 'stroke-width': 2}, undefined, NS));
+    });
+    svg.appendChild(plot);
+    svg.appendChild(element('text', {x: (left + width - right) / 2, y: height - 2, 'text-anchor': 'middle'}, spec.axis, NS));
+  }
+  svg.addEventListener('wheel', event => {
+    event.preventDefault();
+    const box = svg.getBoundingClientRect();
+    const at = view.from + ((event.clientX - box.left) / box.width * width - left) / (width - left - right) * (view.to - view.from);
+    const factor = event.deltaY < 0 ? 0.8 : 1.25;
+    view.from = Math.max(0, at - (at - view.from) * factor);
+    view.to = Math.min(full, at + (view.to - at) * factor);
+    draw();
+  });
+  svg.addEventListener('dblclick', () => { view.from = 0; view.to = full; draw(); });
+  svg.dataset.id = timeline.count = (timeline.count || 0) + 1;
+  draw();
+  return svg;
+}
+const main = document.getElementById('report'), nav = document.getElementById('nav');
+report.sheets.forEach((sheet, s) => {
+  nav.appendChild(element('a', {href: '#sheet' + s}, sheet.title));
+  const section = element('section', {id: 'sheet' + s});
+  section.appendChild(element('h2', {}, sheet.title));
+  for (const table of sheet.tables) {
+    section.appendChild(element('h3', {}, table.title));
+    const spec = report.timelines[table.name];
+    const chart = spec && timeline(table, spec);
+    if (chart) section.appendChild(chart);
+    const node = element('table');
+    const head = node.appendChild(element('tr'));
+    for (const column of table.columns) head.appendChild(element('th', {}, column));
+    for (const row of table.rows) {
+      const line = node.appendChild(element('tr'));
+      table.columns.forEach((column, c) => {
+        const value = row[c] === null || row[c] === undefined ? '' : row[c];
+        line.appendChild(element('td', value === 'PASS' || value === 'FAIL' ? {class: value} : {}, value));
+      });
+    }
+    section.appendChild(node);
+  }
+  main.appendChild(section);
+});
+</script>
+</body>
+</html>
+"""
+
+
+def render_html(title, sheets):
+    """
+    Returns the HTML report.
+
+    Args:
+        title (str): Report title, e.g. the report file name
+        sheets (list): Sheets as {'title', 'tables'} with tables as {'name', 'title', 'columns', 'rows'}
+
+    Returns:
+        str: Complete HTML document
+    """
+    data = json.dumps({'sheets': sheets, 'timelines': HTML_TIMELINES}, separators=(',', ':'))
+    # The JSON must not end the script element it is embedded in
+    data = data.replace('</', '<\\/')
+    return _TEMPLATE % {'title': html.escape(title), 'data': data}
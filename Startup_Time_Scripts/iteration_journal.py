@@ -0,0 +1,173 @@
+"""
+Durable per-iteration journal for checkpointing and resuming long startup time runs.
+
+Every ECU result of a finished iteration is appended to a JSON Lines journal in the
+run folder and flushed to disk immediately, followed by an 'iteration_done' record
+once all ECUs of the iteration were processed. After a crash the journal holds
+everything needed to rebuild the in-memory maps and the iteration sheets, so a
+resumed run only has to execute the iterations without an 'iteration_done' record.
+Once the reports of a run are written a final 'run_done' record closes the journal, a
+finished run is never resumed.
+
+Record types:
+    {"type": "run", "timestamp": ..., "setup_type": ..., "ecu_types": [...]}
+    {"type": "ecu_result", "iteration": i, "ecu_type": ..., "log_file_details": [...],
+     "dltstart_timestamps": [[app, seconds], ...], "process_timing_info": [...]}
+    {"type": "iteration_done", "iteration": i, "results": {<ecu_type>: bool}}
+    {"type": "run_done"}
+"""
+import os
+import json
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+
+JOURNAL_FILE_NAME = 'iteration_journal.jsonl'
+
+
+class IterationJournal:
+    """
+    Append-only journal of finished iterations.
+
+    Records are written by the per-ECU threads, so every append is serialized with a
+    lock and fsync'ed before the call returns.
+    """
+
+    def __init__(self, run_folder):
+        self.path = Path(run_folder) / JOURNAL_FILE_NAME
+        self._lock = threading.Lock()
+
+    def exists(self):
+        """
+        Returns True if the run folder already contains a journal.
+        """
+        return self.path.is_file() and self.path.stat().st_size > 0
+
+    def finished(self):
+        """
+        Returns True if the journal ends with the 'run_done' record of a finished run.
+        """
+        if not self.exists():
+            return False
+        with open(self.path, 'rb') as file:
+            # The 'run_done' record is the last line, the end of the file holds it
+            file.seek(max(0, file.seek(0, os.SEEK_END) - 256))
+            lines = file.read().splitlines()
+        try:
+            return bool(lines) and json.loads(lines[-1]).get('type') == 'run_done'
+        except (ValueError, AttributeError):
+            return False
+
+    def _append(self, record):
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(record) + '\n')
+                file.flush()
+                os.fsync(file.fileno())
+
+    def record_run(self, timestamp, setup_type, ecu_types):
+        """
+        Writes the run record identifying the run the journal belongs to.
+
+        Args:
+            timestamp (str): current_timestamp used in the log and report file names
+            setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+            ecu_types (list): ECU types measured in the run
+        """
+        self._append({'type': 'run', 'timestamp': timestamp, 'setup_type': setup_type,
+                      'ecu_types': list(ecu_types)})
+
+    def record_ecu_result(self, i, ecu_type, log_file_details, dltstart_timestamps, process_timing_info):
+        """
+        Writes the extracted timing data of one ECU for one iteration.
+
+        Args:
+            i (int): Iteration index (0-based)
+            ecu_type (str): ECU type identifier
+            log_file_details (tuple): (filename, logfile, dltfile) of the processed log
+            dltstart_timestamps (OrderedDict): Application -> startup time, in startup order
+            process_timing_info (list): Init(Up) time entries ({'process', 'start_time_ms'})
+        """
+        self._append({
+            'type': 'ecu_result',
+            'iteration': i,
+            'ecu_type': ecu_type,
+            'log_file_details': [str(item) if item is not None else None for item in log_file_details],
+            'dltstart_timestamps': [[process, value] for process, value in dltstart_timestamps.items()],
+            'process_timing_info': process_timing_info
+        })
+
+    def record_iteration_done(self, i, results):
+        """
+        Marks an iteration as finished for all ECUs.
+
+        Args:
+            i (int): Iteration index (0-based)
+            results (dict): ECU type -> processing result of the iteration
+        """
+        self._append({'type': 'iteration_done', 'iteration': i,
+                      'results': {ecu_type: bool(result) for ecu_type, result in results.items()}})
+
+    def record_run_done(self):
+        """
+        Closes the journal once the reports of the run are written, the run is not resumed anymore.
+        """
+        self._append({'type': 'run_done'})
+
+    def load(self, logger):
+        """
+        Reads the journal back.
+
+        A partly written last line (crash during the write) is ignored, as are ECU
+        results of iterations that never got their 'iteration_done' record.
+
+        Returns:
+            tuple: (run_record, completed_iterations) where run_record is the 'run' record
+                   (None if missing) and completed_iterations is an OrderedDict
+                   iteration -> {ecu_type: ecu_result record or None for failed ECUs}
+        """
+        run_record = None
+        latest_results = {}
+        completed_iterations = OrderedDict()
+        line = '\n'
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line_no, line in enumerate(file, start=1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring incomplete journal record in line {line_no} of {self.path.name}")
+                    continue
+                if record['type'] == 'run':
+                    run_record = run_record or record
+                elif record['type'] == 'ecu_result':
+                    record['dltstart_timestamps'] = OrderedDict(record['dltstart_timestamps'])
+                    latest_results[(record['iteration'], record['ecu_type'])] = record
+                elif record['type'] == 'iteration_done':
+                    i = record['iteration']
+                    completed_iterations[i] = {
+                        ecu_type: latest_results.get((i, ecu_type)) if result else None
+                        for ecu_type, result in record['results'].items()
+                    }
+        if not line.endswith('\n'):
+            # Terminate the partly written line so new records start on a line of their own
+            with self._lock, open(self.path, 'a', encoding='utf-8') as file:
+                file.write('\n')
+        return run_record, completed_iterations
+
+
+def find_latest_run_folder(reports_dir):
+    """
+    Returns the most recent run folder below reports_dir with the journal of an unfinished run.
+
+    Args:
+        reports_dir (Path): Folder holding the timestamped run folders (Reports/03_Startup_Time)
+
+    Returns:
+        Path or None: Run folder, None if no unfinished run has a journal
+    """
+    if not reports_dir.exists():
+        return None
+    run_folders = sorted((folder for folder in reports_dir.iterdir()
+                          if (folder / JOURNAL_FILE_NAME).is_file() and not IterationJournal(folder).finished()), reverse=True)
+    return run_folders[0] if run_folders else None
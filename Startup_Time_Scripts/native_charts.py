@@ -0,0 +1,54 @@
+"""
+Native Excel charts of the report tables.
+
+With 'Native Charts' enabled the timeline graphs are written as xlsx bar charts that
+reference the table cells next to them, instead of matplotlib images. Excel draws them
+when the sheet is opened: nothing is rendered while the report is written and the
+workbook holds a few hundred bytes of chart XML instead of a PNG per graph. The other
+report formats have no charts.
+
+The chart of a table is added as a factory (ReportTable.add_chart), called with the
+worksheet and the absolute rows of the charted table rows once the sheet layout is
+known. The factories are module functions bound with functools.partial, so sheet
+models holding them can be spooled, and are stored by the name of their function
+(NATIVE_CHARTS) in the sheet store of a report.
+"""
+from openpyxl.chart import BarChart, Reference
+
+
+def bar_chart(title, axis_title, label_column, value_column, sheet, first_row, last_row):
+    """
+    Creates a horizontal bar chart with one bar per table row, e.g. one per application.
+
+    Args:
+        title (str): Chart title
+        axis_title (str): Title of the value axis
+        label_column (int): Table column (1-based) with the bar labels
+        value_column (int): Table column (1-based) with the bar values
+        sheet (Worksheet or WriteOnlyWorksheet): Worksheet the table is written to
+        first_row, last_row (int): Worksheet rows (1-based) of the charted table rows
+
+    Returns:
+        BarChart: Chart referencing the table cells
+    """
+    chart = BarChart()
+    chart.type = 'bar'
+    chart.title = title
+    chart.legend = None
+    chart.y_axis.title = axis_title
+    chart.x_axis.title = 'Services or Applications'
+    # openpyxl hides the axes unless they are explicitly kept
+    chart.x_axis.delete = False
+    chart.y_axis.delete = False
+    chart.add_data(Reference(sheet, min_col=value_column, min_row=first_row, max_row=last_row), titles_from_data=False)
+    chart.set_categories(Reference(sheet, min_col=label_column, min_row=first_row, max_row=last_row))
+    # Same proportions as the matplotlib graphs: 12 inch wide, 0.2 inch per bar and at least 3 inch high
+    chart.width = 30.5
+    chart.height = max(7.6, (last_row - first_row + 1) * 0.51)
+    return chart
+
+
+# Chart functions by name, the sheet store of a report refers to them by name
+NATIVE_CHARTS = {
+    'bar_chart': bar_chart,
+}
@@ -0,0 +1,185 @@
+"""
+Regression detection against a baseline run.
+
+The fixed thresholds only catch startup times that cross them; a slowdown that stays
+below its threshold goes unnoticed. The startup times and Init(Up) times of every
+application of this run are therefore compared with those of a baseline run (a previous
+report with its result data sidecar, or a run stored in the results database).
+
+Each application and measure is tested with the two-sided Mann-Whitney U test, which
+needs no distribution assumption and is robust against single outliers. A shift is
+flagged when it is significant after a Bonferroni correction over all comparisons of
+the run and the medians differ by at least 'Min Shift (%)', so tiny but consistent
+differences of long runs are not reported.
+"""
+import math
+import statistics
+from statistics import NormalDist
+
+
+DEFAULT_SIGNIFICANCE = 0.05
+DEFAULT_MIN_SHIFT = 5.0
+DEFAULT_MIN_SAMPLES = 5
+# The test cannot reach any usual significance level with fewer samples
+MIN_SUPPORTED_SAMPLES = 3
+# Largest n1 * n2 of tie-free samples whose p-value is computed from the exact distribution
+EXACT_TEST_LIMIT = 10000
+
+# Measures compared per application: name, unit and index in the result data
+MEASURES = (('Startup Time', 'sec', 0), ('Init(Up) Time', 'ms', 1))
+
+
+def _u_distribution(n1, n2):
+    """
+    Returns the number of orderings of two tie-free samples that give each U = 0 .. n1 * n2.
+
+    The counts are the coefficients of the Gaussian binomial coefficient
+    [n1 + n2 over n1] = prod_{i=1..n1} (1 - q^(n2 + i)) / (1 - q^i).
+    """
+    counts = [1] + [0] * (n1 * n2)
+    for i in range(1, n1 + 1):
+        # Terms above n1 * n2 are dropped, the lower ones never depend on them
+        step = n2 + i
+        for k in range(len(counts) - 1, step - 1, -1):
+            counts[k] -= counts[k - step]
+        for k in range(i, len(counts)):
+            counts[k] += counts[k - i]
+    return counts
+
+
+def mann_whitney_u(baseline, current):
+    """
+    Two-sided Mann-Whitney U test.
+
+    The p-value is exact for small samples without ties and otherwise uses the normal
+    approximation with tie and continuity correction.
+
+    Args:
+        baseline (list): Samples of the baseline run
+        current (list): Samples of this run
+
+    Returns:
+        tuple: (U of the current samples, p-value)
+    """
+    n1, n2 = len(baseline), len(current)
+    values = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    # Average ranks of tied values
+    rank_sum, tie_term, position = 0.0, 0, 0
+    while position < len(values):
+        end = position
+        while end + 1 < len(values) and values[end + 1][0] == values[position][0]:
+            end += 1
+        rank = (position + end) / 2 + 1
+        rank_sum += rank * sum(1 for k in range(position, end + 1) if values[k][1] == 1)
+        ties = end - position + 1
+        tie_term += ties ** 3 - ties
+        position = end + 1
+    u = rank_sum - n2 * (n2 + 1) / 2
+
+    if tie_term == 0 and n1 * n2 <= EXACT_TEST_LIMIT:
+        counts = _u_distribution(n1, n2)
+        total = sum(counts)
+        u = int(u)
+        lower, upper = sum(counts[:u + 1]), sum(counts[u:])
+        return u, min(1.0, 2 * min(lower, upper) / total)
+
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    if sigma == 0:
+        return u, 1.0
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0) / sigma
+    return u, min(1.0, 2 * (1 - NormalDist().cdf(z)))
+
+
+class RegressionDetector:
+    """
+    Comparison of the measured distributions with those of a baseline run.
+    """
+
+    def __init__(self, significance=DEFAULT_SIGNIFICANCE, min_shift=DEFAULT_MIN_SHIFT, min_samples=DEFAULT_MIN_SAMPLES):
+        self.significance = significance
+        self.min_shift = min_shift
+        self.min_samples = min_samples
+
+    @classmethod
+    def from_config(cls, config, logger):
+        """
+        Creates the detector from the 'Regression Baseline' configuration.
+
+        Args:
+            config (dict): Test configuration
+
+        Returns:
+            RegressionDetector or None: The detector, None if the comparison is disabled
+            bool: False if the configuration is invalid
+        """
+        settings = config.get('Regression Baseline', {})
+        if not settings.get('Enabled', False):
+            return None
+        if bool(settings.get('Baseline Report')) == bool(settings.get('Baseline Run')):
+            logger.error("Error: 'Regression Baseline' needs exactly one of 'Baseline Report' and 'Baseline Run'.")
+            return False
+        significance = settings.get('Significance', DEFAULT_SIGNIFICANCE)
+        min_shift = settings.get('Min Shift (%)', DEFAULT_MIN_SHIFT)
+        min_samples = settings.get('Min Samples', DEFAULT_MIN_SAMPLES)
+        if not isinstance(significance, (int, float)) or not 0 < significance < 1:
+            logger.error("Error: 'Regression Baseline' 'Significance' must be in range (0, 1), e.g. 0.05.")
+            return False
+        if not isinstance(min_shift, (int, float)) or min_shift < 0:
+            logger.error("Error: 'Regression Baseline' 'Min Shift (%)' must be a non-negative number.")
+            return False
+        if not isinstance(min_samples, int) or min_samples < MIN_SUPPORTED_SAMPLES:
+            logger.error(f"Error: 'Regression Baseline' 'Min Samples' must be an integer of at least {MIN_SUPPORTED_SAMPLES}.")
+            return False
+        return cls(significance, min_shift, min_samples)
+
+    def describe(self):
+        """
+        Returns the detection rule as text for the report.
+        """
+        return (f"Two-sided Mann-Whitney U test per application and measure at {self.significance:g} significance "
+                f"(Bonferroni corrected), flagged when the medians differ by at least {self.min_shift:g}% "
+                f"(at least {self.min_samples} samples in both runs)")
+
+    def compare(self, baseline_map, current_map):
+        """
+        Compares every application and measure of every ECU with the baseline.
+
+        Args:
+            baseline_map (dict): ECU type -> (process_times, process_start_times) of the baseline
+            current_map (dict): ECU type -> (process_times, process_start_times) of this run,
+                                each {application: [values per iteration]}
+
+        Returns:
+            list: One dict per ECU, application and measure with 'ecu_type', 'app',
+                  'measure', 'unit', 'baseline_samples', 'samples', 'baseline_median',
+                  'median', 'shift' (%), 'p_value', 'change' ('Slower', 'Faster', 'New'
+                  or '-') and 'regression' (True for a flagged slowdown); values that
+                  could not be computed are None
+        """
+        comparisons = []
+        for ecu_type, current in current_map.items():
+            baseline = baseline_map.get(ecu_type, ({}, {}))
+            for measure, unit, index in MEASURES:
+                for app, values in current[index].items():
+                    reference = baseline[index].get(app, [])
+                    comparison = {'ecu_type': ecu_type, 'app': app, 'measure': measure, 'unit': unit,
+                                  'baseline_samples': len(reference), 'samples': len(values),
+                                  'baseline_median': statistics.median(reference) if reference else None,
+                                  'median': statistics.median(values) if values else None,
+                                  'shift': None, 'p_value': None, 'change': '-' if reference else 'New',
+                                  'regression': False}
+                    if comparison['baseline_median'] and comparison['median'] is not None:
+                        comparison['shift'] = (comparison['median'] - comparison['baseline_median']) / abs(comparison['baseline_median']) * 100
+                    if len(reference) >= self.min_samples and len(values) >= self.min_samples:
+                        comparison['p_value'] = mann_whitney_u(reference, values)[1]
+                    comparisons.append(comparison)
+
+        # Bonferroni: every test gets an equal share of the error probability
+        tested = [comparison for comparison in comparisons if comparison['p_value'] is not None]
+        level = self.significance / max(len(tested), 1)
+        for comparison in tested:
+            if comparison['p_value'] < level and comparison['shift'] is not None and abs(comparison['shift']) >= self.min_shift:
+                comparison['change'] = 'Slower' if comparison['shift'] > 0 else 'Faster'
+                comparison['regression'] = comparison['shift'] > 0
+        return comparisons
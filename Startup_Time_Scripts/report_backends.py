@@ -0,0 +1,487 @@
+"""
+Report output formats.
+
+The report sheets are built as SheetModels (see report_model) and written by one or
+more report backends, selected with the 'Report Formats' configuration:
+
+    xlsx     The Excel report (default), streamed to a write-only workbook when
+             'Streaming Report' is enabled
+    csv      One CSV file per table type, e.g. <report>_startup_time.csv, with the rows of
+             all sheets and a leading 'Sheet' column
+    json     One JSON file with the tables of every sheet
+    html     One self-contained HTML file with the tables of every sheet and interactive
+             startup timelines drawn in the browser (see html_report)
+    parquet  One Parquet file per table type like csv, requires pyarrow
+
+The machine-readable formats and html contain the table values only: no styles or
+graphs, hyperlinks are reduced to their text and the '-' placeholders are empty.
+Pipelines that only need the data can leave out xlsx and skip the Excel rendering.
+
+During the measurement the finished sheets are spooled to a file (SpooledReport), so
+the report of every ECU can be written by its own process at the end of the run
+(open_spooled_report) with nothing but the spool and the result data passed to it. The
+spool pickles the sheet models and only lives as long as the run. The sheets of an
+appendable report are kept as its sheet store instead: one line of JSON per sheet with
+the plain data of the model (write_sheet_store), later runs append to the report from
+it (see report_sidecar).
+"""
+import os
+import abc
+import csv
+import json
+import pickle
+import itertools
+import threading
+
+import openpyxl
+
+from Startup_Time_Scripts.html_report import render_html
+from Startup_Time_Scripts.report_model import Link, SheetModel
+from Startup_Time_Scripts.streaming_workbook import StreamingWorkbook
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+DEFAULT_REPORT_FORMATS = ['xlsx']
+
+
+class ReportSheet:
+    """
+    Sheet of a Report: its title and the sheet handle of every backend.
+    """
+
+    def __init__(self, title, handles):
+        self.title = title
+        self.handles = handles
+
+
+class XlsxReportBackend:
+    """
+    Excel workbook, streamed (StreamingWorkbook) or held in memory until the save.
+    """
+
+    extension = '.xlsx'
+    embeds_images = True
+
+    def __init__(self, streaming=True):
+        if streaming:
+            self._workbook = StreamingWorkbook()
+        else:
+            self._workbook = openpyxl.Workbook()
+            self._workbook.remove(self._workbook.active)
+        self._streaming = streaming
+
+    def create_sheet(self, title):
+        return self._workbook.create_sheet(title=title)
+
+    def render(self, sheet, model):
+        model.render(sheet)
+
+    def flush(self, sheet):
+        if self._streaming:
+            self._workbook.flush(sheet)
+
+    def remove(self, sheet):
+        self._workbook.remove(sheet)
+
+    def save(self, report_file):
+        report_file = report_file.with_suffix(self.extension)
+        self._workbook.save(report_file)
+        return [report_file]
+
+
+class TabularReportBackend(abc.ABC):
+    """
+    Base of the machine-readable backends, keeps the table values of every sheet.
+    """
+
+    extension = None
+    embeds_images = False
+
+    def __init__(self):
+        # Sheet title -> tables as {'name', 'title', 'columns', 'rows'}, in sheet creation order
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def create_sheet(self, title):
+        with self._lock:
+            self._sheets[title] = []
+        return title
+
+    def render(self, sheet, model):
+        tables = [{'name': table.name, 'title': ' '.join(str(table.title).split()),
+                   'columns': [' '.join(str(label).split()) for label in table.columns],
+                   'rows': [[data_value(value) for value, style in cells] for cells in table.rows]}
+                  for table in model.tables()]
+        with self._lock:
+            self._sheets[sheet] = tables
+
+    def flush(self, sheet):
+        pass
+
+    def remove(self, sheet):
+        with self._lock:
+            self._sheets.pop(sheet, None)
+
+    def sheets(self):
+        """
+        Returns the sheets in order as {'title', 'tables'}.
+        """
+        with self._lock:
+            return [{'title': title, 'tables': tables} for title, tables in self._sheets.items()]
+
+    def records(self):
+        """
+        Groups the rows of all sheets by table name.
+
+        Returns:
+            dict: Table name -> (columns, records) with 'Sheet' as first column and one
+                  dict per row
+        """
+        grouped = {}
+        with self._lock:
+            sheets = list(self._sheets.items())
+        for title, tables in sheets:
+            for table in tables:
+                all_columns, records = grouped.setdefault(table['name'], (['Sheet'], []))
+                all_columns.extend(column for column in table['columns'] if column not in all_columns)
+                for row in table['rows']:
+                    record = {'Sheet': title}
+                    record.update(zip(table['columns'], row))
+                    records.append(record)
+        return grouped
+
+    @abc.abstractmethod
+    def save(self, report_file):
+        """
+        Writes the kept tables next to report_file.
+
+        Returns:
+            list: Paths of the written files
+        """
+
+
+class CsvReportBackend(TabularReportBackend):
+    """
+    One CSV file per table name.
+    """
+
+    extension = '.csv'
+
+    def save(self, report_file):
+        written = []
+        for name, (columns, records) in self.records().items():
+            file_path = report_file.with_name(f"{report_file.stem}_{name}{self.extension}")
+            with open(file_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.DictWriter(file, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(records)
+            written.append(file_path)
+        return written
+
+
+class JsonReportBackend(TabularReportBackend):
+    """
+    One JSON file with the sheets and their tables.
+    """
+
+    extension = '.json'
+
+    def save(self, report_file):
+        file_path = report_file.with_suffix(self.extension)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump({'report': report_file.stem, 'sheets': self.sheets()}, file, indent=2)
+        return [file_path]
+
+
+class HtmlReportBackend(TabularReportBackend):
+    """
+    One self-contained interactive HTML file (see html_report).
+    """
+
+    extension = '.html'
+
+    def save(self, report_file):
+        file_path = report_file.with_suffix(self.extension)
+        file_path.write_text(render_html(report_file.stem, self.sheets()), encoding='utf-8')
+        return [file_path]
+
+
+class ParquetReportBackend(TabularReportBackend):
+    """
+    One Parquet file per table name.
+    """
+
+    extension = '.parquet'
+
+    def save(self, report_file):
+        written = []
+        for name, (columns, records) in self.records().items():
+            data = {}
+            for column in columns:
+                values = [record.get(column) for record in records]
+                kinds = {type(value) for value in values if value is not None}
+                if kinds == {int, float}:
+                    values = [float(value) if value is not None else None for value in values]
+                elif len(kinds) > 1:
+                    # Parquet columns have one type, mixed columns are written as text
+                    values = [str(value) if value is not None else None for value in values]
+                data[column] = values
+            file_path = report_file.with_name(f"{report_file.stem}_{name}{self.extension}")
+            pyarrow.parquet.write_table(pyarrow.table(data), file_path)
+            written.append(file_path)
+        return written
+
+
+REPORT_BACKENDS = {
+    'xlsx': XlsxReportBackend,
+    'csv': CsvReportBackend,
+    'json': JsonReportBackend,
+    'html': HtmlReportBackend,
+    'parquet': ParquetReportBackend,
+}
+
+
+class Report:
+    """
+    Report written by several backends, with the workbook-like interface used by the
+    report code (create_sheet, render, flush, remove and save).
+    """
+
+    def __init__(self, backends):
+        self._backends = backends
+
+    @property
+    def embeds_images(self):
+        """
+        True if a backend shows the graphs, otherwise plotting them can be skipped.
+        """
+        return any(backend.embeds_images for backend in self._backends)
+
+    def create_sheet(self, title):
+        return ReportSheet(title, [backend.create_sheet(title) for backend in self._backends])
+
+    def render(self, sheet, model):
+        """
+        Writes a finished SheetModel to the sheet of every backend.
+        """
+        model.resolve_images()
+        for backend, handle in zip(self._backends, sheet.handles):
+            backend.render(handle, model)
+
+    def flush(self, sheet):
+        for backend, handle in zip(self._backends, sheet.handles):
+            backend.flush(handle)
+
+    def remove(self, sheet):
+        for backend, handle in zip(self._backends, sheet.handles):
+            backend.remove(handle)
+
+    def save(self, report_file):
+        """
+        Writes the report files.
+
+        Args:
+            report_file (Path): Report file name, the extension is set by each backend
+
+        Returns:
+            list: Paths of the written files
+        """
+        written = []
+        for backend in self._backends:
+            written.extend(backend.save(report_file))
+        return written
+
+
+def validate_report_formats(report_formats, logger):
+    """
+    Checks the 'Report Formats' configuration.
+
+    Args:
+        report_formats (list): Selected format names
+
+    Returns:
+        bool: True if the formats are valid and available
+    """
+    if not isinstance(report_formats, list) or not report_formats:
+        logger.error(f"Error: 'Report Formats' must be a non-empty list of {list(REPORT_BACKENDS)}.")
+        return False
+    unknown = [report_format for report_format in report_formats if report_format not in REPORT_BACKENDS]
+    if unknown:
+        logger.error(f"Error: Unknown 'Report Formats' {unknown}, supported are {list(REPORT_BACKENDS)}.")
+        return False
+    if 'parquet' in report_formats and pyarrow is None:
+        logger.error("Error: 'Report Formats' 'parquet' requires the pyarrow package.")
+        return False
+    return True
+
+
+def create_report(report_formats, streaming=True):
+    """
+    Creates the report of one ECU.
+
+    Args:
+        report_formats (list): Validated format names (see validate_report_formats)
+        streaming (bool): Stream the xlsx report to a write-only workbook
+
+    Returns:
+        Report: Report writing every selected format
+    """
+    backends = []
+    for report_format in dict.fromkeys(report_formats):
+        if report_format == 'xlsx':
+            backends.append(XlsxReportBackend(streaming))
+        else:
+            backends.append(REPORT_BACKENDS[report_format]())
+    return Report(backends)
+
+
+def data_value(value):
+    """
+    Returns the value of a table cell for the machine-readable formats.
+    """
+    if isinstance(value, Link):
+        return value.text
+    if value in ('-', ''):
+        return None
+    return value
+
+
+class SpooledReport:
+    """
+    Report of the measurement process: every finished sheet model is pickled to a spool
+    file, the report files are written from it by open_spooled_report.
+
+    Has the workbook-like interface of Report except save.
+    """
+
+    def __init__(self, report_formats, streaming, spool_path, base_stores=()):
+        self.report_formats = list(report_formats)
+        self.streaming = streaming
+        self.spool_path = spool_path
+        # Sheet stores of an earlier report holding sheets this report takes over (see report_sidecar)
+        self.base_stores = list(base_stores)
+        # Sheet titles in creation order, removed sheets are dropped
+        self._titles = []
+        self._lock = threading.Lock()
+        # A spool left by an interrupted run is replaced
+        self.spool_path.write_bytes(b'')
+
+    @property
+    def embeds_images(self):
+        return 'xlsx' in self.report_formats
+
+    def create_sheet(self, title):
+        with self._lock:
+            self._titles.append(title)
+        return ReportSheet(title, [])
+
+    def render(self, sheet, model):
+        """
+        Appends a finished SheetModel to the spool.
+
+        The graphs are embedded from memory, the spool holds their image data.
+        """
+        model.resolve_images()
+        data = pickle.dumps((sheet.title, model), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            with open(self.spool_path, 'ab') as file:
+                file.write(data)
+
+    def flush(self, sheet):
+        pass
+
+    def remove(self, sheet):
+        with self._lock:
+            self._titles.remove(sheet.title)
+
+    def state(self):
+        """
+        Returns the picklable description of the report for open_spooled_report.
+        """
+        with self._lock:
+            return {'report_formats': self.report_formats, 'streaming': self.streaming,
+                    'spool_path': self.spool_path, 'base_stores': list(self.base_stores),
+                    'titles': list(self._titles)}
+
+    def discard(self):
+        """
+        Deletes the spool file.
+        """
+        self.spool_path.unlink(missing_ok=True)
+
+
+def read_spool(spool_path):
+    """
+    Yields the (title, model) of every sheet in a spool file of the run.
+    """
+    with open(spool_path, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def read_sheet_store(sheet_store):
+    """
+    Yields the (title, model) of every sheet in the sheet store of a report.
+
+    Raises:
+        OSError, ValueError, KeyError, TypeError: The sheet store is missing or invalid
+    """
+    with open(sheet_store, 'r', encoding='utf-8') as file:
+        for line in file:
+            title, data = json.loads(line)
+            yield title, SheetModel.from_data(data)
+
+
+def write_sheet_store(spool_path, sheet_store):
+    """
+    Converts the spool of a run to the sheet store of its report and deletes the spool.
+
+    Raises:
+        OSError, TypeError, ValueError: The spool cannot be read or a model cannot be stored
+    """
+    # The store is replaced only once it is completely written
+    temporary_store = sheet_store.with_name(sheet_store.name + '.tmp')
+    try:
+        with open(temporary_store, 'w', encoding='utf-8') as file:
+            for title, model in read_spool(spool_path):
+                file.write(json.dumps([title, model.to_data()], separators=(',', ':')) + '\n')
+        os.replace(temporary_store, sheet_store)
+    finally:
+        temporary_store.unlink(missing_ok=True)
+    os.unlink(spool_path)
+
+
+def open_spooled_report(state):
+    """
+    Creates the report of a SpooledReport and writes the spooled sheets to it.
+
+    The sheets are created in their original order and the models are read one at a
+    time, so only one sheet model is held in memory. The base sheet stores are read
+    before the own spool. Sheets created later (e.g. the tool timing sheet) follow the
+    spooled ones.
+
+    Args:
+        state (dict): SpooledReport.state() of the measurement process
+
+    Returns:
+        tuple: (report, sheets) with sheets mapping every title to its ReportSheet
+    """
+    report = create_report(state['report_formats'], state['streaming'])
+    sheets = {title: report.create_sheet(title) for title in state['titles']}
+    rendered = set()
+    stored = (sheet for sheet_store in state['base_stores'] for sheet in read_sheet_store(sheet_store))
+    for title, model in itertools.chain(stored, read_spool(state['spool_path'])):
+        # Sheets of removed iterations are skipped, a sheet is written only once
+        if title in sheets and title not in rendered:
+            report.render(sheets[title], model)
+            report.flush(sheets[title])
+            rendered.add(title)
+    return report, sheets
@@ -0,0 +1,496 @@
+"""
+Report data model and one-pass sheet renderer.
+
+The report functions collect the content of a worksheet into a SheetModel first: tables
+(a merged title row, a column label row and the data rows), free rows such as the log
+file link, cell merges and the embedded graphs (images or native charts). SheetModel.render then lays out all row
+positions, computes the column widths from the model and writes every row exactly once,
+with its final style, to the worksheet. Nothing is read back from the worksheet, so the
+same model can be rendered into a normal worksheet or a write-only (streaming) worksheet,
+whose column widths have to be known before the first row is written.
+
+A finished model converts to plain data (SheetModel.to_data) and back (from_data): JSON
+types only, images as base64 PNG and native charts by name, so the sheet store of a
+report holds no code and does not depend on the classes of this module.
+"""
+import base64
+import threading
+import weakref
+from copy import copy
+from io import BytesIO
+from functools import partial
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.drawing.image import Image
+from openpyxl.utils import get_column_letter
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.styles.borders import DEFAULT_BORDER
+
+from Startup_Time_Scripts.native_charts import NATIVE_CHARTS
+
+
+# Cell styles of the report
+TITLE = 'title'                     # Table title: blue fill, bold, centered, bordered
+LABEL = 'label'                     # Column label: green fill, bold, bordered, centered (wrapped if multi-line)
+DATA = 'data'                       # Table value: centered and bordered, PASS/FAIL filled, '⬤' bold
+COUNT = 'count'                     # Startup order failure count: yellow fill, centered, bordered
+BORDER = 'border'                   # Covered cell of a merged range: bordered only
+LINK = 'link'                       # Hyperlink formula outside of a table: blue font
+ITERATION_LINK = 'iteration_link'   # Hyperlink formula in a table: bold underlined blue, centered, bordered
+
+# Number of empty rows written between two tables
+TABLE_SPACING = 10
+
+# Named styles of the report, registered once per workbook. Every cell refers to one of
+# them, so a cell costs one lookup and the saved file holds one style record per entry.
+# Unset attributes are the workbook defaults, a NamedStyle would otherwise bring its own.
+_thin = Side(border_style='thin')
+_bordered = dict(font=DEFAULT_FONT, border=Border(left=_thin, right=_thin, top=_thin, bottom=_thin))
+_centered = dict(_bordered, alignment=Alignment(horizontal='center', vertical='center'))
+_STYLE_DEFINITIONS = {
+    'Report Title': dict(_centered, font=Font(bold=True),
+                         fill=PatternFill(start_color="9EB9DA", end_color="9EB9DA", fill_type="solid")),
+    'Report Label': dict(_centered, font=Font(bold=True),
+                         fill=PatternFill(start_color="B5E6A2", end_color="B5E6A2", fill_type="solid")),
+    'Report Label Wrapped': dict(_bordered, font=Font(bold=True),
+                                 fill=PatternFill(start_color="B5E6A2", end_color="B5E6A2", fill_type="solid"),
+                                 alignment=Alignment(horizontal='center', vertical='center', wrap_text=True)),
+    'Report Data': _centered,
+    'Report Pass': dict(_centered, fill=PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")),
+    'Report Fail': dict(_centered, fill=PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")),
+    'Report Marker': dict(_centered, font=Font(bold=True)),
+    'Report Count': dict(_centered, fill=PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")),
+    'Report Border': _bordered,
+    'Report Link': dict(font=Font(color="0000FF"), border=DEFAULT_BORDER),
+    'Report Iteration Link': dict(_centered, font=Font(bold=True, underline='single', color='0000FF')),
+}
+_STYLE_NAMES = {
+    TITLE: 'Report Title',
+    LABEL: 'Report Label',
+    DATA: 'Report Data',
+    COUNT: 'Report Count',
+    BORDER: 'Report Border',
+    LINK: 'Report Link',
+    ITERATION_LINK: 'Report Iteration Link',
+}
+# Values of DATA cells with a style of their own
+_DATA_VALUE_STYLES = {'PASS': 'Report Pass', 'FAIL': 'Report Fail', '⬤': 'Report Marker'}
+
+# Workbook -> {style name: style array of the registered named style}
+_registered_styles = weakref.WeakKeyDictionary()
+_registration_lock = threading.Lock()
+
+
+def report_styles(workbook):
+    """
+    Registers the named styles of the report in a workbook, once.
+
+    Args:
+        workbook (openpyxl.Workbook): Normal or write-only workbook
+
+    Returns:
+        dict: Style name -> style array to assign to the cells of the workbook
+    """
+    with _registration_lock:
+        styles = _registered_styles.get(workbook)
+        if styles is None:
+            styles = {}
+            for name, definition in _STYLE_DEFINITIONS.items():
+                # A NamedStyle is bound to the workbook it was added to, each workbook gets its own
+                named_style = NamedStyle(name=name, **definition)
+                workbook.add_named_style(named_style)
+                styles[name] = named_style.as_tuple()
+            _registered_styles[workbook] = styles
+        return styles
+
+
+class Link:
+    """
+    Hyperlink cell value: an Excel HYPERLINK formula in worksheets, its text in the
+    machine-readable report formats.
+    """
+
+    __slots__ = ('target', 'text')
+
+    def __init__(self, target, text):
+        self.target = target
+        self.text = text
+
+    def __str__(self):
+        return f'=HYPERLINK("{self.target}", "{self.text}")'
+
+
+def _value_data(value):
+    """
+    Returns the plain data of a cell value, Links become {'link': [target, text]}.
+    """
+    return {'link': [value.target, value.text]} if isinstance(value, Link) else value
+
+
+def _data_value(data):
+    return Link(*data['link']) if isinstance(data, dict) else data
+
+
+def _cells_data(cells):
+    return [[_value_data(value), style] for value, style in cells]
+
+
+def _data_cells(data):
+    return [[_data_value(value), style] for value, style in data]
+
+
+class ReportTable:
+    """
+    One table section of a sheet.
+
+    Rows are addressed relative to the table: row 0 is the title row, row 1 the column
+    label row and the data rows follow from row 2 on. Columns are 1-based.
+
+    The display length of the labels and values is tracked per column as they are added
+    (max_lengths), so the column widths are known without scanning the rows again.
+    """
+
+    def __init__(self, title, columns, name=None):
+        self.title = title
+        self.columns = list(columns)
+        # Identifies the table type across sheets (e.g. 'startup_time') in the data outputs
+        self.name = name
+        self.rows = []
+        self.merges = []
+        self.images = []
+        self.charts = []
+        # Images left out of the report, kept as (spec, column) to be added later
+        self.deferred_images = []
+        # Column -> longest value so far, labels count with their longest line
+        self.max_lengths = {}
+        for column, label in enumerate(self.columns, start=1):
+            self._fit(column, max(len(line) for line in str(label).split('\n')) if label else 0)
+
+    def _fit(self, column, length):
+        if length > self.max_lengths.get(column, -1):
+            self.max_lengths[column] = length
+
+    @property
+    def next_row(self):
+        """
+        Table row the next appended data row will get.
+        """
+        return 2 + len(self.rows)
+
+    def append(self, values, style=DATA, styles=None):
+        """
+        Appends a data row.
+
+        Args:
+            values (list): Cell values, None leaves a cell empty and unstyled
+            style (str): Style of the cells
+            styles (dict): Column -> style for cells with a different style
+        """
+        styles = styles or {}
+        cells = []
+        for column, value in enumerate(values, start=1):
+            if value is None:
+                cells.append([None, None])
+                continue
+            cells.append([value, styles.get(column, style)])
+            self._fit(column, len(str(value)) if value else 0)
+        self.rows.append(cells)
+
+    def set_cell(self, row, column, value, style=DATA):
+        """
+        Sets a cell of an already appended data row.
+        """
+        cells = self.rows[row - 2]
+        cells.extend([None, None] for _ in range(column - len(cells)))
+        cells[column - 1] = [value, style]
+        self._fit(column, len(str(value)) if value else 0)
+
+    def merge(self, first_row, first_column, last_row, last_column):
+        """
+        Merges a range of table cells, the value of the first cell is kept.
+        """
+        if (first_row, first_column) != (last_row, last_column) and first_row <= last_row:
+            self.merges.append((first_row, first_column, last_row, last_column))
+
+    def add_image(self, image, column, row_offset=0):
+        """
+        Embeds an image with its top left corner in the title row.
+
+        Args:
+            image (openpyxl.drawing.image.Image): Image to embed, or a pending image whose
+                                                  result() returns it (see SheetModel.resolve_images)
+            column (str): Column letter of the top left corner
+            row_offset (int): Rows below the title row, e.g. for the pages of a chart
+        """
+        self.images.append((image, column, row_offset))
+
+    def defer_image(self, spec, column, row_offset=0):
+        """
+        Records an image that is not rendered now, with the data to render it later.
+
+        Args:
+            spec: Picklable description of the image, e.g. a chart name and its data
+            column (str): Column letter of the top left corner
+            row_offset (int): Rows below the title row
+        """
+        self.deferred_images.append((spec, column, row_offset))
+
+    def add_chart(self, factory, column, first_row=None, last_row=None):
+        """
+        Embeds a native chart of table rows with its top left corner in the title row.
+
+        Args:
+            factory (callable): Called as factory(sheet, first_row, last_row) with the
+                                worksheet rows of the charted rows, returns the openpyxl
+                                chart (see native_charts)
+            column (str): Column letter of the top left corner
+            first_row, last_row (int): Table rows to chart, all data rows if None
+        """
+        first_row = 2 if first_row is None else first_row
+        last_row = self.next_row - 1 if last_row is None else last_row
+        if first_row <= last_row:
+            self.charts.append((factory, column, first_row, last_row))
+
+    def to_data(self):
+        """
+        Returns the table as plain data, its images must be resolved (see SheetModel.resolve_images).
+
+        Raises:
+            TypeError: A native chart factory is not a partial of a NATIVE_CHARTS function
+        """
+        charts = []
+        for factory, *placement in self.charts:
+            if not isinstance(factory, partial) or NATIVE_CHARTS.get(factory.func.__name__) is not factory.func:
+                raise TypeError(f"Chart {factory!r} of table {self.title!r} cannot be stored")
+            charts.append([{'chart': factory.func.__name__, 'args': list(factory.args)}, *placement])
+        return {
+            'title': self.title,
+            'columns': self.columns,
+            'name': self.name,
+            'rows': [_cells_data(cells) for cells in self.rows],
+            'merges': self.merges,
+            # The graphs are embedded from memory, image.ref holds the PNG
+            'images': [[base64.b64encode(image.ref.getvalue()).decode('ascii'), *placement] for image, *placement in self.images],
+            'charts': charts,
+            'deferred_images': self.deferred_images,
+            'max_lengths': list(self.max_lengths.items())
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Creates a table from the plain data of to_data.
+        """
+        table = cls(data['title'], data['columns'], data['name'])
+        table.rows = [_data_cells(cells) for cells in data['rows']]
+        table.merges = [tuple(merge) for merge in data['merges']]
+        table.images = [(Image(BytesIO(base64.b64decode(image))), *placement) for image, *placement in data['images']]
+        table.charts = [(partial(NATIVE_CHARTS[chart['chart']], *chart['args']), *placement) for chart, *placement in data['charts']]
+        table.deferred_images = [tuple(deferred) for deferred in data['deferred_images']]
+        table.max_lengths = {column: length for column, length in data['max_lengths']}
+        return table
+
+
+def _anchor(title_row, column, row_offset):
+    """
+    Returns the anchor cell of an image placed at a column and row offset from a title row.
+    """
+    return f'{column}{title_row + row_offset}'
+
+
+class SheetModel:
+    """
+    Content of one worksheet, rendered in a single pass.
+
+    Column widths follow the content of all tables: the longest value of a column (the
+    longest line for wrapped labels) plus width_padding, at least min_width. Table titles
+    and free rows do not widen the columns.
+    """
+
+    def __init__(self, width_padding=3, min_width=9, show_grid_lines=False):
+        self.width_padding = width_padding
+        self.min_width = min_width
+        self.show_grid_lines = show_grid_lines
+        self._blocks = []
+        # Columns used by free rows, they get the minimum width
+        self._free_columns = 0
+
+    def add_table(self, table):
+        """
+        Adds a table below the current content.
+        """
+        self._blocks.append(table)
+        return table
+
+    def add_row(self, values, style=None):
+        """
+        Adds a free row (e.g. a link or a note) below the current content.
+
+        Args:
+            values (list): Cell values, an empty list adds an empty row
+            style (str): Style of the non-empty cells
+        """
+        self._blocks.append([[value, style if value is not None else None] for value in values])
+        if any(value is not None for value in values):
+            self._free_columns = max(self._free_columns, max(column for column, value in enumerate(values, start=1) if value is not None))
+
+    def tables(self):
+        """
+        Returns the tables of the sheet in order.
+        """
+        return [block for block in self._blocks if isinstance(block, ReportTable)]
+
+    def resolve_images(self):
+        """
+        Waits for the pending images of all tables (e.g. charts still being rendered) and
+        replaces them with their image.
+        """
+        for table in self.tables():
+            table.images = [(image.result() if hasattr(image, 'result') else image, *placement)
+                            for image, *placement in table.images]
+
+    def to_data(self):
+        """
+        Returns the model as plain data (JSON types only), its images must be resolved.
+        """
+        return {
+            'width_padding': self.width_padding,
+            'min_width': self.min_width,
+            'show_grid_lines': self.show_grid_lines,
+            'free_columns': self._free_columns,
+            'blocks': [{'table': block.to_data()} if isinstance(block, ReportTable) else {'row': _cells_data(block)}
+                       for block in self._blocks]
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Creates a model from the plain data of to_data.
+
+        Raises:
+            KeyError, TypeError, ValueError: The data is not a stored model
+        """
+        model = cls(data['width_padding'], data['min_width'], data['show_grid_lines'])
+        model._free_columns = data['free_columns']
+        model._blocks = [ReportTable.from_data(block['table']) if 'table' in block else _data_cells(block['row'])
+                         for block in data['blocks']]
+        return model
+
+    def deferred_images(self):
+        """
+        Returns the deferred images of all tables with the anchors they get in the sheet.
+
+        Returns:
+            list: (spec, anchor) per deferred image
+        """
+        return [(spec, _anchor(title_row, column, row_offset))
+                for block, title_row in self._block_rows() if isinstance(block, ReportTable)
+                for spec, column, row_offset in block.deferred_images]
+
+    def _block_rows(self):
+        """
+        Yields every block with its first sheet row (1-based): the title row of a table or
+        the row of a free row. Tables after the first rows are preceded by TABLE_SPACING
+        empty rows.
+        """
+        row_count = 0
+        for block in self._blocks:
+            if not isinstance(block, ReportTable):
+                yield block, row_count + 1
+                row_count += 1
+                continue
+            if row_count > 1:
+                row_count += TABLE_SPACING
+            yield block, row_count + 1
+            row_count += 2 + len(block.rows)
+
+    def _layout(self):
+        """
+        Assigns the absolute rows of all blocks.
+
+        Returns:
+            tuple: (rows, merges, images, charts) with rows as lists of [value, style], merges
+                   as (first_row, first_column, last_row, last_column), images as (image, anchor)
+                   and charts as (factory, anchor, first_row, last_row), all 1-based
+        """
+        rows, merges, images, charts = [], [], [], []
+        for block, first_row in self._block_rows():
+            if not isinstance(block, ReportTable):
+                rows.append(block)
+                continue
+            # Empty rows up to the title row of the table
+            rows.extend([] for _ in range(first_row - 1 - len(rows)))
+            title_row = first_row
+            rows.append([[block.title, TITLE]])
+            rows.append([[column, LABEL] for column in block.columns])
+            rows.extend(block.rows)
+            merges.append((title_row, 1, title_row, len(block.columns)))
+            merges.extend((title_row + first_row, first_column, title_row + last_row, last_column)
+                          for first_row, first_column, last_row, last_column in block.merges)
+            images.extend((image, _anchor(title_row, column, row_offset)) for image, column, row_offset in block.images)
+            charts.extend((factory, f'{column}{title_row}', title_row + first_row, title_row + last_row)
+                          for factory, column, first_row, last_row in block.charts)
+
+        # Covered cells of merged ranges are empty and only carry the border of the range
+        for first_row, first_column, last_row, last_column in merges:
+            for row in range(first_row, last_row + 1):
+                cells = rows[row - 1]
+                cells.extend([None, None] for _ in range(last_column - len(cells)))
+                for column in range(first_column, last_column + 1):
+                    if (row, column) == (first_row, first_column):
+                        if cells[column - 1][1] is None:
+                            cells[column - 1][1] = BORDER
+                    else:
+                        cells[column - 1] = [None, BORDER]
+        return rows, merges, images, charts
+
+    def column_widths(self):
+        """
+        Returns the column widths from the lengths tracked by the tables.
+
+        Returns:
+            dict: Column (1-based) -> width
+        """
+        max_lengths = dict.fromkeys(range(1, self._free_columns + 1), 0)
+        for block in self._blocks:
+            if isinstance(block, ReportTable):
+                for column, length in block.max_lengths.items():
+                    max_lengths[column] = max(length, max_lengths.get(column, 0))
+        return {column: max(length + self.width_padding, self.min_width) for column, length in max_lengths.items()}
+
+    def render(self, sheet):
+        """
+        Writes the model to an empty worksheet.
+
+        Args:
+            sheet (Worksheet or WriteOnlyWorksheet): Worksheet no row was written to yet
+        """
+        rows, merges, images, charts = self._layout()
+        styles = report_styles(sheet.parent)
+        sheet.sheet_view.showGridLines = self.show_grid_lines
+        # Column settings precede the rows in the file, write-only sheets need them first
+        for column, width in self.column_widths().items():
+            sheet.column_dimensions[get_column_letter(column)].width = width
+        for first_row, first_column, last_row, last_column in merges:
+            sheet.merged_cells.add(f'{get_column_letter(first_column)}{first_row}:{get_column_letter(last_column)}{last_row}')
+        for image, anchor in images:
+            sheet.add_image(image, anchor)
+        for factory, anchor, first_row, last_row in charts:
+            sheet.add_chart(factory(sheet, first_row, last_row), anchor)
+        for cells in rows:
+            sheet.append([_styled_cell(sheet, styles, value, style) if value is not None or style is not None else None
+                          for value, style in cells])
+
+
+def _styled_cell(sheet, styles, value, style):
+    cell = WriteOnlyCell(sheet, value=str(value) if isinstance(value, Link) else value)
+    if style is not None:
+        if style == LABEL and '\n' in str(value):
+            name = 'Report Label Wrapped'
+        elif style == DATA and isinstance(value, str):
+            name = _DATA_VALUE_STYLES.get(value, 'Report Data')
+        else:
+            name = _STYLE_NAMES[style]
+        cell._style = copy(styles[name])
+    return cell
@@ -0,0 +1,142 @@
+"""
+Result data sidecar of a finished report, used to append iterations to it.
+
+Next to every report a '<report>.results.json' sidecar is written with the result
+data the Summary is computed from and the sheet stores holding the finished iteration
+sheet models ('<report>.sheets.jsonl', one line of JSON per sheet with the plain data
+of its model, see report_backends.write_sheet_store). An append run loads
+the sidecar instead of the report: the stored iteration sheets are copied into the new
+report as they are, only the new iterations are measured and rendered, and the Summary
+tables are recomputed from the stored result data extended by the new iterations.
+
+Sidecar content:
+    {"ecu_type": ..., "iteration_sheets": [[i, title], ...],
+     "sheet_stores": [<path relative to the sidecar>, ...],
+     "overall_IG_ON_iteration": [[i, {...}], ...], "process_times": {app: [...]},
+     "process_start_times": {app: [...]}, "application_startup_order_status": [[i, {...}], ...]}
+
+The sheet stores of a report appended to several times form a chain, each append adds
+the store of its own iterations, so no stored sheet is ever rewritten. The stores of a
+report are in the folder of its sidecar: stores of an appended report in another folder
+are copied there, and a sidecar listing a store outside of its folder is rejected.
+"""
+import os
+import re
+import json
+import shutil
+
+from Startup_Time_Scripts.report_backends import write_sheet_store
+
+
+REPORT_PREFIX = 'Application_Startup_Time_'
+SIDECAR_SUFFIX = '.results.json'
+SHEET_STORE_SUFFIX = '.sheets.jsonl'
+ITERATION_SHEET_PREFIX = 'GEN3_StartupTime_'
+
+
+def write_report_sidecar(report_file, ecu_type, report_state, results):
+    """
+    Converts the spool of a written report to its sheet store and writes the sidecar.
+
+    Args:
+        report_file (Path): Report file name, the extension is ignored
+        ecu_type (str): ECU type of the report
+        report_state (dict): SpooledReport.state() of the report
+        results (tuple): (overall_IG_ON_iteration, process_times, process_start_times,
+                         application_startup_order_status) of the ECU
+
+    Returns:
+        Path: Sidecar file
+    """
+    overall_IG_ON_iteration, process_times, process_start_times, application_startup_order_status = results
+    sidecar = report_file.with_name(report_file.stem + SIDECAR_SUFFIX)
+    sheet_store = report_file.with_name(report_file.stem + SHEET_STORE_SUFFIX)
+    write_sheet_store(report_state['spool_path'], sheet_store)
+    sheet_stores = []
+    for store in report_state['base_stores']:
+        # The stores of an appended report in another folder are copied next to this report
+        if not _in_folder(store, sidecar.parent):
+            store = shutil.copyfile(store, sidecar.parent / store.name)
+        sheet_stores.append(store)
+    sheet_stores.append(sheet_store)
+    data = {
+        'ecu_type': ecu_type,
+        'iteration_sheets': [[int(title[len(ITERATION_SHEET_PREFIX):]) - 1, title]
+                             for title in report_state['titles'] if title.startswith(ITERATION_SHEET_PREFIX)],
+        'sheet_stores': [os.path.relpath(store, sidecar.parent) for store in sheet_stores],
+        'overall_IG_ON_iteration': [[i, value] for i, value in overall_IG_ON_iteration.items()],
+        'process_times': process_times,
+        'process_start_times': process_start_times,
+        'application_startup_order_status': [[i, value] for i, value in application_startup_order_status.items()]
+    }
+    with open(sidecar, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+    return sidecar
+
+
+def _in_folder(path, folder):
+    return path.resolve().is_relative_to(folder.resolve())
+
+
+def find_report_sidecar(report_path, setup_type, ecu_type):
+    """
+    Returns the sidecar of a report of an ECU.
+
+    A report file selects that report: its own sidecar for its ECU, and the sidecar
+    of the same run (same timestamp) for the other ECUs of an ELITE setup. A folder
+    selects the newest report of the ECU in it.
+
+    Args:
+        report_path (Path): Any file of the report (xlsx, sidecar, ...) or the folder holding it
+        setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+        ecu_type (str): ECU type identifier
+
+    Returns:
+        Path or None: Sidecar file, None if the report or the folder has no sidecar of the ECU
+    """
+    if report_path.is_dir():
+        sidecars = sorted(report_path.glob(f'{REPORT_PREFIX}{setup_type}_{ecu_type}_N*{SIDECAR_SUFFIX}'),
+                          key=lambda sidecar: sidecar.stat().st_mtime)
+        return sidecars[-1] if sidecars else None
+
+    report_name = report_path.name.removesuffix(SIDECAR_SUFFIX) if report_path.name.endswith(SIDECAR_SUFFIX) else report_path.stem
+    match = re.fullmatch(rf'{REPORT_PREFIX}{re.escape(setup_type)}_(.+)_N\d+_(\d{{8}}_\d{{6}})', report_name)
+    if match and match.group(1) != ecu_type:
+        sidecars = list(report_path.parent.glob(f'{REPORT_PREFIX}{setup_type}_{ecu_type}_N*_{match.group(2)}{SIDECAR_SUFFIX}'))
+        return sidecars[0] if len(sidecars) == 1 else None
+    sidecar = report_path.with_name(report_name + SIDECAR_SUFFIX)
+    return sidecar if sidecar.is_file() else None
+
+
+def load_report_sidecar(sidecar):
+    """
+    Reads a sidecar back.
+
+    Returns:
+        dict: 'iteration_sheets' (iteration -> sheet title), 'sheet_stores' (sheet store
+              paths, oldest first), 'next_iteration' (index of the first appended iteration) and
+              'results' as passed to write_report_sidecar
+
+    Raises:
+        OSError, ValueError, KeyError: The sidecar or one of its sheet stores is missing or invalid
+    """
+    with open(sidecar, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    sheet_stores = [sidecar.parent / store for store in data['sheet_stores']]
+    for store in sheet_stores:
+        # Only stores of the report's own folder are read, in the current store format
+        if not _in_folder(store, sidecar.parent):
+            raise ValueError(f"Sheet store {store} of {sidecar.name} is outside of {sidecar.parent}")
+        if not store.name.endswith(SHEET_STORE_SUFFIX):
+            raise ValueError(f"Sheet store {store} of {sidecar.name} has an unsupported format")
+        if not store.is_file():
+            raise FileNotFoundError(f"Sheet store {store} of {sidecar.name} not found")
+    iteration_sheets = {i: title for i, title in data['iteration_sheets']}
+    overall_IG_ON_iteration = {i: value for i, value in data['overall_IG_ON_iteration']}
+    return {
+        'iteration_sheets': iteration_sheets,
+        'sheet_stores': sheet_stores,
+        'next_iteration': max([*iteration_sheets, *overall_IG_ON_iteration, -1]) + 1,
+        'results': (overall_IG_ON_iteration, data['process_times'], data['process_start_times'],
+                    {i: value for i, value in data['application_startup_order_status']})
+    }
@@ -0,0 +1,334 @@
+"""
+Local SQLite warehouse of the startup time results of all runs.
+
+Every run adds the iterations it measured to one SQLite database, one run row per ECU
+report with the per-iteration verdicts and the per-application timings, so trends over
+many runs are answered by an indexed query instead of opening the reports. Iterations
+taken over from an appended report were stored by the run that measured them and are
+not stored again; a resumed run replaces the rows of its interrupted run.
+
+Tables:
+    runs          run_id, timestamp, setup_type, ecu_type, report, config_hash
+    iterations    run_id, iteration (1-based), total_time (sec from IG ON), verdict,
+                  startup_order_status
+    app_timings   run_id, iteration, app, position, startup_time (sec from QNX startup),
+                  total_time (sec from IG ON), threshold, verdict
+    init_times    run_id, iteration, process, init_time_ms
+
+Verdicts are 'PASS', 'FAIL' or NULL when no threshold applies, as in the report.
+
+Usage:
+    python -m Startup_Time_Scripts.results_warehouse runs --ecu RCAR --limit 20
+    python -m Startup_Time_Scripts.results_warehouse trend aradltdaemon --ecu RCAR --last 300
+    python -m Startup_Time_Scripts.results_warehouse samples aradltdaemon <run_id>
+    python -m Startup_Time_Scripts.results_warehouse apps --ecu RCAR
+"""
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+
+
+DEFAULT_DATABASE = Path(__file__).parents[1].joinpath("Reports", "03_Startup_Time", "startup_time_results.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    setup_type TEXT NOT NULL,
+    ecu_type TEXT NOT NULL,
+    report TEXT,
+    config_hash TEXT NOT NULL,
+    UNIQUE (timestamp, ecu_type)
+);
+CREATE TABLE IF NOT EXISTS iterations (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    iteration INTEGER NOT NULL,
+    total_time REAL,
+    verdict TEXT,
+    startup_order_status INTEGER,
+    PRIMARY KEY (run_id, iteration)
+);
+CREATE TABLE IF NOT EXISTS app_timings (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    iteration INTEGER NOT NULL,
+    app TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    startup_time REAL NOT NULL,
+    total_time REAL NOT NULL,
+    threshold REAL,
+    verdict TEXT,
+    PRIMARY KEY (run_id, iteration, app)
+);
+CREATE TABLE IF NOT EXISTS init_times (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    iteration INTEGER NOT NULL,
+    process TEXT NOT NULL,
+    init_time_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_ecu_timestamp ON runs (ecu_type, timestamp);
+CREATE INDEX IF NOT EXISTS app_timings_app ON app_timings (app, run_id);
+CREATE INDEX IF NOT EXISTS init_times_run ON init_times (run_id, iteration);
+"""
+
+
+def config_hash(config):
+    """
+    Returns the SHA-256 of the configuration, identical configurations give the same hash.
+    """
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class RunResults:
+    """
+    Thread-safe collector of the iterations measured by a run, stored at the end of the run.
+    """
+
+    def __init__(self):
+        # ECU type -> iteration records in the order they were added
+        self._iterations = {}
+        self._lock = threading.Lock()
+
+    def add_iteration(self, ecu_type, i, dltstart_timestamps, process_timing_info, thresholds, offset_time, overall, order_status):
+        """
+        Records one iteration of one ECU.
+
+        Args:
+            ecu_type (str): ECU type identifier
+            i (int): Iteration index (0-based)
+            dltstart_timestamps (OrderedDict): Application -> startup time (sec from QNX startup), in startup order
+            process_timing_info (list): Init(Up) time entries ({'process', 'start_time_ms'})
+            thresholds (dict): Application -> startup time threshold (sec from IG ON)
+            offset_time (float): Time from IG ON to the QNX startup (sec)
+            overall (dict): Overall result of the iteration ('timestamp', 'status', 'passed_count')
+            order_status (dict): Startup order validation result of the iteration
+        """
+        apps = []
+        for position, (app, startup_time) in enumerate(dltstart_timestamps.items(), start=1):
+            threshold = thresholds.get(app)
+            verdict = None
+            if threshold is not None:
+                verdict = 'PASS' if startup_time + offset_time < threshold else 'FAIL'
+            apps.append((app, position, startup_time, startup_time + offset_time, threshold, verdict))
+        verdict = None
+        if not overall['status']:
+            verdict = 'FAIL'
+        elif overall['passed_count'] >= 1:
+            verdict = 'PASS'
+        record = {
+            'iteration': i + 1,
+            'total_time': overall['timestamp'] + offset_time,
+            'verdict': verdict,
+            'startup_order_status': order_status.get('startup_order_status'),
+            'apps': apps,
+            'init_times': [(item['process'], item['start_time_ms']) for item in process_timing_info]
+        }
+        with self._lock:
+            self._iterations.setdefault(ecu_type, []).append(record)
+
+    def iterations(self, ecu_type):
+        """
+        Returns the recorded iterations of an ECU.
+        """
+        with self._lock:
+            return list(self._iterations.get(ecu_type, []))
+
+
+class ResultsWarehouse:
+    """
+    Connection to the results database, created with its tables on first use.
+    """
+
+    def __init__(self, path=DEFAULT_DATABASE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def store_run(self, timestamp, setup_type, ecu_type, report, config_digest, iterations):
+        """
+        Stores the iterations of one ECU report in one transaction.
+
+        A run already stored with the same timestamp and ECU (the interrupted run of a
+        resumed run) is replaced.
+
+        Args:
+            timestamp (str): current_timestamp of the run
+            setup_type (str): Test setup type (e.g., 'ELITE', 'PADAS')
+            ecu_type (str): ECU type identifier
+            report (str): Report file name
+            config_digest (str): config_hash of the run configuration
+            iterations (list): Records of RunResults.iterations
+
+        Returns:
+            int: run_id of the stored run
+        """
+        with self._connection:
+            self._connection.execute('DELETE FROM runs WHERE timestamp = ? AND ecu_type = ?', (timestamp, ecu_type))
+            run_id = self._connection.execute(
+                'INSERT INTO runs (timestamp, setup_type, ecu_type, report, config_hash) VALUES (?, ?, ?, ?, ?)',
+                (timestamp, setup_type, ecu_type, report, config_digest)).lastrowid
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO iterations VALUES (?, ?, ?, ?, ?)',
+                [(run_id, record['iteration'], record['total_time'], record['verdict'], record['startup_order_status'])
+                 for record in iterations])
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO app_timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(run_id, record['iteration'], *app) for record in iterations for app in record['apps']])
+            self._connection.executemany(
+                'INSERT INTO init_times VALUES (?, ?, ?, ?)',
+                [(run_id, record['iteration'], *item) for record in iterations for item in record['init_times']])
+        return run_id
+
+    def _query(self, sql, parameters):
+        cursor = self._connection.execute(sql, parameters)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def runs(self, ecu_type=None, limit=None):
+        """
+        Returns the stored runs, newest first, with their iteration count and failures.
+
+        Args:
+            ecu_type (str): Only runs of this ECU type, all if None
+            limit (int): Number of runs, all if None
+
+        Returns:
+            list: One dict per run
+        """
+        return self._query(
+            'SELECT r.run_id, r.timestamp, r.setup_type, r.ecu_type, r.report, r.config_hash,'
+            " COUNT(i.iteration) AS iterations, SUM(i.verdict = 'FAIL') AS failed_iterations"
+            ' FROM runs r LEFT JOIN iterations i ON i.run_id = r.run_id'
+            ' WHERE ? IS NULL OR r.ecu_type = ?'
+            ' GROUP BY r.run_id ORDER BY r.timestamp DESC, r.run_id DESC LIMIT ?',
+            (ecu_type, ecu_type, -1 if limit is None else limit))
+
+    def app_trend(self, app, ecu_type=None, last_runs=None):
+        """
+        Returns the startup time statistics of an application per run, oldest run first.
+
+        Args:
+            app (str): Application name as in the report
+            ecu_type (str): Only runs of this ECU type, all if None
+            last_runs (int): Number of most recent runs containing the application, all if None
+
+        Returns:
+            list: One dict per run with 'samples', 'average', 'minimum' and 'maximum' of the
+                  time from IG ON (sec) and the number of 'failures'
+        """
+        trend = self._query(
+            'SELECT r.run_id, r.timestamp, r.ecu_type, r.config_hash, COUNT(*) AS samples,'
+            ' AVG(a.total_time) AS average, MIN(a.total_time) AS minimum, MAX(a.total_time) AS maximum,'
+            " SUM(a.verdict = 'FAIL') AS failures"
+            ' FROM app_timings a JOIN runs r ON r.run_id = a.run_id'
+            ' WHERE a.app = ? AND (? IS NULL OR r.ecu_type = ?)'
+            ' GROUP BY a.run_id ORDER BY r.timestamp DESC, r.run_id DESC LIMIT ?',
+            (app, ecu_type, ecu_type, -1 if last_runs is None else last_runs))
+        return trend[::-1]
+
+    def app_samples(self, app, run_id):
+        """
+        Returns the per-iteration timings of an application in one run.
+        """
+        return self._query('SELECT iteration, position, startup_time, total_time, threshold, verdict'
+                           ' FROM app_timings WHERE app = ? AND run_id = ? ORDER BY iteration', (app, run_id))
+
+    def run_samples(self, timestamp, ecu_type):
+        """
+        Returns the per-application samples of one stored run, e.g. as regression baseline.
+
+        Args:
+            timestamp (str): Timestamp of the run as listed by runs
+            ecu_type (str): ECU type identifier
+
+        Returns:
+            tuple: (startup times (sec from QNX startup), Init(Up) times (ms)), each
+                   {application: [values in iteration order]}, None if the run is not stored
+        """
+        run = self._connection.execute('SELECT run_id FROM runs WHERE timestamp = ? AND ecu_type = ?',
+                                       (timestamp, ecu_type)).fetchone()
+        if run is None:
+            return None
+        startup_times, init_times = {}, {}
+        for app, startup_time in self._connection.execute(
+                'SELECT app, startup_time FROM app_timings WHERE run_id = ? ORDER BY iteration, position', run):
+            startup_times.setdefault(app, []).append(startup_time)
+        for process, init_time in self._connection.execute(
+                'SELECT process, init_time_ms FROM init_times WHERE run_id = ? ORDER BY iteration, rowid', run):
+            init_times.setdefault(process, []).append(init_time)
+        return startup_times, init_times
+
+    def apps(self, ecu_type=None):
+        """
+        Returns the stored application names with the number of runs they occur in.
+        """
+        return self._query(
+            'SELECT a.app, COUNT(DISTINCT a.run_id) AS runs FROM app_timings a JOIN runs r ON r.run_id = a.run_id'
+            ' WHERE ? IS NULL OR r.ecu_type = ? GROUP BY a.app ORDER BY a.app', (ecu_type, ecu_type))
+
+
+def print_rows(rows, file=sys.stdout):
+    """
+    Prints query rows as a tab separated table with a header line.
+    """
+    if not rows:
+        print("No results.", file=file)
+        return
+    print('\t'.join(rows[0]), file=file)
+    for row in rows:
+        print('\t'.join(f'{value:.4f}' if isinstance(value, float) else '' if value is None else str(value)
+                        for value in row.values()), file=file)
+
+
+def main(argv=None):
+    """
+    Command line entry point for querying the results database.
+    """
+    parser = argparse.ArgumentParser(description="Startup time results warehouse queries")
+    parser.add_argument('--database', default=str(DEFAULT_DATABASE), help="Results database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+    runs_parser = commands.add_parser('runs', help="List the stored runs, newest first")
+    runs_parser.add_argument('--ecu', default=None, help="Only runs of this ECU type")
+    runs_parser.add_argument('--limit', type=int, default=20, help="Number of runs")
+    trend_parser = commands.add_parser('trend', help="Startup time of an application per run")
+    trend_parser.add_argument('app', help="Application name")
+    trend_parser.add_argument('--ecu', default=None, help="Only runs of this ECU type")
+    trend_parser.add_argument('--last', type=int, default=None, help="Number of most recent runs")
+    samples_parser = commands.add_parser('samples', help="Per-iteration timings of an application in one run")
+    samples_parser.add_argument('app', help="Application name")
+    samples_parser.add_argument('run_id', type=int, help="run_id from the runs command")
+    apps_parser = commands.add_parser('apps', help="List the stored applications")
+    apps_parser.add_argument('--ecu', default=None, help="Only runs of this ECU type")
+    args = parser.parse_args(argv)
+
+    if not Path(args.database).is_file():
+        print(f"Results database {args.database} not found.", file=sys.stderr)
+        return 1
+    with ResultsWarehouse(args.database) as warehouse:
+        if args.command == 'runs':
+            print_rows(warehouse.runs(args.ecu, args.limit))
+        elif args.command == 'trend':
+            print_rows(warehouse.app_trend(args.app, args.ecu, args.last))
+        elif args.command == 'samples':
+            print_rows(warehouse.app_samples(args.app, args.run_id))
+        else:
+            print_rows(warehouse.apps(args.ecu))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
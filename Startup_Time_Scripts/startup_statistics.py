@@ -0,0 +1,105 @@
+"""
+Statistics of the per-application samples of a run, computed with NumPy.
+
+The samples of an ECU (e.g. process_times, application -> startup time of every
+iteration) are arranged as one (samples x applications) matrix, padded with NaN for
+applications missing in some iterations. Every statistic is then one vectorized call
+over the matrix instead of a Python loop per application, e.g. all percentiles of all
+applications come from a single nanpercentile call.
+"""
+import numpy as np
+
+
+# Percentiles of the distribution tables and charts of the Summary
+DISTRIBUTION_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Tail percentiles of the Min, Max, Avg tables of the Summary
+SUMMARY_PERCENTILES = (90, 95, 99)
+
+
+def round_half_up(values, decimals=0):
+    """
+    Rounds values half away from zero (0.5 always rounds up in magnitude).
+
+    The value is scaled by 10 ** decimals and its magnitude rounded up when the
+    fractional part is at least 0.5, which gives the same result as quantizing
+    Decimal(str(value * 10 ** decimals)): a scaled float that is not exactly a half
+    integer is never printed as one. The fractional part is compared instead of
+    adding 0.5, which would round up e.g. 0.49999999999999994 and, above 2 ** 52,
+    odd integers.
+
+    Args:
+        values (float or array): Values to round, NaN stays NaN
+        decimals (int): Number of decimal places
+
+    Returns:
+        float or ndarray: Rounded values, same shape as values
+    """
+    multiplier = 10 ** decimals
+    scaled = np.multiply(values, multiplier, dtype=float)
+    magnitude = np.abs(scaled)
+    whole = np.floor(magnitude)
+    return np.copysign(whole + (magnitude - whole >= 0.5), scaled) / multiplier
+
+
+def sample_matrix(samples):
+    """
+    Arranges per-application sample lists as a matrix.
+
+    Args:
+        samples (dict): Application -> list of sample values
+
+    Returns:
+        tuple: (applications, matrix) with the matrix of shape (samples, applications),
+               column j holding the samples of applications[j] followed by NaN
+    """
+    applications = list(samples)
+    matrix = np.full((max(map(len, samples.values()), default=0), len(applications)), np.nan)
+    for column, values in enumerate(samples.values()):
+        matrix[:len(values), column] = values
+    return applications, matrix
+
+
+def summary_statistics(samples, percentiles=SUMMARY_PERCENTILES, distribution_percentiles=DISTRIBUTION_PERCENTILES):
+    """
+    Computes the summary statistics of every application in one pass over the sample matrix.
+
+    The median, the tail percentiles of the Min, Max, Avg tables and the percentiles of
+    the distribution tables all come from a single nanpercentile call, so the tables of
+    the Summary share the same values.
+
+    Args:
+        samples (dict): Application -> list of sample values, at least one per application
+        percentiles (tuple): Tail percentiles (0-100) to compute besides the median
+        distribution_percentiles (tuple): Percentiles (0-100) of the distribution tables and charts
+
+    Returns:
+        dict: 'applications' (list), 'count', 'min', 'max', 'mean', 'median' and 'std'
+              (arrays per application), 'percentiles' (array of shape
+              (len(percentiles), applications)) and 'distribution' (array of shape
+              (len(distribution_percentiles), applications)). 'std' is the sample standard
+              deviation, NaN for applications with a single sample.
+    """
+    applications, matrix = sample_matrix(samples)
+    if not applications:
+        empty = np.empty(0)
+        return {'applications': [], 'count': empty.astype(int), 'min': empty, 'max': empty, 'mean': empty,
+                'median': empty, 'std': empty, 'percentiles': np.empty((len(percentiles), 0)),
+                'distribution': np.empty((len(distribution_percentiles), 0))}
+    count = np.count_nonzero(~np.isnan(matrix), axis=0)
+    mean = np.nansum(matrix, axis=0) / count
+    squares = np.nansum((matrix - mean) ** 2, axis=0)
+    # Every percentile is computed once, each requested one is a row of the result
+    computed = sorted({50, *percentiles, *distribution_percentiles})
+    quantiles = np.nanpercentile(matrix, computed, axis=0)
+    return {
+        'applications': applications,
+        'count': count,
+        'min': np.nanmin(matrix, axis=0),
+        'max': np.nanmax(matrix, axis=0),
+        'mean': mean,
+        'median': quantiles[computed.index(50)],
+        'std': np.sqrt(np.divide(squares, count - 1, out=np.full(len(applications), np.nan), where=count > 1)),
+        'percentiles': quantiles[[computed.index(p) for p in percentiles]],
+        'distribution': quantiles[[computed.index(p) for p in distribution_percentiles]]
+    }
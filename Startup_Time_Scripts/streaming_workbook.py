@@ -0,0 +1,74 @@
+"""
+Streaming xlsx report backend.
+
+A report of many iterations keeps every cell of every iteration sheet in memory until
+openpyxl's Workbook.save when it is built as a normal workbook. StreamingWorkbook
+instead writes an openpyxl write-only workbook: each sheet is rendered from its
+SheetModel (see report_model) straight into a write-only sheet, which is closed and
+released to its temporary file as soon as the sheet is finished. The report code never
+reads cells back, so no in-memory copy of a sheet exists at any point.
+
+The sheets keep the order in which they were created, independent of the order in
+which they are finished.
+"""
+import threading
+
+import openpyxl
+
+
+class StreamingWorkbook:
+    """
+    Write-only workbook with the subset of the openpyxl Workbook interface used by
+    the report code (create_sheet, remove and save).
+    """
+
+    def __init__(self):
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._lock = threading.Lock()
+
+    def create_sheet(self, title):
+        """
+        Creates a sheet at the end of the workbook.
+
+        Args:
+            title (str): Sheet title
+
+        Returns:
+            openpyxl.worksheet._write_only.WriteOnlyWorksheet: The sheet to render to
+        """
+        with self._lock:
+            return self._workbook.create_sheet(title=title)
+
+    def flush(self, sheet):
+        """
+        Closes a finished sheet and releases its temporary file handle.
+
+        The sheet must not be written to afterwards, flushing it again has no effect.
+
+        Args:
+            sheet (WriteOnlyWorksheet): Sheet returned by create_sheet
+        """
+        if not sheet.closed:
+            # Closing writes the sheet tail to its temporary file
+            sheet.close()
+
+    def remove(self, sheet):
+        """
+        Removes a sheet.
+
+        Args:
+            sheet (WriteOnlyWorksheet): Sheet returned by create_sheet
+        """
+        with self._lock:
+            self._workbook.remove(sheet)
+
+    def save(self, filename):
+        """
+        Writes the workbook, sheets that were not flushed are closed by the save.
+
+        A write-only workbook can only be saved once.
+
+        Args:
+            filename (Path): Report file
+        """
+        self._workbook.save(filename)
@@ -0,0 +1,131 @@
+"""
+Per-phase wall time instrumentation of the startup time tool itself.
+
+Phases are timed with time.perf_counter and recorded together with the iteration and
+the ECU they belong to. Phases can be nested; a nested phase that does not name an
+iteration or ECU inherits them from the enclosing phase of the same thread, so e.g.
+the extractors called inside process_log_file are attributed to its iteration and ECU
+without passing them around.
+
+The report finalization processes time their phases against the origin of the
+measurement process and hand their records back (own_records, add_records), so all
+phases of a run end up on one time axis.
+"""
+import json
+import time
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+
+
+class PhaseTimer:
+    """
+    Thread-safe collector of timed phases.
+    """
+
+    def __init__(self, origin=None, records=()):
+        """
+        Args:
+            origin (float): perf_counter value of time 0, now if None
+            records (list): Records of another PhaseTimer with the same origin to start with
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self._records = list(records)
+        self._inherited = len(self._records)
+        self._lock = threading.Lock()
+        self._context = threading.local()
+
+    @contextmanager
+    def phase(self, name, iteration=None, ecu_type=None):
+        """
+        Times the enclosed block as one phase.
+
+        Args:
+            name (str): Phase name (e.g., 'Log Capture', 'Workbook Save')
+            iteration (int): Iteration index (0-based), inherited from the enclosing phase if None
+            ecu_type (str): ECU type, inherited from the enclosing phase if None
+
+        Yields:
+            tuple: The (iteration, ecu_type) the phase is attributed to
+        """
+        stack = self._context.__dict__.setdefault('stack', [])
+        if stack:
+            iteration = stack[-1][0] if iteration is None else iteration
+            ecu_type = stack[-1][1] if ecu_type is None else ecu_type
+        stack.append((iteration, ecu_type))
+        start = time.perf_counter()
+        try:
+            yield iteration, ecu_type
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self._records.append({
+                    'phase': name,
+                    'iteration': iteration,
+                    'ecu_type': ecu_type,
+                    'start': start - self.origin,
+                    'duration': duration,
+                    'thread': threading.current_thread().name
+                })
+
+    def own_records(self):
+        """
+        Returns the records of the phases timed by this PhaseTimer, without the ones it started with.
+        """
+        with self._lock:
+            return self._records[self._inherited:]
+
+    def add_records(self, records):
+        """
+        Adds the records of another PhaseTimer with the same origin.
+        """
+        with self._lock:
+            self._records.extend(records)
+
+    def records(self, ecu_type=None):
+        """
+        Returns the recorded phases in start order.
+
+        Args:
+            ecu_type (str): If given, only the phases of this ECU and the phases shared by
+                            all ECUs (relay, cross-ECU steps) are returned
+
+        Returns:
+            list: Phase records (dicts with phase, iteration, ecu_type, start, duration, thread)
+        """
+        with self._lock:
+            records = list(self._records)
+        if ecu_type is not None:
+            records = [record for record in records if record['ecu_type'] in (ecu_type, None)]
+        return sorted(records, key=lambda record: record['start'])
+
+    def summary(self, ecu_type=None):
+        """
+        Aggregates the recorded phases by phase name.
+
+        Returns:
+            OrderedDict: Phase name -> {'count', 'total', 'average', 'maximum'} in seconds,
+                         ordered by descending total time
+        """
+        totals = {}
+        for record in self.records(ecu_type):
+            entry = totals.setdefault(record['phase'], {'count': 0, 'total': 0.0, 'maximum': 0.0})
+            entry['count'] += 1
+            entry['total'] += record['duration']
+            entry['maximum'] = max(entry['maximum'], record['duration'])
+        summary = OrderedDict()
+        for name, entry in sorted(totals.items(), key=lambda item: item[1]['total'], reverse=True):
+            entry['average'] = entry['total'] / entry['count']
+            summary[name] = entry
+        return summary
+
+    def write_json(self, file_path):
+        """
+        Writes all phase records and the per-phase summary as JSON.
+
+        Args:
+            file_path (Path): Output file
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump({'summary': self.summary(), 'phases': self.records()}, file, indent=2)
@@ -0,0 +1,102 @@
+"""
+Chrome trace-event export of the startup time tool's own execution timeline.
+
+Spans are recorded as complete ("X") events on one trace thread per tool thread name,
+so a run can be opened in chrome://tracing or https://ui.perfetto.dev to see the
+per-ECU threads, the waits for background chart rendering and the serialized stages side by side.
+Spans recorded in the report finalization processes are added as processes of their own.
+"""
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+class TraceRecorder:
+    """
+    Thread-safe recorder of trace spans.
+    """
+
+    def __init__(self, origin=None, process_name='Startup Time Measurement'):
+        self.origin = time.perf_counter() if origin is None else origin
+        self._pid = os.getpid()
+        self._process_name = process_name
+        self._events = []
+        self._thread_ids = {}
+        # Exports of other processes (see export) written with this trace
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def _now_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def _thread_id(self, thread_name):
+        # Per-ECU threads are short-lived and the OS reuses their ids, so trace threads
+        # are keyed by the (unique) thread name instead
+        return self._thread_ids.setdefault(thread_name, len(self._thread_ids) + 1)
+
+    @contextmanager
+    def span(self, name, category='tool', args=None):
+        """
+        Records the enclosed block as one span.
+
+        Args:
+            name (str): Span name shown in the trace viewer
+            category (str): Trace category, e.g. 'tool' or 'wait'
+            args (dict): Additional values shown with the span
+        """
+        thread_name = threading.current_thread().name
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            end = self._now_us()
+            with self._lock:
+                self._events.append({
+                    'name': name,
+                    'cat': category,
+                    'ph': 'X',
+                    'ts': round(start, 3),
+                    'dur': round(end - start, 3),
+                    'pid': self._pid,
+                    'tid': self._thread_id(thread_name),
+                    'args': args or {}
+                })
+
+    def export(self):
+        """
+        Returns the recorded spans of this process for add_process of the main recorder.
+        """
+        with self._lock:
+            return {'pid': self._pid, 'name': self._process_name, 'events': list(self._events),
+                    'threads': dict(self._thread_ids)}
+
+    def add_process(self, export):
+        """
+        Adds the spans of another process recorded against the same origin.
+        """
+        with self._lock:
+            self._processes.append(export)
+
+    def write(self, file_path):
+        """
+        Writes the recorded spans in the Chrome trace-event JSON format.
+
+        Args:
+            file_path (Path): Output file
+        """
+        processes = [self.export()]
+        with self._lock:
+            processes.extend(self._processes)
+        events, metadata = [], []
+        for process in processes:
+            events.extend(process['events'])
+            metadata.append({'name': 'process_name', 'ph': 'M', 'pid': process['pid'], 'tid': 0,
+                             'args': {'name': process['name']}})
+            metadata.extend({'name': 'thread_name', 'ph': 'M', 'pid': process['pid'], 'tid': tid,
+                             'args': {'name': thread_name}}
+                            for thread_name, tid in process['threads'].items())
+        events.sort(key=lambda event: event['ts'])
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, file)
@@ -0,0 +1,28 @@
+"""
+Tests of the size bound of the chart cache.
+"""
+import os
+
+from Startup_Time_Scripts.chart_cache import ChartCache
+
+
+def test_replaced_chart_counts_its_size_difference(tmp_path):
+    cache = ChartCache(tmp_path, max_bytes=1000)
+    cache.put('a', b'x' * 100)
+    cache.put('a', b'x' * 40)
+    assert cache._size == 40
+    assert cache.get('a') == b'x' * 40
+
+
+def test_least_recently_used_charts_are_evicted(tmp_path):
+    cache = ChartCache(tmp_path, max_bytes=250)
+    cache.put('a', b'x' * 100)
+    cache.put('b', b'x' * 100)
+    # 'a' is older than 'b' until the hit refreshes it
+    os.utime(tmp_path / 'a.png', (1000, 1000))
+    os.utime(tmp_path / 'b.png', (2000, 2000))
+    assert cache.get('a') is not None
+    cache.put('c', b'x' * 100)
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache._size == 200
@@ -0,0 +1,62 @@
+"""
+Tests of the statistics behind the early stopping, the regression detection and the Summary rounding.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from Startup_Time_Scripts.early_stopping import t_quantile
+from Startup_Time_Scripts.regression_detection import RegressionDetector, mann_whitney_u
+from Startup_Time_Scripts.startup_statistics import round_half_up
+
+
+@pytest.mark.parametrize('p, df, expected', [
+    # Student's t tables
+    (0.975, 1, 12.7062), (0.975, 4, 2.7764), (0.975, 29, 2.0452),
+    (0.95, 1, 6.3138), (0.95, 4, 2.1318), (0.95, 29, 1.6991),
+])
+def test_t_quantile_matches_tables(p, df, expected):
+    assert t_quantile(p, df) == pytest.approx(expected, abs=1e-4)
+
+
+def test_mann_whitney_exact_p_of_separated_samples():
+    # Only 2 of the C(10, 5) = 252 orderings are as extreme as fully separated samples
+    assert mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) == (25, pytest.approx(2 / 252))
+    assert mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == (0, pytest.approx(2 / 252))
+
+
+def test_mann_whitney_ties_use_normal_approximation():
+    u, p_value = mann_whitney_u([1, 2, 3, 4, 5], [3, 4, 5, 6, 7])
+    # Ranks of the current samples 3.5 + 5.5 + 7.5 + 9 + 10, three pairs of ties
+    assert u == 20.5
+    sigma = math.sqrt(5 * 5 / 12 * (11 - 3 * 6 / 90))
+    assert p_value == pytest.approx(2 * (1 - NormalDist().cdf((20.5 - 12.5 - 0.5) / sigma)))
+    assert p_value == pytest.approx(0.1138, abs=1e-4)
+
+
+def test_mann_whitney_identical_samples():
+    assert mann_whitney_u([2.0] * 5, [2.0] * 5) == (12.5, 1.0)
+
+
+def test_regression_detector_flags_tied_slowdown():
+    baseline = {'ECU': ({'app': [1.0, 1.0, 1.1, 1.1, 1.2] * 2}, {})}
+    current = {'ECU': ({'app': [1.2, 1.3, 1.3, 1.4, 1.4] * 2}, {})}
+    comparison, = RegressionDetector().compare(baseline, current)
+    assert comparison['p_value'] < 0.05
+    assert comparison['change'] == 'Slower' and comparison['regression']
+
+
+@pytest.mark.parametrize('value, decimals, expected', [
+    (2.5, 0, 3.0), (-2.5, 0, -3.0), (0.125, 2, 0.13), (1.005, 2, 1.0), (0.285, 2, 0.28),
+    # Boundaries where adding 0.5 before floor rounds the wrong way
+    (0.49999999999999994, 0, 0.0), (0.049999999999999996, 1, 0.0), (4503599627370497.0, 0, 4503599627370497.0),
+])
+def test_round_half_up(value, decimals, expected):
+    assert round_half_up(value, decimals) == expected
+
+
+def test_round_half_up_arrays_keep_nan():
+    rounded = round_half_up(np.array([[1.23456, np.nan], [-0.00005, 7.0]]), 4)
+    np.testing.assert_array_equal(rounded, [[1.2346, np.nan], [-0.0001, 7.0]])